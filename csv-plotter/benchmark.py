@@ -0,0 +1,186 @@
+"""
+CSV Plotter - Benchmark Entry Point
+Times loading, statistics, preview and chart rendering on synthetic CSV files
+Writes JSON results that can be compared across commits
+"""
+import argparse
+import datetime
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+
+from benchmarks.datasets import SCALES, PROFILES, ensure_dataset
+from benchmarks.measure import measure_in_subprocess
+from benchmarks.stages import STAGES
+
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+
+DEFAULT_SCALES = "10k,100k,1m"
+
+
+def main(argv=None):
+    """
+    Run the benchmarks and report them
+
+    Args:
+        argv: Command-line arguments (defaults to sys.argv[1:])
+
+    Returns:
+        int: Exit status (1 if a stage failed)
+    """
+    parser = argparse.ArgumentParser(
+        description="Benchmark CSV Plotter stages on synthetic data (no display needed)."
+    )
+    parser.add_argument(
+        "--scales", default=DEFAULT_SCALES,
+        help=f"comma-separated row counts from {', '.join(SCALES)} (default: {DEFAULT_SCALES})"
+    )
+    parser.add_argument(
+        "--profiles", default="mixed",
+        help=f"comma-separated column mixes from {', '.join(PROFILES)} (default: mixed)"
+    )
+    parser.add_argument(
+        "--stages", default=",".join(STAGES),
+        help="comma-separated stages (default: all)"
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per stage")
+    parser.add_argument("--seed", type=int, default=0, help="random seed of the datasets")
+    parser.add_argument(
+        "--data-dir", default=os.path.join(tempfile.gettempdir(), "csv-plotter-bench"),
+        help="where generated datasets are kept between runs"
+    )
+    parser.add_argument(
+        "--no-allocations", action="store_true",
+        help="skip the tracemalloc run (it can take several times the wall time)"
+    )
+    parser.add_argument("-o", "--output", help="write results to this JSON file")
+    parser.add_argument("--compare", help="JSON results of an earlier run to compare with")
+    args = parser.parse_args(argv)
+
+    try:
+        scales = _choices(args.scales, SCALES, "scale")
+        profiles = _choices(args.profiles, PROFILES, "profile")
+        stages = _choices(args.stages, STAGES, "stage")
+    except ValueError as e:
+        parser.error(str(e))
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as handle:
+            baseline = {_result_key(result): result for result in json.load(handle)["results"]}
+
+    results = []
+    failed = False
+    print(f"{'dataset':<20} {'stage':<24} {'best s':>9} {'median s':>9} "
+          f"{'peak RSS MB':>12} {'alloc MB':>9}  vs baseline")
+
+    for profile in profiles:
+        for scale in scales:
+            rows = SCALES[scale]
+            print(f"Preparing {profile} dataset with {rows:,} rows...", file=sys.stderr)
+            filepath = ensure_dataset(args.data_dir, profile, rows, args.seed)
+
+            for stage in stages:
+                result = {
+                    "profile": profile,
+                    "rows": rows,
+                    "stage": stage,
+                    "file_mb": os.path.getsize(filepath) / 2**20,
+                }
+                try:
+                    result.update(measure_in_subprocess(
+                        filepath, stage, args.repeat, not args.no_allocations
+                    ))
+                    result["error"] = None
+                except Exception as e:
+                    failed = True
+                    result["error"] = str(e)
+
+                results.append(result)
+                print(_format_row(result, baseline))
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            json.dump({"environment": environment(), "results": results}, handle, indent=2)
+        print(f"Results written to {args.output}")
+
+    return 1 if failed else 0
+
+
+def environment():
+    """
+    Describe what the results were measured on
+
+    Returns:
+        dict: Commit, library versions and machine
+    """
+    import matplotlib
+    import numpy
+    import pandas
+
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=APP_DIR, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    return {
+        "commit": commit,
+        "timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "pandas": pandas.__version__,
+        "numpy": numpy.__version__,
+        "matplotlib": matplotlib.__version__,
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def _choices(text, known, kind):
+    """Split a comma-separated option and check each value"""
+    values = [value.strip().lower() for value in text.split(",") if value.strip()]
+    unknown = [value for value in values if value not in known]
+    if unknown:
+        raise ValueError(f"unknown {kind}: {', '.join(unknown)}")
+    return values
+
+
+def _result_key(result):
+    """What identifies a measurement across runs"""
+    return (result["profile"], result["rows"], result["stage"])
+
+
+def _format_row(result, baseline):
+    """One line of the results table"""
+    dataset = f"{result['profile']} {result['rows']:,}"
+    if result["error"]:
+        return f"{dataset:<20} {result['stage']:<24} FAILED: {result['error']}"
+
+    line = (
+        f"{dataset:<20} {result['stage']:<24} "
+        f"{result['wall_best_s']:9.3f} {result['wall_median_s']:9.3f} "
+        f"{_number(result['peak_rss_mb'], 12)} {_number(result['alloc_peak_mb'], 9)}"
+    )
+
+    previous = (baseline or {}).get(_result_key(result))
+    if previous and not previous.get("error") and previous["wall_best_s"] > 0:
+        ratio = result["wall_best_s"] / previous["wall_best_s"]
+        line += f"  {ratio:.2f}x time"
+        if result["peak_rss_mb"] is not None and previous.get("peak_rss_mb") is not None:
+            line += f", {result['peak_rss_mb'] - previous['peak_rss_mb']:+.1f} MB RSS"
+    return line
+
+
+def _number(value, width):
+    """Right-aligned number, or '-' if not measured"""
+    return f"{'-':>{width}}" if value is None else f"{value:{width}.1f}"
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,4 @@
+"""
+Benchmarks
+Synthetic datasets and the application stages timed by benchmark.py
+"""
@@ -0,0 +1,127 @@
+"""
+Datasets
+Generates reproducible synthetic CSV files for benchmarking
+"""
+import os
+import numpy as np
+import pandas as pd
+
+
+# Row counts selectable by name on the command line
+SCALES = {
+    "10k": 10_000,
+    "100k": 100_000,
+    "1m": 1_000_000,
+    "10m": 10_000_000,
+    "50m": 50_000_000,
+}
+
+# Column mix per profile. Every dataset also starts with an increasing
+# integer 't' column to use as the X axis of line charts.
+#   float/int: numeric columns (1% of float cells are missing)
+#   category: text columns with CATEGORY_VALUES distinct values
+#   text: text columns with about one distinct value per two rows
+PROFILES = {
+    "numeric": {"float": 8, "int": 2, "category": 0, "text": 0},
+    "mixed": {"float": 4, "int": 2, "category": 2, "text": 1},
+    "text": {"float": 1, "int": 1, "category": 3, "text": 3},
+    "wide": {"float": 40, "int": 10, "category": 8, "text": 2},
+}
+
+CATEGORY_VALUES = 20
+
+# Bump when the generated content changes so stale files are not reused
+DATASET_VERSION = 1
+
+CHUNK_ROWS = 1_000_000
+
+
+def dataset_path(data_dir, profile, rows, seed=0):
+    """
+    Path a dataset is generated at
+
+    Args:
+        data_dir: Directory holding generated datasets
+        profile: Key of PROFILES
+        rows: Number of data rows
+        seed: Random seed
+
+    Returns:
+        str: CSV file path
+    """
+    name = f"{profile}_{rows}_s{seed}_v{DATASET_VERSION}.csv"
+    return os.path.join(data_dir, name)
+
+
+def ensure_dataset(data_dir, profile, rows, seed=0):
+    """
+    Generate a dataset unless it already exists
+
+    Args:
+        data_dir: Directory holding generated datasets
+        profile: Key of PROFILES
+        rows: Number of data rows
+        seed: Random seed
+
+    Returns:
+        str: CSV file path
+    """
+    path = dataset_path(data_dir, profile, rows, seed)
+    if not os.path.exists(path):
+        os.makedirs(data_dir, exist_ok=True)
+        generate_csv(path, rows, profile, seed)
+    return path
+
+
+def generate_csv(path, rows, profile, seed=0, chunk_rows=CHUNK_ROWS):
+    """
+    Write a synthetic CSV file
+
+    Rows are generated and written a chunk at a time, so memory use does
+    not depend on the number of rows. Each chunk has its own random
+    stream derived from the seed, so the same arguments always produce
+    the same file. The file is written under a temporary name and renamed
+    when complete.
+
+    Args:
+        path: Output path
+        rows: Number of data rows
+        profile: Key of PROFILES
+        seed: Random seed
+        chunk_rows: Rows generated at once
+    """
+    if profile not in PROFILES:
+        raise ValueError(f"Unknown dataset profile: {profile}")
+
+    partial = path + ".partial"
+    with open(partial, "w", newline="", encoding="utf-8") as handle:
+        for number, start in enumerate(range(0, rows, chunk_rows)):
+            count = min(chunk_rows, rows - start)
+            rng = np.random.default_rng([seed, number])
+            chunk = _generate_chunk(rng, start, count, rows, PROFILES[profile])
+            chunk.to_csv(handle, header=number == 0, index=False, float_format="%.6g")
+    os.replace(partial, path)
+
+
+def _generate_chunk(rng, start, count, total_rows, mix):
+    """Rows start .. start + count of a dataset"""
+    data = {"t": np.arange(start, start + count, dtype=np.int64)}
+
+    for i in range(mix["float"]):
+        values = rng.normal(loc=i * 10.0, scale=1.0 + i, size=count)
+        values[rng.random(count) < 0.01] = np.nan
+        data[f"f{i}"] = values
+
+    for i in range(mix["int"]):
+        data[f"i{i}"] = rng.integers(0, 10 ** (i % 6 + 2), size=count)
+
+    labels = np.array([f"cat_{k:02d}" for k in range(CATEGORY_VALUES)], dtype=object)
+    for i in range(mix["category"]):
+        data[f"c{i}"] = labels[rng.integers(0, CATEGORY_VALUES, size=count)]
+
+    distinct = max(total_rows // 2, 1)
+    for i in range(mix["text"]):
+        ids = rng.integers(0, distinct, size=count)
+        data[f"s{i}"] = np.char.add(f"id{i}_", ids.astype(str))
+
+    return pd.DataFrame(data)
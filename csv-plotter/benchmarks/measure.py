@@ -0,0 +1,143 @@
+"""
+Measure
+Runs one benchmark stage in a fresh process and records its cost
+"""
+import gc
+import multiprocessing
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+import matplotlib
+
+# Headless: the Agg backend needs no display and never imports tkinter
+matplotlib.use("Agg")
+
+
+def measure_in_subprocess(filepath, stage_name, repeat=3, allocations=True):
+    """
+    Measure a stage in a new interpreter
+
+    Each measurement gets its own process so that memory left over from
+    earlier stages (and allocator caches) does not skew the next one.
+
+    Args:
+        filepath: Dataset CSV path
+        stage_name: Key of benchmarks.stages.STAGES
+        repeat: Timed runs
+        allocations: Also run once under tracemalloc
+
+    Returns:
+        dict: See measure_stage
+    """
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+        return pool.submit(measure_stage, filepath, stage_name, repeat, allocations).result()
+
+
+def measure_stage(filepath, stage_name, repeat=3, allocations=True):
+    """
+    Time a stage and record its memory use
+
+    Loading the DataFrame a stage works on is setup and is not measured.
+    Peak RSS is reset after setup where the OS allows it (Linux), so it
+    covers the timed runs only; elsewhere it is the process peak.
+    Allocations come from a separate run under tracemalloc, because
+    tracing slows the code down too much to time it at the same time.
+
+    Args:
+        filepath: Dataset CSV path
+        stage_name: Key of benchmarks.stages.STAGES
+        repeat: Timed runs
+        allocations: Also run once under tracemalloc
+
+    Returns:
+        dict: {'wall_s' (list), 'wall_best_s', 'wall_median_s',
+            'rss_before_mb', 'peak_rss_mb', 'peak_rss_scope',
+            'alloc_peak_mb', 'alloc_retained_mb'}
+    """
+    from benchmarks.stages import STAGES
+    from src.core.csv_handler import load_csv
+
+    stage = STAGES[stage_name]
+    df = load_csv(filepath) if stage.needs_frame else None
+
+    gc.collect()
+    peak_scope = "stage" if _reset_peak_rss() else "process"
+    rss_before = _current_rss_mb()
+
+    wall = []
+    for _ in range(max(repeat, 1)):
+        start = time.perf_counter()
+        result = stage.run(filepath, df)
+        wall.append(time.perf_counter() - start)
+        del result
+        gc.collect()
+
+    peak_rss = _peak_rss_mb()
+
+    alloc_peak = alloc_retained = None
+    if allocations:
+        tracemalloc.start()
+        try:
+            result = stage.run(filepath, df)
+            retained, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        del result
+        alloc_peak = peak / 2**20
+        alloc_retained = retained / 2**20
+
+    return {
+        "wall_s": wall,
+        "wall_best_s": min(wall),
+        "wall_median_s": statistics.median(wall),
+        "rss_before_mb": rss_before,
+        "peak_rss_mb": peak_rss,
+        "peak_rss_scope": peak_scope,
+        "alloc_peak_mb": alloc_peak,
+        "alloc_retained_mb": alloc_retained,
+    }
+
+
+def _reset_peak_rss():
+    """Reset the process's peak RSS (Linux only); True if it was reset"""
+    try:
+        with open("/proc/self/clear_refs", "w") as handle:
+            handle.write("5")
+        return True
+    except OSError:
+        return False
+
+
+def _current_rss_mb():
+    """Resident memory now, or None if unknown"""
+    return _proc_status_mb("VmRSS")
+
+
+def _peak_rss_mb():
+    """Peak resident memory, or None if unknown"""
+    peak = _proc_status_mb("VmHWM")
+    if peak is not None:
+        return peak
+
+    try:
+        import resource
+    except ImportError:
+        return None  # Windows
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS
+    return maxrss / 2**20 if sys.platform == "darwin" else maxrss / 2**10
+
+
+def _proc_status_mb(field):
+    """A memory field of /proc/self/status in MB, or None"""
+    if not os.path.exists("/proc/self/status"):
+        return None
+    with open("/proc/self/status") as handle:
+        for line in handle:
+            if line.startswith(field + ":"):
+                return int(line.split()[1]) / 2**10
+    return None
@@ -0,0 +1,134 @@
+"""
+Stages
+The application code paths timed by the benchmark, run without a display
+"""
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from src.core.csv_handler import load_csv, load_csv_chunked
+from src.core.charts import build_line_figure, build_bar_figure
+
+
+class Stage:
+    """
+    One timed code path
+
+    Attributes:
+        name: Name used on the command line and in results
+        run: Callable(filepath, df) doing the timed work
+        needs_frame: True if run uses the loaded DataFrame (loading it is
+            setup and is not timed)
+    """
+
+    def __init__(self, name, run, needs_frame=True):
+        self.name = name
+        self.run = run
+        self.needs_frame = needs_frame
+
+
+def run_load(filepath, df):
+    """Parse the file the way a plain load does"""
+    return load_csv(filepath)
+
+
+def run_load_chunked(filepath, df):
+    """Parse the file in chunks, as for large files with a progress bar"""
+    return load_csv_chunked(filepath)
+
+
+def run_statistics(filepath, df):
+    """Produce the Statistics tab text (PreviewPanel.show_statistics)"""
+    from src.gui.preview_panel import statistics_text
+    return "".join(statistics_text(df))
+
+
+def run_statistics_approximate(filepath, df):
+    """Statistics tab text using sketches for medians and distinct counts"""
+    from src.gui.preview_panel import statistics_text
+    return "".join(statistics_text(df, approximate=True))
+
+
+def run_preview(filepath, df):
+    """
+    Format the preview grid (PreviewPanel.show_preview) and interact with it
+
+    Formats the first page, a page in the middle, then sorts by a numeric
+    column and formats the first sorted page.
+    """
+    grid = _headless_grid(df)
+    pages = [grid.page_rows()]
+
+    grid.row_offset = grid._clamp_row_offset(len(df) // 2)
+    pages.append(grid.page_rows())
+
+    grid.row_offset = 0
+    grid.sort_column = _numeric_column(df)
+    grid.order = grid.sort_order(grid.sort_column)
+    pages.append(grid.page_rows())
+    return pages
+
+
+def run_line_chart(filepath, df):
+    """Build a line chart (create_line_chart without the window) and draw it"""
+    figure = build_line_figure(df, "t", _numeric_column(df))
+    return _draw(figure)
+
+
+def run_bar_chart(filepath, df):
+    """Build a summed bar chart (create_bar_chart without the window) and draw it"""
+    figure = build_bar_figure(df, _category_column(df), _numeric_column(df), "sum")
+    return _draw(figure)
+
+
+STAGES = {
+    stage.name: stage for stage in (
+        Stage("load", run_load, needs_frame=False),
+        Stage("load_chunked", run_load_chunked, needs_frame=False),
+        Stage("statistics", run_statistics),
+        Stage("statistics_approximate", run_statistics_approximate),
+        Stage("preview", run_preview),
+        Stage("line_chart", run_line_chart),
+        Stage("bar_chart", run_bar_chart),
+    )
+}
+
+
+def _draw(figure):
+    """Render a figure to pixels, as canvas.draw() in the chart window does"""
+    canvas = FigureCanvasAgg(figure)
+    try:
+        canvas.draw()
+        return canvas.get_width_height()
+    finally:
+        figure.clear()
+
+
+def _headless_grid(df):
+    """A DataGrid showing df without creating any widgets"""
+    from src.gui.data_grid import DataGrid
+
+    class HeadlessGrid(DataGrid):
+        def __init__(self):
+            self.visible_rows = 20
+            self.visible_columns = 10
+            self.df = df
+            self.row_offset = 0
+            self.col_offset = 0
+            self.sort_column = None
+            self.sort_ascending = True
+            self.order = None
+            self._sort_cache = {}
+
+    return HeadlessGrid()
+
+
+def _numeric_column(df):
+    """First float column (the Y axis of benchmark charts)"""
+    return next(col for col in df.columns if df[col].dtype.kind == "f")
+
+
+def _category_column(df):
+    """First low-cardinality text column, else the first integer column"""
+    for prefix in ("c", "i"):
+        for col in df.columns:
+            if str(col).startswith(prefix):
+                return col
+    return "t"
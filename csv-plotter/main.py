@@ -4,12 +4,16 @@ Simple Python application to plot CSV data
 """
 import tkinter as tk
 from src.gui.main_window import MainWindow
+from src.utils.import_warmup import warm_up_imports
 
 def main():
     """Start the CSV Plotter application"""
     root = tk.Tk()
     app = MainWindow(root)
+    # The window opens with only tkinter loaded; pandas and matplotlib
+    # are imported in the background once it is shown
+    root.after_idle(warm_up_imports)
     root.mainloop()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
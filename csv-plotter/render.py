@@ -0,0 +1,59 @@
+"""
+CSV Plotter - Batch Render Entry Point
+Renders the charts listed in a manifest without opening any windows
+"""
+import argparse
+import sys
+import matplotlib
+
+# Headless: the Agg backend needs no display and never imports tkinter
+matplotlib.use("Agg")
+
+from src.core.batch_render import read_manifest, render_batch, MANIFEST_FIELDS
+
+
+def main(argv=None):
+    """
+    Render every chart in a manifest
+    
+    Args:
+        argv: Command-line arguments (defaults to sys.argv[1:])
+    
+    Returns:
+        int: Exit status (1 if any chart failed)
+    """
+    parser = argparse.ArgumentParser(
+        description="Render CSV charts listed in a manifest (no display needed)."
+    )
+    parser.add_argument(
+        "manifest",
+        help=f"JSON list or CSV file with {', '.join(MANIFEST_FIELDS)} "
+             "and optional aggregation per chart"
+    )
+    parser.add_argument(
+        "-j", "--workers", type=int, default=None,
+        help="worker processes (default: all cores; 1 renders in this process)"
+    )
+    parser.add_argument("--dpi", type=int, default=None, help="output resolution")
+    args = parser.parse_args(argv)
+    
+    try:
+        jobs = read_manifest(args.manifest)
+    except (OSError, ValueError) as e:
+        print(f"Invalid manifest: {e}", file=sys.stderr)
+        return 2
+    
+    failures = 0
+    for result in render_batch(jobs, workers=args.workers, dpi=args.dpi):
+        if result['success']:
+            print(f"ok      {result['output']}")
+        else:
+            failures += 1
+            print(f"failed  {result['output']}: {result['error']}", file=sys.stderr)
+    
+    print(f"Rendered {len(jobs) - failures} of {len(jobs)} charts")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,299 @@
+"""
+Batch Render
+Renders many charts from a manifest without a display
+"""
+import csv
+import json
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import pandas as pd
+from src.core.config import ERROR_MESSAGES
+from src.core.csv_handler import load_csv, read_sample
+from src.core.dtype_optimizer import pyarrow_available
+from src.core.charts import build_line_figure, build_bar_figure, export_figure, AGGREGATIONS
+from src.utils.validators import validate_file_path, validate_numeric_data
+
+
+# Columns every manifest entry needs; 'aggregation' is optional (bar charts)
+MANIFEST_FIELDS = ("file", "x", "y", "chart_type", "output")
+
+CHART_TYPES = ("line", "bar")
+
+
+def read_manifest(path):
+    """
+    Read the charts to render from a JSON or CSV manifest
+
+    A JSON manifest is a list of objects; a CSV manifest has one chart per
+    row. Both use the keys in MANIFEST_FIELDS plus an optional
+    'aggregation'. Relative file and output paths are resolved against
+    the manifest's directory.
+
+    Args:
+        path: Path to a .json or .csv manifest
+
+    Returns:
+        list: One job dict per chart, in manifest order
+
+    Raises:
+        ValueError: If the manifest is not a list of entries, or an entry is
+            missing a field or has an unknown value
+    """
+    with open(path, newline="", encoding="utf-8") as handle:
+        if path.lower().endswith(".json"):
+            entries = json.load(handle)
+        else:
+            entries = list(csv.DictReader(handle))
+
+    if not isinstance(entries, list):
+        raise ValueError("A JSON manifest must be a list of chart entries")
+
+    base_dir = os.path.dirname(os.path.abspath(path))
+    jobs = []
+    for number, entry in enumerate(entries, start=1):
+        if not isinstance(entry, dict):
+            raise ValueError(f"Manifest entry {number} is not an object")
+
+        missing = [field for field in MANIFEST_FIELDS if not entry.get(field)]
+        if missing:
+            raise ValueError(f"Manifest entry {number} is missing: {', '.join(missing)}")
+
+        chart_type = str(entry["chart_type"]).strip().lower()
+        if chart_type not in CHART_TYPES:
+            raise ValueError(f"Manifest entry {number} has unknown chart type: {chart_type}")
+
+        aggregation = str(entry.get("aggregation") or "").strip().lower() or None
+        if aggregation is not None and aggregation not in AGGREGATIONS:
+            raise ValueError(f"Manifest entry {number} has unknown aggregation: {aggregation}")
+
+        jobs.append({
+            "index": number - 1,
+            "file": os.path.join(base_dir, str(entry["file"])),
+            "x": entry["x"],
+            "y": entry["y"],
+            "chart_type": chart_type,
+            "aggregation": aggregation,
+            "output": os.path.join(base_dir, str(entry["output"])),
+        })
+
+    return jobs
+
+
+def render_batch(jobs, workers=None, dpi=None):
+    """
+    Render charts, parsing each CSV file once for all of its charts
+
+    With several workers, each file is parsed by one worker (only the
+    columns its charts use) and saved to a temporary Feather file (pickle
+    without pyarrow). Its charts are then split into batches across all
+    workers, each batch reading back only its own columns, so many charts
+    of one file still use every core.
+
+    Args:
+        jobs: Job dicts from read_manifest
+        workers: Worker processes (None = all cores, 1 = in this process)
+        dpi: Output resolution (defaults to CHART_SETTINGS['export_dpi'])
+
+    Yields:
+        dict: {'index', 'output', 'success', 'error'} per chart, as batches
+            finish (a worker that crashes fails only the charts it held)
+    """
+    groups = {}
+    for job in jobs:
+        groups.setdefault(job["file"], []).append(job)
+
+    workers = min(workers or os.cpu_count() or 1, len(jobs))
+    if workers <= 1:
+        for filepath, file_jobs in groups.items():
+            yield from render_file(filepath, file_jobs, dpi)
+        return
+
+    with tempfile.TemporaryDirectory(prefix="csv-plotter-render-") as frame_dir, \
+            ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = {
+            pool.submit(prepare_file, filepath, file_jobs, frame_dir, number): file_jobs
+            for number, (filepath, file_jobs) in enumerate(groups.items())
+        }
+        while pending:
+            future = next(as_completed(pending))
+            future_jobs = pending.pop(future)
+            try:
+                outcome = future.result()
+            except Exception as e:
+                # e.g. BrokenProcessPool or MemoryError in the worker
+                error = f"Worker failed: {type(e).__name__}: {str(e)}"
+                yield from (_result(job, error) for job in future_jobs)
+                continue
+
+            if isinstance(outcome, list):
+                yield from outcome  # Rendered charts
+                continue
+
+            failed, frame_path, renderable = outcome
+            yield from failed
+            batches = min(workers, len(renderable))
+            for i in range(batches):
+                batch = renderable[i::batches]
+                pending[pool.submit(render_saved, frame_path, batch, dpi)] = batch
+
+
+def render_file(filepath, jobs, dpi=None):
+    """
+    Parse one CSV file and render every chart that uses it
+
+    Charts naming a column the file does not have fail on their own; the
+    others still render.
+
+    Args:
+        filepath: Path to CSV file
+        jobs: Job dicts for this file
+        dpi: Output resolution (defaults to CHART_SETTINGS['export_dpi'])
+
+    Returns:
+        list: Result dict per job
+    """
+    failed, df, renderable = _load_for_jobs(filepath, jobs)
+    return failed + [render_chart(df, job, dpi) for job in renderable]
+
+
+def prepare_file(filepath, jobs, frame_dir, number):
+    """
+    Parse the columns a file's charts use and save them for render_saved
+
+    Module-level so it can run in worker processes.
+
+    Args:
+        filepath: Path to CSV file
+        jobs: Job dicts for this file
+        frame_dir: Directory for the saved frame
+        number: Distinguishes this file's frame from others in frame_dir
+
+    Returns:
+        tuple: (results of charts that failed, saved frame path, jobs to
+            render), or a list of results if nothing is left to render
+    """
+    failed, df, renderable = _load_for_jobs(filepath, jobs)
+    if not renderable:
+        return failed
+
+    if pyarrow_available():
+        frame_path = os.path.join(frame_dir, f"{number}.feather")
+        df.to_feather(frame_path)
+    else:
+        frame_path = os.path.join(frame_dir, f"{number}.pkl")
+        df.to_pickle(frame_path)
+    return failed, frame_path, renderable
+
+
+def render_saved(frame_path, jobs, dpi=None):
+    """
+    Render charts from a frame saved by prepare_file
+
+    Module-level so it can run in worker processes.
+
+    Args:
+        frame_path: Saved frame
+        jobs: Job dicts to render
+        dpi: Output resolution (defaults to CHART_SETTINGS['export_dpi'])
+
+    Returns:
+        list: Result dict per job
+    """
+    columns = list(dict.fromkeys(col for job in jobs for col in (job["x"], job["y"])))
+    try:
+        if frame_path.endswith(".feather"):
+            from pyarrow import feather
+            df = feather.read_table(frame_path, columns=columns, memory_map=True).to_pandas()
+        else:
+            df = pd.read_pickle(frame_path)
+    except Exception as e:
+        return [_result(job, f"Failed to load CSV: {str(e)}") for job in jobs]
+
+    return [render_chart(df, job, dpi) for job in jobs]
+
+
+def _load_for_jobs(filepath, jobs):
+    """
+    Parse the columns of a file that its charts use
+
+    Returns:
+        tuple: (results of charts that cannot render, DataFrame or None,
+            jobs to render)
+    """
+    is_valid, error_message = validate_file_path(filepath)
+    if not is_valid:
+        return [_result(job, error_message) for job in jobs], None, []
+
+    try:
+        header = set(read_sample(filepath, 0).columns)
+    except Exception as e:
+        return [_result(job, f"Failed to load CSV: {str(e)}") for job in jobs], None, []
+
+    failed = []
+    renderable = []
+    for job in jobs:
+        unknown = [col for col in (job["x"], job["y"]) if col not in header]
+        if unknown:
+            error = ERROR_MESSAGES["column_not_found"].format(columns=", ".join(map(str, unknown)))
+            failed.append(_result(job, error))
+        else:
+            renderable.append(job)
+
+    if not renderable:
+        return failed, None, []
+
+    columns = list(dict.fromkeys(col for job in renderable for col in (job["x"], job["y"])))
+    try:
+        df = load_csv(filepath, usecols=columns)
+    except Exception as e:
+        error = f"Failed to load CSV: {str(e)}"
+        return failed + [_result(job, error) for job in renderable], None, []
+
+    return failed, df, renderable
+
+
+def render_chart(df, job, dpi=None):
+    """
+    Draw one chart and write it to its output path
+
+    Args:
+        df: pandas DataFrame holding the job's columns
+        job: Job dict from read_manifest
+        dpi: Output resolution (defaults to CHART_SETTINGS['export_dpi'])
+
+    Returns:
+        dict: {'index', 'output', 'success', 'error'}
+    """
+    is_valid, error_message = validate_numeric_data(df, job["y"])
+    if not is_valid:
+        return _result(job, error_message)
+
+    figure = None
+    try:
+        if job["chart_type"] == "line":
+            figure = build_line_figure(df, job["x"], job["y"])
+        else:
+            figure = build_bar_figure(df, job["x"], job["y"], job["aggregation"])
+
+        output_dir = os.path.dirname(job["output"])
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
+        export_figure(figure, job["output"], dpi)
+    except Exception as e:
+        return _result(job, f"Failed to render chart: {str(e)}")
+    finally:
+        if figure is not None:
+            figure.clear()
+
+    return _result(job)
+
+
+def _result(job, error=None):
+    """Outcome of one job"""
+    return {
+        "index": job["index"],
+        "output": job["output"],
+        "success": error is None,
+        "error": error,
+    }
@@ -1,5 +1,8 @@
-# Exports chart functions
-from src.core.charts.line_chart import create_line_chart
-from src.core.charts.bar_chart import create_bar_chart
+# Exports the figure-building API (no Tk); the Tk layer lives in
+# chart_window and chart_session and is imported from there
+from src.core.charts.line_chart import build_line_figure
+from src.core.charts.bar_chart import build_bar_figure
+from src.core.charts.chart_saver import export_figure
+from src.core.charts.aggregation import AGGREGATIONS
 
-__all__ = ['create_line_chart', 'create_bar_chart']
\ No newline at end of file
+__all__ = ['build_line_figure', 'build_bar_figure', 'export_figure', 'AGGREGATIONS']
@@ -0,0 +1,84 @@
+"""
+Aggregation
+Groups bar chart data so high-cardinality X columns stay drawable
+"""
+import pandas as pd
+from src.core.config import CHART_SETTINGS, AGGREGATION_LABELS
+
+
+# Labels live in the config so the UI can list them without pandas
+AGGREGATIONS = AGGREGATION_LABELS
+
+OTHER_LABEL = "Other"
+
+
+def aggregate_bars(df, x_column, y_column, aggregation="sum", max_bars=None, bins=None):
+    """
+    Aggregate Y per X value with a single vectorized groupby
+
+    Continuous numeric X columns (more distinct values than max_bars) are
+    binned into equal-width intervals first. If there are still more
+    groups than max_bars, the top groups by value are kept and the rest
+    are combined into an "Other" bar.
+
+    Args:
+        df: pandas DataFrame
+        x_column: Column name for X-axis
+        y_column: Column name for Y-axis
+        aggregation: 'sum', 'mean', 'count', 'min' or 'max'
+        max_bars: Maximum number of bars (defaults to CHART_SETTINGS)
+        bins: Number of bins for continuous X (defaults to CHART_SETTINGS)
+
+    Returns:
+        Series: Aggregated values indexed by bar label (str)
+    """
+    if aggregation not in AGGREGATIONS or aggregation == "none":
+        raise ValueError(f"Unknown aggregation: {aggregation}")
+
+    max_bars = max_bars or CHART_SETTINGS['bar_max_bars']
+    bins = bins or CHART_SETTINGS['bar_bins']
+
+    keys = df[x_column]
+    is_numeric = (
+        pd.api.types.is_numeric_dtype(keys.dtype)
+        and not pd.api.types.is_bool_dtype(keys.dtype)
+    )
+    if is_numeric and keys.nunique() > max_bars:
+        keys = pd.cut(keys, bins=min(bins, max_bars))
+
+    # One pass computes every partial needed to derive the result and
+    # to merge groups into "Other" correctly (e.g. mean = sum / count).
+    # Numeric X (and bins) are shown in order, text X in order of appearance.
+    grouped = df[y_column].groupby(keys, sort=is_numeric, observed=True)
+    parts = grouped.agg(['sum', 'count', 'min', 'max'])
+
+    if len(parts) > max_bars:
+        ranking = _finalize(parts, aggregation)
+        keep = ranking.nlargest(max_bars - 1).index
+        is_kept = parts.index.isin(keep)
+
+        rest = parts[~is_kept]
+        other = pd.DataFrame(
+            {
+                'sum': [rest['sum'].sum()],
+                'count': [rest['count'].sum()],
+                'min': [rest['min'].min()],
+                'max': [rest['max'].max()],
+            },
+            index=[OTHER_LABEL]
+        )
+        parts = parts[is_kept]
+        parts.index = parts.index.astype(str)
+        parts = pd.concat([parts, other])
+
+    result = _finalize(parts, aggregation)
+    result.index = result.index.astype(str)
+    result.name = y_column
+    return result
+
+
+def _finalize(parts, aggregation):
+    """Turn grouped partial aggregates into the requested aggregate"""
+    if aggregation == "mean":
+        return parts['sum'] / parts['count']
+    return parts[aggregation]
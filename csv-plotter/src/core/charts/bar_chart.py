@@ -2,39 +2,50 @@
 Bar Chart
 Creates bar charts
 """
-import matplotlib.pyplot as plt
 from src.core.config import CHART_SETTINGS, COLORS
-from src.core.charts.chart_base import (
-    create_chart_window, 
-    embed_chart_in_window, 
-    apply_common_styling
-)
+from src.core.charts.chart_base import create_figure, apply_common_styling
+from src.core.charts.aggregation import aggregate_bars, AGGREGATIONS
 
 
-def create_bar_chart(df, x_column, y_column):
+def build_bar_figure(df, x_column, y_column, aggregation=None):
     """
-    Create a bar chart in a new window
+    Build a bar chart figure (no window, no pyplot)
     
     Args:
         df: pandas DataFrame
         x_column: Column name for X-axis
         y_column: Column name for Y-axis
+        aggregation: 'none' for one bar per row, or 'sum', 'mean',
+            'count', 'min', 'max' per X value (defaults to CHART_SETTINGS)
     
     Returns:
-        chart_window: Toplevel window containing the chart
+        Figure: The chart
     """
-    # Create window
-    window = create_chart_window(f"Bar Chart: {y_column} vs {x_column}")
+    figure, ax = create_figure()
+    plot_bar_chart(ax, df, x_column, y_column, aggregation)
+    return figure
+
+
+def plot_bar_chart(ax, df, x_column, y_column, aggregation=None):
+    """
+    Draw a bar chart onto an existing axis
     
-    # Create figure
-    fig, ax = plt.subplots(
-        figsize=(CHART_SETTINGS['figure_width'], CHART_SETTINGS['figure_height'])
-    )
+    Args:
+        ax: Matplotlib axis
+        df: pandas DataFrame
+        x_column: Column name for X-axis
+        y_column: Column name for Y-axis
+        aggregation: Aggregation key (defaults to CHART_SETTINGS)
+    
+    Returns:
+        tuple: (BarContainer, list of bar labels)
+    """
+    x_data, y_data, title = prepare_bar_data(df, x_column, y_column, aggregation)
     
     # Plot bar chart
-    ax.bar(
-        df[x_column],
-        df[y_column],
+    bars = ax.bar(
+        x_data,
+        y_data,
         color=COLORS['bar_chart'],
         alpha=CHART_SETTINGS['bar_alpha'],
         edgecolor=COLORS['bar_edge'],
@@ -45,9 +56,59 @@ def create_bar_chart(df, x_column, y_column):
     ax.grid(True, alpha=CHART_SETTINGS['grid_alpha'], linestyle='--', axis='y')
     
     # Apply common styling
-    apply_common_styling(ax, x_column, y_column, f'{y_column} vs {x_column}')
+    apply_common_styling(ax, x_column, y_column, title)
+    
+    return bars, list(x_data)
+
+
+def update_bar_chart(ax, bars, labels, df, x_column, y_column, aggregation=None):
+    """
+    Update bar heights in place if the bars are unchanged
+    
+    Args:
+        ax: Matplotlib axis holding the bars
+        bars: BarContainer from plot_bar_chart
+        labels: Bar labels returned by plot_bar_chart
+        df: pandas DataFrame
+        x_column: Column name for X-axis
+        y_column: Column name for Y-axis
+        aggregation: Aggregation key (defaults to CHART_SETTINGS)
+    
+    Returns:
+        bool: False if the new data has different bars (caller must redraw)
+    """
+    x_data, y_data, title = prepare_bar_data(df, x_column, y_column, aggregation)
+    if list(x_data) != labels:
+        return False
+    
+    for rect, height in zip(bars, y_data):
+        rect.set_height(height)
+    
+    ax.relim()
+    ax.autoscale_view()
+    apply_common_styling(ax, x_column, y_column, title, layout=False)
+    return True
+
+
+def prepare_bar_data(df, x_column, y_column, aggregation=None):
+    """
+    Compute bar positions and heights
+    
+    Args:
+        df: pandas DataFrame
+        x_column: Column name for X-axis
+        y_column: Column name for Y-axis
+        aggregation: Aggregation key (defaults to CHART_SETTINGS)
+    
+    Returns:
+        tuple: (x_data, y_data, title)
+    """
+    aggregation = aggregation or CHART_SETTINGS['bar_aggregation']
     
-    # Embed in window
-    embed_chart_in_window(fig, window)
+    # Aggregate per X value so the number of bars stays bounded
+    if aggregation == "none":
+        return df[x_column], df[y_column], f'{y_column} vs {x_column}'
     
-    return window
\ No newline at end of file
+    y_data = aggregate_bars(df, x_column, y_column, aggregation)
+    title = f'{AGGREGATIONS[aggregation]} of {y_column} by {x_column}'
+    return y_data.index, y_data, title
@@ -0,0 +1,73 @@
+"""
+Blitting
+Fast redraw path that repaints only the chart's data artists
+"""
+
+
+class BlitManager:
+    """
+    Caches the static part of a figure (axes, ticks, labels, grid) after
+    each full draw and, on update, restores it and draws only the data
+    artists on top. A full draw is still needed whenever limits, ticks or
+    labels change; the background is re-captured automatically then.
+    """
+
+    def __init__(self, canvas, artists=()):
+        """
+        Initialize blit manager
+
+        Args:
+            canvas: Figure canvas (must support blitting)
+            artists: Artists to repaint on update
+        """
+        self.canvas = canvas
+        self._background = None
+        self._artists = []
+        self.set_artists(artists)
+        self._callback_id = canvas.mpl_connect('draw_event', self._on_draw)
+
+    def set_artists(self, artists):
+        """
+        Replace the artists that are repainted on update
+
+        Animated artists are left out of full draws (and so out of the
+        cached background) and drawn by this manager instead.
+
+        Args:
+            artists: Iterable of artists
+        """
+        for artist in self._artists:
+            artist.set_animated(False)
+        self._artists = list(artists)
+        for artist in self._artists:
+            artist.set_animated(True)
+        self._background = None
+
+    def update(self):
+        """Repaint the data artists over the cached background"""
+        if self._background is None:
+            # No background yet: a full draw captures it via _on_draw
+            self.canvas.draw()
+            return
+
+        figure = self.canvas.figure
+        self.canvas.restore_region(self._background)
+        self._draw_artists()
+        self.canvas.blit(figure.bbox)
+        self.canvas.flush_events()
+
+    def disconnect(self):
+        """Stop tracking draws and return artists to normal drawing"""
+        self.canvas.mpl_disconnect(self._callback_id)
+        self.set_artists([])
+
+    def _on_draw(self, event):
+        """Capture the background after a full draw"""
+        self._background = self.canvas.copy_from_bbox(self.canvas.figure.bbox)
+        self._draw_artists()
+
+    def _draw_artists(self):
+        """Draw the animated artists onto the canvas"""
+        figure = self.canvas.figure
+        for artist in self._artists:
+            figure.draw_artist(artist)
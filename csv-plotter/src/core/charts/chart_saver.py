@@ -2,46 +2,32 @@
 Chart Saver
 Handles saving/exporting charts to files
 """
-from tkinter import filedialog, messagebox
+from src.core.config import CHART_SETTINGS
 
 
-def save_chart(figure, default_name="chart"):
+def export_figure(figure, filepath, dpi=None):
     """
-    Save matplotlib figure to file
+    Write a figure to an image or PDF file (format from the extension)
     
     Args:
         figure: Matplotlib figure object
-        default_name: Default filename
-    
-    Returns:
-        bool: True if saved successfully
+        filepath: Destination path
+        dpi: Resolution (defaults to CHART_SETTINGS['export_dpi'])
     """
-    filepath = filedialog.asksaveasfilename(
-        defaultextension=".png",
-        initialfile=default_name,
-        filetypes=[
-            ("PNG Image", "*.png"),
-            ("PDF Document", "*.pdf"),
-            ("JPEG Image", "*.jpg"),
-            ("SVG Vector", "*.svg")
-        ],
-        title="Save Chart As"
-    )
-    
-    if not filepath:
-        return False
+    # Blitted artists are marked animated, which savefig would skip
+    animated = [artist for artist in figure.findobj() if artist.get_animated()]
+    for artist in animated:
+        artist.set_animated(False)
     
     try:
         # Save with high quality
         figure.savefig(
             filepath,
-            dpi=300,
+            dpi=dpi or CHART_SETTINGS['export_dpi'],
             bbox_inches='tight',
             facecolor='white',
             edgecolor='none'
         )
-        messagebox.showinfo("Success", f"Chart saved to:\n{filepath}")
-        return True
-    except Exception as e:
-        messagebox.showerror("Error", f"Failed to save chart:\n{str(e)}")
-        return False
\ No newline at end of file
+    finally:
+        for artist in animated:
+            artist.set_animated(True)
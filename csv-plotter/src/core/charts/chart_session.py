@@ -0,0 +1,266 @@
+"""
+Chart Session
+Owns a single chart window, figure and canvas reused across Generate clicks
+"""
+from src.core.charts.chart_base import create_figure
+from src.core.charts.chart_window import create_chart_window, embed_chart_in_window
+from src.core.charts.line_chart import (
+    plot_line_chart,
+    update_line_chart,
+    extend_line_chart,
+    needs_decimation,
+    attach_zoom_decimation,
+    extend_zoom_decimation
+)
+from src.core.charts.bar_chart import plot_bar_chart, update_bar_chart
+from src.core.charts.blitting import BlitManager
+from src.utils.instrumentation import TRACER
+
+
+CHART_TITLES = {"line": "Line Chart", "bar": "Bar Chart"}
+
+
+class ChartSession:
+    """
+    Keeps one chart window open and redraws it in place
+
+    When only the Y column changes, the existing line or bars are updated
+    (set_data / bar heights); otherwise the same figure is cleared and
+    redrawn. Updates that keep the axis limits and ticks are blitted
+    instead of fully redrawn; the title and Y label are blitted with the
+    data, as they name the Y column. The figure is released when the
+    window is closed.
+    """
+
+    def __init__(self):
+        """Initialize an empty session (no window yet)"""
+        self.window = None
+        self.figure = None
+        self.ax = None
+        self.canvas = None
+        self.blitter = None
+        self.chart_name = "chart"
+        self._reset_artists()
+
+    def is_open(self):
+        """
+        Check whether the chart window still exists
+
+        Returns:
+            bool: True if the window is open
+        """
+        return self.window is not None and bool(self.window.winfo_exists())
+
+    def show(self, df, x_column, y_column, chart_type="line", aggregation=None):
+        """
+        Show a chart, reusing the open window and figure when possible
+
+        Args:
+            df: pandas DataFrame
+            x_column: Column name for X-axis
+            y_column: Column name for Y-axis
+            chart_type: 'line' or 'bar'
+            aggregation: Bar aggregation key (bar charts only)
+
+        Returns:
+            tk.Toplevel: The chart window
+        """
+        if chart_type not in CHART_TITLES:
+            raise ValueError(f"Unknown chart type: {chart_type}")
+
+        if not self.is_open():
+            self._open_window()
+
+        if chart_type != "bar":
+            aggregation = None
+
+        # Same chart type, X column and aggregation: only the Y data changes
+        layout = (chart_type, x_column, aggregation)
+        view = self._view_state()
+        with TRACER.span("build_figure", chart=chart_type, rows=len(df)):
+            updated = layout == self.layout and self._update(df, x_column, y_column)
+            if not updated:
+                self._redraw(df, x_column, y_column, chart_type, aggregation)
+                self.layout = layout
+        if updated:
+            self.refresh(full=self._view_state() != view)
+        else:
+            self.canvas.draw_idle()
+
+        self.columns = (x_column, y_column)
+        self.chart_name = f"{chart_type}_chart_{y_column}_vs_{x_column}"
+        self.window.title(f"{CHART_TITLES[chart_type]}: {y_column} vs {x_column}")
+        self.window.lift()
+
+        return self.window
+
+    def extend(self, df, appended=None):
+        """
+        Update an open line chart from a DataFrame that grew by appended rows
+        The line is updated in place; a zoomed or panned view is kept.
+
+        A downsampled line only decimates the appended rows when the chart
+        was last drawn from exactly the rows before them; otherwise the
+        line is decimated again from the full series.
+
+        Args:
+            df: pandas DataFrame holding the charted columns
+            appended: Number of rows appended at the end since the last
+                update, or None if the rows may have changed otherwise
+
+        Returns:
+            bool: True if a line chart was updated
+        """
+        if not self.is_open() or self.layout is None or self.layout[0] != "line":
+            return False
+
+        x_column, y_column = self.columns
+        if x_column not in df.columns or y_column not in df.columns:
+            return False
+
+        view = self._view_state()
+        start = len(df) - appended if appended is not None else None
+        if start == self.rows and needs_decimation(self.rows):
+            self._extend(df, x_column, y_column, start)
+        else:
+            self._update(df, x_column, y_column)
+        self.refresh(full=self._view_state() != view)
+        return True
+
+    def refresh(self, full=False):
+        """
+        Repaint the chart after its data artists changed
+
+        Args:
+            full: True if limits or ticks changed too
+        """
+        if full or self.blitter is None:
+            # Only a full draw can show a new layout, so only it computes one
+            self.figure.tight_layout()
+            self.canvas.draw_idle()
+        else:
+            self.blitter.update()
+
+    def close(self):
+        """Destroy the window and release the figure"""
+        self._detach_zoom()
+        if self.blitter is not None:
+            self.blitter.disconnect()
+        if self.figure is not None:
+            self.figure.clear()
+        if self.is_open():
+            self.window.destroy()
+
+        self.window = None
+        self.figure = None
+        self.ax = None
+        self.canvas = None
+        self.blitter = None
+        self._reset_artists()
+
+    def _open_window(self):
+        """Create the window, figure and canvas"""
+        self.window = create_chart_window("Chart")
+        self.window.protocol("WM_DELETE_WINDOW", self.close)
+
+        self.figure, self.ax = create_figure()
+        self.canvas = embed_chart_in_window(
+            self.figure, self.window, lambda: self.chart_name
+        )
+        if self.canvas.supports_blit:
+            self.blitter = BlitManager(self.canvas)
+        self._reset_artists()
+
+    def _update(self, df, x_column, y_column):
+        """Update the current artists in place; False if not possible"""
+        chart_type = self.layout[0] if self.layout else None
+
+        if chart_type == "line" and self.artist is not None:
+            self._detach_zoom()
+            decimated = update_line_chart(self.ax, self.artist, df, x_column, y_column)
+            self.rows = len(df)
+            if decimated:
+                self.zoom = attach_zoom_decimation(
+                    self.ax, self.artist, df[x_column], df[y_column], self.refresh
+                )
+                # The view may still be zoomed in from the previous column
+                if self.zoom is not None:
+                    self.zoom.redecimate(redraw=False)
+            return True
+
+        if chart_type == "bar" and self.artist is not None:
+            return update_bar_chart(
+                self.ax, self.artist, self.bar_labels,
+                df, x_column, y_column, self.layout[2]
+            )
+
+        return False
+
+    def _extend(self, df, x_column, y_column, start):
+        """Add the rows from start on to the downsampled line"""
+        xlim = self.ax.get_xlim()
+        extend_line_chart(self.ax, self.artist, df, x_column, y_column, start)
+        self.rows = len(df)
+
+        if self.zoom is not None:
+            if not extend_zoom_decimation(
+                self.zoom, df[x_column].iloc[start:], df[y_column].iloc[start:]
+            ):
+                self._detach_zoom()
+            elif self.ax.get_xlim() != xlim:
+                # The limits grew to fit the new rows, which were drawn already
+                self.zoom.cancel()
+
+    def _redraw(self, df, x_column, y_column, chart_type, aggregation):
+        """Clear the figure's axis and draw the chart from scratch"""
+        self._detach_zoom()
+        self.ax.clear()
+
+        if chart_type == "line":
+            self.artist, decimated = plot_line_chart(self.ax, df, x_column, y_column)
+            self.rows = len(df)
+            if decimated:
+                self.zoom = attach_zoom_decimation(
+                    self.ax, self.artist, df[x_column], df[y_column], self.refresh
+                )
+            artists = [self.artist]
+        else:
+            self.artist, self.bar_labels = plot_bar_chart(
+                self.ax, df, x_column, y_column, aggregation
+            )
+            artists = list(self.artist)
+
+        if self.blitter is not None:
+            # Title and Y label change with the Y column; drawn with the data
+            # they stay out of the cached background
+            self.blitter.set_artists(artists + [self.ax.title, self.ax.yaxis.label])
+
+    def _view_state(self):
+        """
+        Limits, ticks and title height; if unchanged, an update can be blitted
+        (a title gaining or losing its downsampling line needs a new layout)
+        """
+        if self.ax is None:
+            return None
+        return (
+            self.ax.get_xlim(),
+            self.ax.get_ylim(),
+            tuple(self.ax.get_xticks()),
+            tuple(self.ax.get_yticks()),
+            self.ax.get_title().count("\n"),
+        )
+
+    def _detach_zoom(self):
+        """Disconnect zoom re-decimation from the current line"""
+        if self.zoom is not None:
+            self.zoom.detach()
+            self.zoom = None
+
+    def _reset_artists(self):
+        """Forget the artists drawn in the current figure"""
+        self.layout = None
+        self.columns = None
+        self.artist = None
+        self.bar_labels = None
+        self.rows = None
+        self.zoom = None
@@ -0,0 +1,187 @@
+"""
+Chart Window
+Tk layer that shows figures built by the chart modules in windows
+Everything else in src.core.charts builds figures without Tk
+"""
+import tkinter as tk
+from tkinter import filedialog, messagebox
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+from src.core.config import CHART_SETTINGS
+from src.core.charts.chart_saver import export_figure
+from src.core.charts.line_chart import (
+    build_line_figure,
+    needs_decimation,
+    attach_zoom_decimation
+)
+from src.core.charts.bar_chart import build_bar_figure
+from src.utils.instrumentation import TRACER
+
+
+class TracedCanvas(FigureCanvasTkAgg):
+    """Tk canvas whose full redraws are timed as 'canvas.draw' spans"""
+
+    def draw(self):
+        with TRACER.span("canvas.draw"):
+            super().draw()
+
+
+def create_line_chart(df, x_column, y_column):
+    """
+    Create a line chart in a new window
+    Series longer than CHART_SETTINGS['decimation_threshold'] are
+    downsampled to about one point per horizontal pixel
+
+    Args:
+        df: pandas DataFrame
+        x_column: Column name for X-axis
+        y_column: Column name for Y-axis
+
+    Returns:
+        chart_window: Toplevel window containing the chart
+    """
+    figure = build_line_figure(df, x_column, y_column)
+
+    window = create_chart_window(f"Line Chart: {y_column} vs {x_column}")
+    embed_chart_in_window(figure, window, f"line_chart_{y_column}_vs_{x_column}")
+
+    # Zooming re-decimates the visible range from the full series
+    if needs_decimation(len(df)):
+        ax = figure.axes[0]
+        attach_zoom_decimation(ax, ax.lines[0], df[x_column], df[y_column])
+
+    return window
+
+
+def create_bar_chart(df, x_column, y_column, aggregation=None):
+    """
+    Create a bar chart in a new window
+
+    Args:
+        df: pandas DataFrame
+        x_column: Column name for X-axis
+        y_column: Column name for Y-axis
+        aggregation: 'none' for one bar per row, or 'sum', 'mean',
+            'count', 'min', 'max' per X value (defaults to CHART_SETTINGS)
+
+    Returns:
+        chart_window: Toplevel window containing the chart
+    """
+    figure = build_bar_figure(df, x_column, y_column, aggregation)
+
+    window = create_chart_window(f"Bar Chart: {y_column} vs {x_column}")
+    embed_chart_in_window(figure, window, f"bar_chart_{y_column}_vs_{x_column}")
+
+    return window
+
+
+def create_chart_window(title, width=None, height=None):
+    """
+    Create a new window for displaying a chart
+
+    Args:
+        title: Window title
+        width: Window width (optional)
+        height: Window height (optional)
+
+    Returns:
+        tk.Toplevel: New window
+    """
+    window = tk.Toplevel()
+    window.title(title)
+
+    w = width or CHART_SETTINGS['window_width']
+    h = height or CHART_SETTINGS['window_height']
+    window.geometry(f"{w}x{h}")
+
+    return window
+
+
+def embed_chart_in_window(figure, window, chart_name="chart"):
+    """
+    Embed a matplotlib figure in a tkinter window with toolbar and save button
+
+    Args:
+        figure: Matplotlib figure
+        window: Tkinter window
+        chart_name: Name for saving the chart, or a callable returning it
+
+    Returns:
+        canvas: Figure canvas
+    """
+    # Create frame for chart
+    chart_frame = tk.Frame(window)
+    chart_frame.pack(fill='both', expand=True)
+
+    # Embed canvas
+    canvas = TracedCanvas(figure, master=chart_frame)
+    canvas.draw()
+    canvas.get_tk_widget().pack(fill='both', expand=True, padx=10, pady=10)
+
+    # Add navigation toolbar
+    toolbar = NavigationToolbar2Tk(canvas, chart_frame)
+    toolbar.update()
+
+    # Add custom save button frame at bottom
+    button_frame = tk.Frame(window)
+    button_frame.pack(side=tk.BOTTOM, fill=tk.X, padx=10, pady=10)
+
+    def save_chart_handler():
+        name = chart_name() if callable(chart_name) else chart_name
+        save_chart(figure, default_name=name)
+
+    save_btn = tk.Button(
+        button_frame,
+        text="💾 Save Chart",
+        command=save_chart_handler,
+        font=("Arial", 10, "bold"),
+        bg="#4CAF50",
+        fg="white",
+        width=15,
+        height=1
+    )
+    save_btn.pack(side=tk.RIGHT, padx=5)
+
+    info_label = tk.Label(
+        button_frame,
+        text="Use toolbar to zoom, pan, or click 'Save Chart' to export",
+        font=("Arial", 9),
+        fg="gray"
+    )
+    info_label.pack(side=tk.LEFT, padx=5)
+
+    return canvas
+
+
+def save_chart(figure, default_name="chart"):
+    """
+    Ask for a path and save matplotlib figure to file
+
+    Args:
+        figure: Matplotlib figure object
+        default_name: Default filename
+
+    Returns:
+        bool: True if saved successfully
+    """
+    filepath = filedialog.asksaveasfilename(
+        defaultextension=".png",
+        initialfile=default_name,
+        filetypes=[
+            ("PNG Image", "*.png"),
+            ("PDF Document", "*.pdf"),
+            ("JPEG Image", "*.jpg"),
+            ("SVG Vector", "*.svg")
+        ],
+        title="Save Chart As"
+    )
+
+    if not filepath:
+        return False
+
+    try:
+        export_figure(figure, filepath)
+        messagebox.showinfo("Success", f"Chart saved to:\n{filepath}")
+        return True
+    except Exception as e:
+        messagebox.showerror("Error", f"Failed to save chart:\n{str(e)}")
+        return False
@@ -0,0 +1,303 @@
+"""
+Decimation
+Level-of-detail downsampling for line charts with many points
+"""
+import numpy as np
+import pandas as pd
+
+
+METHOD_LABELS = {"lttb": "LTTB", "minmax": "min/max"}
+
+
+def lttb_indices(x, y, n_out):
+    """
+    Largest-Triangle-Three-Buckets point selection
+
+    Keeps the first and last points and, from each bucket in between,
+    the point forming the largest triangle with the previously kept
+    point and the average of the next bucket. Preserves visual shape
+    (including peaks) far better than taking every n-th point.
+
+    Args:
+        x: 1-D float array (must be ascending for meaningful areas)
+        y: 1-D float array without NaN
+        n_out: Number of points to keep
+
+    Returns:
+        ndarray: Sorted positions of the kept points
+    """
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    # n_out - 2 buckets between the fixed first and last points;
+    # each bucket holds at least one point because n_out < n
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+
+    indices = np.empty(n_out, dtype=np.int64)
+    indices[0] = 0
+    indices[-1] = n - 1
+
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+
+        if i == n_out - 3:
+            avg_x, avg_y = x[n - 1], y[n - 1]
+        else:
+            next_end = edges[i + 2]
+            avg_x = x[end:next_end].mean()
+            avg_y = y[end:next_end].mean()
+
+        area = np.abs(
+            (x[a] - avg_x) * (y[start:end] - y[a])
+            - (x[a] - x[start:end]) * (avg_y - y[a])
+        )
+        a = start + int(np.argmax(area))
+        indices[i + 1] = a
+
+    return indices
+
+
+def minmax_indices(y, n_buckets):
+    """
+    Min/max-per-bucket point selection
+
+    Splits the series into n_buckets equal runs (about one per pixel
+    column) and keeps the minimum and maximum of each, so every spike
+    stays visible.
+
+    Args:
+        y: 1-D float array without NaN
+        n_buckets: Number of buckets (output has up to 2 * n_buckets + 2 points)
+
+    Returns:
+        ndarray: Sorted positions of the kept points
+    """
+    n = len(y)
+    if n <= 2 * n_buckets or n_buckets < 1:
+        return np.arange(n)
+
+    bucket_size = -(-n // n_buckets)
+    padded = np.empty(n_buckets * bucket_size, dtype=y.dtype)
+    padded[:n] = y
+    # Pad with the last value so padding can only tie with a real point
+    padded[n:] = y[-1]
+
+    blocks = padded.reshape(n_buckets, bucket_size)
+    offsets = np.arange(n_buckets) * bucket_size
+    picks = np.concatenate([
+        [0, n - 1],
+        offsets + blocks.argmin(axis=1),
+        offsets + blocks.argmax(axis=1),
+    ])
+    return np.unique(np.minimum(picks, n - 1))
+
+
+def select_indices(x, y, n_out, method="lttb"):
+    """
+    Choose which positions of a series to draw
+
+    Args:
+        x: 1-D float array of X positions
+        y: 1-D float array of Y values without NaN
+        n_out: Plot width in pixels; LTTB keeps this many points,
+            min/max keeps up to two per pixel column
+        method: 'lttb' or 'minmax'
+
+    Returns:
+        ndarray: Sorted positions of the kept points
+    """
+    if method == "minmax":
+        return minmax_indices(y, n_out)
+    if method == "lttb":
+        return lttb_indices(x, y, n_out)
+    raise ValueError(f"Unknown decimation method: {method}")
+
+
+def sorted_numeric_values(x_series):
+    """
+    X values as a float array if the column is numeric and ascending
+
+    Args:
+        x_series: pandas Series for the X axis
+
+    Returns:
+        ndarray: 1-D float array, or None for text, categorical or unsorted X
+    """
+    if not pd.api.types.is_numeric_dtype(x_series.dtype):
+        return None
+
+    values = x_series.to_numpy(dtype=np.float64, na_value=np.nan)
+    if np.isnan(values).any() or not np.all(np.diff(values) >= 0):
+        return None
+    return values
+
+
+def numeric_positions(x_series):
+    """
+    X values usable for triangle areas
+
+    Sorted numeric columns are used as-is; any other X column
+    (text, categories, unsorted) falls back to row position.
+
+    Args:
+        x_series: pandas Series for the X axis
+
+    Returns:
+        ndarray: 1-D float array
+    """
+    values = sorted_numeric_values(x_series)
+    if values is None:
+        return np.arange(len(x_series), dtype=np.float64)
+    return values
+
+
+def drop_missing(x_series, y_series):
+    """
+    Drop rows whose Y value is missing
+
+    Args:
+        x_series: pandas Series for the X axis
+        y_series: pandas Series for the Y axis (numeric)
+
+    Returns:
+        tuple: (x_series, y_series, y_values as a float array)
+    """
+    y = y_series.to_numpy(dtype=np.float64, na_value=np.nan)
+    valid = ~np.isnan(y)
+    if not valid.all():
+        x_series = x_series[valid]
+        y_series = y_series[valid]
+        y = y[valid]
+    return x_series, y_series, y
+
+
+def decimate(x_series, y_series, n_out, method="lttb"):
+    """
+    Reduce an X/Y series to about n_out points for drawing
+
+    Rows with a missing Y value are dropped first.
+
+    Args:
+        x_series: pandas Series for the X axis
+        y_series: pandas Series for the Y axis (numeric)
+        n_out: Target number of points
+        method: 'lttb' or 'minmax'
+
+    Returns:
+        tuple: (x_series, y_series) containing only the kept rows
+    """
+    x_series, y_series, y = drop_missing(x_series, y_series)
+    indices = select_indices(numeric_positions(x_series), y, n_out, method)
+    return x_series.iloc[indices], y_series.iloc[indices]
+
+
+class ZoomDecimator:
+    """
+    Re-decimates a line from the full series whenever the visible X range
+    changes, so zooming in reveals full-resolution data instead of
+    magnifying the downsampled points. Requires a sorted numeric X axis.
+    """
+
+    def __init__(self, x_values, y_values, n_out, method="lttb", debounce_ms=150):
+        """
+        Initialize zoom decimator
+
+        Args:
+            x_values: Ascending 1-D float array of X values (no NaN)
+            y_values: 1-D float array of Y values (no NaN)
+            n_out: Points to draw for the visible range
+            method: 'lttb' or 'minmax'
+            debounce_ms: Wait this long after the last zoom/pan step
+        """
+        self.x = x_values
+        self.y = y_values
+        self.n_out = n_out
+        self.method = method
+        self.debounce_ms = debounce_ms
+        self.ax = None
+        self.line = None
+        self._timer = None
+        self._callback_id = None
+        self._redraw = None
+
+    def attach(self, ax, line, redraw=None):
+        """
+        Start following the X limits of an axis
+
+        Call after the figure is embedded in its final canvas, because the
+        debounce timer is created from the figure's canvas.
+
+        Args:
+            ax: Matplotlib axis
+            line: Line2D artist whose data is replaced on zoom
+            redraw: Optional callable to repaint the line (e.g. a blit);
+                defaults to a full canvas redraw
+        """
+        self.ax = ax
+        self.line = line
+        self._redraw = redraw or ax.figure.canvas.draw_idle
+        self._timer = ax.figure.canvas.new_timer(interval=self.debounce_ms)
+        self._timer.single_shot = True
+        self._timer.add_callback(self.redecimate)
+
+        # A lambda keeps this object alive; callback registries only
+        # hold weak references to bound methods
+        self._callback_id = ax.callbacks.connect(
+            'xlim_changed', lambda _ax: self._schedule()
+        )
+
+    def detach(self):
+        """Stop following the axis (e.g. before its line is replaced)"""
+        if self._callback_id is not None:
+            self.ax.callbacks.disconnect(self._callback_id)
+            self._callback_id = None
+        if self._timer is not None:
+            self._timer.stop()
+
+    def extend(self, x_values, y_values):
+        """
+        Add points appended to the series
+
+        Args:
+            x_values: Ascending 1-D float array, starting at or after the
+                last X value
+            y_values: 1-D float array of Y values (no NaN)
+        """
+        self.x = np.concatenate([self.x, x_values])
+        self.y = np.concatenate([self.y, y_values])
+
+    def cancel(self):
+        """Drop a pending re-decimation (e.g. the limits moved to fit new data)"""
+        if self._timer is not None:
+            self._timer.stop()
+
+    def _schedule(self):
+        """Restart the debounce timer"""
+        self._timer.stop()
+        self._timer.start()
+
+    def redecimate(self, redraw=True):
+        """
+        Replace the line data with a decimation of the visible range
+
+        Args:
+            redraw: Repaint the line afterwards
+        """
+        low, high = self.ax.get_xlim()
+
+        # Binary search on the sorted X values; one extra point on each
+        # side keeps the line running to the edges of the plot
+        start = max(int(np.searchsorted(self.x, low, side='left')) - 1, 0)
+        end = min(int(np.searchsorted(self.x, high, side='right')) + 1, len(self.x))
+
+        x_visible = self.x[start:end]
+        y_visible = self.y[start:end]
+        indices = select_indices(x_visible, y_visible, self.n_out, self.method)
+
+        self.line.set_data(x_visible[indices], y_visible[indices])
+
+        # Limits are unchanged here, so only the line needs repainting
+        if redraw:
+            self._redraw()
@@ -2,18 +2,23 @@
 Line Chart
 Creates line charts
 """
-import matplotlib.pyplot as plt
+import pandas as pd
 from src.core.config import CHART_SETTINGS, COLORS
-from src.core.charts.chart_base import (
-    create_chart_window, 
-    embed_chart_in_window, 
-    apply_common_styling
+from src.core.charts.chart_base import create_figure, apply_common_styling
+from src.core.charts.decimation import (
+    decimate,
+    drop_missing,
+    sorted_numeric_values,
+    ZoomDecimator,
+    METHOD_LABELS
 )
 
 
-def create_line_chart(df, x_column, y_column):
+def build_line_figure(df, x_column, y_column):
     """
-    Create a line chart in a new window
+    Build a line chart figure (no window, no pyplot)
+    Series longer than CHART_SETTINGS['decimation_threshold'] are
+    downsampled to about one point per horizontal pixel
     
     Args:
         df: pandas DataFrame
@@ -21,23 +26,38 @@ def create_line_chart(df, x_column, y_column):
         y_column: Column name for Y-axis
     
     Returns:
-        chart_window: Toplevel window containing the chart
+        Figure: The chart
     """
-    # Create window
-    window = create_chart_window(f"Line Chart: {y_column} vs {x_column}")
+    figure, ax = create_figure()
+    plot_line_chart(ax, df, x_column, y_column)
+    return figure
+
+
+def plot_line_chart(ax, df, x_column, y_column):
+    """
+    Draw a line chart onto an existing axis
     
-    # Create figure
-    fig, ax = plt.subplots(
-        figsize=(CHART_SETTINGS['figure_width'], CHART_SETTINGS['figure_height'])
-    )
+    Args:
+        ax: Matplotlib axis
+        df: pandas DataFrame
+        x_column: Column name for X-axis
+        y_column: Column name for Y-axis
+    
+    Returns:
+        tuple: (Line2D artist, True if the series was downsampled)
+    """
+    x_data, y_data, title, decimated = prepare_line_data(ax, df, x_column, y_column)
+    
+    # Markers are unreadable (and slow) on dense lines
+    show_markers = len(y_data) <= CHART_SETTINGS['marker_max_points']
     
     # Plot line chart
-    ax.plot(
-        df[x_column],
-        df[y_column],
+    line, = ax.plot(
+        x_data,
+        y_data,
         color=COLORS['line_chart'],
         linewidth=CHART_SETTINGS['line_width'],
-        marker='o',
+        marker='o' if show_markers else '',
         markersize=CHART_SETTINGS['marker_size']
     )
     
@@ -45,10 +65,202 @@ def create_line_chart(df, x_column, y_column):
     ax.grid(True, alpha=CHART_SETTINGS['grid_alpha'], linestyle='--')
     
     # Apply common styling
-    apply_common_styling(ax, x_column, y_column, f'{y_column} vs {x_column}')
+    apply_common_styling(ax, x_column, y_column, title)
+    
+    return line, decimated
+
+
+def update_line_chart(ax, line, df, x_column, y_column):
+    """
+    Replace the data of an existing line in place
+    
+    Args:
+        ax: Matplotlib axis holding the line
+        line: Line2D artist from plot_line_chart
+        df: pandas DataFrame
+        x_column: Column name for X-axis (same as when the line was drawn)
+        y_column: Column name for Y-axis
+    
+    Returns:
+        bool: True if the series was downsampled
+    """
+    x_data, y_data, title, decimated = prepare_line_data(ax, df, x_column, y_column)
+    
+    line.set_data(x_data, y_data)
+    line.set_marker('o' if len(y_data) <= CHART_SETTINGS['marker_max_points'] else '')
+    
+    ax.relim()
+    ax.autoscale_view()
+    apply_common_styling(ax, x_column, y_column, title, layout=False)
+    
+    return decimated
+
+
+def extend_line_chart(ax, line, df, x_column, y_column, start):
+    """
+    Add rows appended to a DataFrame to a downsampled line in place
+    
+    Only the appended rows are decimated, to their share of the plot
+    width, and added after the points already drawn. Once the line holds
+    more than twice the plot width, the drawn points are decimated again.
+    
+    Args:
+        ax: Matplotlib axis holding the line
+        line: Line2D artist drawn from the rows before start
+        df: pandas DataFrame
+        x_column: Column name for X-axis
+        y_column: Column name for Y-axis
+        start: Position of the first appended row
+    """
+    width = plot_width_px(ax)
+    method = CHART_SETTINGS['decimation_method']
+    
+    total_points = len(df)
+    x_tail = df[x_column].iloc[start:]
+    y_tail = df[y_column].iloc[start:]
+    share = max(round(width * len(x_tail) / total_points), 3)
+    x_tail, y_tail = decimate(x_tail, y_tail, share, method)
+    
+    x_data = pd.concat([pd.Series(line.get_xdata()), x_tail], ignore_index=True)
+    y_data = pd.concat([pd.Series(line.get_ydata()), y_tail], ignore_index=True)
+    if len(x_data) > 2 * width:
+        x_data, y_data = decimate(x_data, y_data, width, method)
+    
+    line.set_data(x_data, y_data)
+    
+    ax.relim()
+    ax.autoscale_view()
+    title = line_title(x_column, y_column, total_points, len(y_data), method)
+    apply_common_styling(ax, x_column, y_column, title, layout=False)
+
+
+def line_title(x_column, y_column, total_points, drawn_points=None, method=None):
+    """
+    Title of a line chart, noting any downsampling
+    
+    Args:
+        x_column: Column name for X-axis
+        y_column: Column name for Y-axis
+        total_points: Number of rows in the series
+        drawn_points: Number of points drawn, if downsampled
+        method: Decimation method, if downsampled
+    
+    Returns:
+        str: The title
+    """
+    title = f'{y_column} vs {x_column}'
+    if drawn_points is not None:
+        title += (
+            f"\n(downsampled {total_points:,} → {drawn_points:,} points, "
+            f"{METHOD_LABELS[method]})"
+        )
+    return title
+
+
+def prepare_line_data(ax, df, x_column, y_column):
+    """
+    Select the points to draw, downsampling long series to the plot width
+    
+    Args:
+        ax: Matplotlib axis (used for its width in pixels)
+        df: pandas DataFrame
+        x_column: Column name for X-axis
+        y_column: Column name for Y-axis
+    
+    Returns:
+        tuple: (x_data, y_data, title, decimated)
+    """
+    x_data = df[x_column]
+    y_data = df[y_column]
+    title = line_title(x_column, y_column, len(df))
+    
+    total_points = len(df)
+    decimated = needs_decimation(total_points)
+    if decimated:
+        method = CHART_SETTINGS['decimation_method']
+        x_data, y_data = decimate(x_data, y_data, plot_width_px(ax), method)
+        title = line_title(x_column, y_column, total_points, len(y_data), method)
+    
+    return x_data, y_data, title, decimated
+
+
+def needs_decimation(total_points):
+    """
+    Check whether a series is long enough to be downsampled
+    
+    Args:
+        total_points: Number of rows in the series
+    
+    Returns:
+        bool: True above CHART_SETTINGS['decimation_threshold']
+    """
+    return total_points > CHART_SETTINGS['decimation_threshold']
+
+
+def plot_width_px(ax):
+    """
+    Width of the figure in pixels, used as the decimation target
+    
+    Args:
+        ax: Matplotlib axis
+    
+    Returns:
+        int: Width in pixels
+    """
+    fig = ax.figure
+    return int(fig.get_figwidth() * fig.dpi)
+
+
+def attach_zoom_decimation(ax, line, x_series, y_series, redraw=None):
+    """
+    Re-decimate a downsampled line whenever the visible X range changes
+    Only possible for a sorted numeric X column; otherwise zoom simply
+    magnifies the downsampled points
+    
+    Args:
+        ax: Matplotlib axis
+        line: Line2D artist to update
+        x_series: Full X column
+        y_series: Full Y column
+        redraw: Optional callable repainting the line after re-decimation
     
-    # Embed in window with save functionality
-    chart_name = f"line_chart_{y_column}_vs_{x_column}"
-    embed_chart_in_window(fig, window, chart_name)
+    Returns:
+        ZoomDecimator: The attached decimator, or None if unsupported
+    """
+    x_series, y_series, y_values = drop_missing(x_series, y_series)
+    x_values = sorted_numeric_values(x_series)
+    if x_values is None:
+        return None
+    
+    decimator = ZoomDecimator(
+        x_values,
+        y_values,
+        plot_width_px(ax),
+        CHART_SETTINGS['decimation_method'],
+        CHART_SETTINGS['zoom_debounce_ms']
+    )
+    decimator.attach(ax, line, redraw)
+    return decimator
+
+
+def extend_zoom_decimation(decimator, x_series, y_series):
+    """
+    Add appended rows to the full series a ZoomDecimator draws from
+    
+    Args:
+        decimator: ZoomDecimator from attach_zoom_decimation
+        x_series: Appended X values
+        y_series: Appended Y values
+    
+    Returns:
+        bool: False if the X column is no longer sorted and numeric
+    """
+    x_series, y_series, y_values = drop_missing(x_series, y_series)
+    x_values = sorted_numeric_values(x_series)
+    if x_values is None:
+        return False
+    if len(x_values) and len(decimator.x) and x_values[0] < decimator.x[-1]:
+        return False
     
-    return window
\ No newline at end of file
+    decimator.extend(x_values, y_values)
+    return True
@@ -0,0 +1,336 @@
+"""
+Columnar
+Readers for Parquet and Feather / Arrow IPC files (pyarrow is imported
+when one of them is read, so it stays optional)
+"""
+import os
+from collections import OrderedDict
+import pandas as pd
+from src.core.config import LOADER_SETTINGS
+
+
+class ParquetReader:
+    """
+    Reads Parquet files without touching data that is not needed
+
+    Only the requested columns are decoded (column pruning), and samples
+    and preview pages decode only the row groups holding their rows
+    (row-group pruning), found from the file's footer metadata.
+    """
+
+    columnar = True
+
+    def read(self, filepath, columns=None):
+        """
+        Read a whole file
+
+        Args:
+            filepath: Path to Parquet file
+            columns: Optional list of columns to read (others are skipped)
+
+        Returns:
+            DataFrame: The data
+        """
+        import pyarrow.parquet as pq
+        if columns is not None:
+            columns = _file_order(pq.read_schema(filepath, memory_map=True).names, columns)
+        return pq.read_table(filepath, columns=columns, memory_map=True).to_pandas()
+
+    def read_sample(self, filepath, nrows, columns=None):
+        """
+        Read the first rows, decoding only the row groups that hold them
+
+        Args:
+            filepath: Path to Parquet file
+            nrows: Number of rows
+            columns: Optional list of columns to read
+
+        Returns:
+            DataFrame: The first rows
+        """
+        parquet_file = _parquet_file(filepath)
+        columns = _file_order(parquet_file.schema_arrow.names, columns)
+        groups = _row_groups_for(parquet_file.metadata, 0, nrows)
+        table = parquet_file.read_row_groups(groups, columns=columns)
+        return table.slice(0, nrows).to_pandas()
+
+    def iter_batches(self, filepath, columns=None):
+        """
+        Read a file one row group at a time
+
+        Args:
+            filepath: Path to Parquet file
+            columns: Optional list of columns to read
+
+        Yields:
+            tuple: (DataFrame, bytes_read, total_bytes); bytes are estimated
+                from the share of rows read
+        """
+        parquet_file = _parquet_file(filepath)
+        columns = _file_order(parquet_file.schema_arrow.names, columns)
+        metadata = parquet_file.metadata
+        total_bytes = os.path.getsize(filepath)
+        rows_read = 0
+
+        for group in range(metadata.num_row_groups):
+            chunk = parquet_file.read_row_group(group, columns=columns).to_pandas()
+            rows_read += len(chunk)
+            yield chunk, total_bytes * rows_read // max(metadata.num_rows, 1), total_bytes
+
+    def open_rows(self, filepath):
+        """
+        Open a file for paging through its rows
+
+        Args:
+            filepath: Path to Parquet file
+
+        Returns:
+            ParquetRowReader: Reader with read_rows(start, stop)
+        """
+        return ParquetRowReader(filepath)
+
+
+class ArrowReader:
+    """
+    Reads Feather and Arrow IPC files through a memory map
+
+    The file is mapped rather than read, so opening it is instant and a
+    sample or preview page only touches the pages holding its rows.
+    """
+
+    columnar = True
+
+    def read(self, filepath, columns=None):
+        """
+        Read a whole file
+
+        Args:
+            filepath: Path to Feather / Arrow IPC file
+            columns: Optional list of columns to read (others are skipped)
+
+        Returns:
+            DataFrame: The data
+        """
+        return _arrow_table(filepath, columns).to_pandas(split_blocks=True)
+
+    def read_sample(self, filepath, nrows, columns=None):
+        """
+        Read the first rows
+
+        Args:
+            filepath: Path to Feather / Arrow IPC file
+            nrows: Number of rows
+            columns: Optional list of columns to read
+
+        Returns:
+            DataFrame: The first rows
+        """
+        return _arrow_table(filepath, columns).slice(0, nrows).to_pandas()
+
+    def iter_batches(self, filepath, columns=None):
+        """
+        Read a file in chunks of LOADER_SETTINGS['chunk_size_rows'] rows
+
+        Args:
+            filepath: Path to Feather / Arrow IPC file
+            columns: Optional list of columns to read
+
+        Yields:
+            tuple: (DataFrame, bytes_read, total_bytes); bytes are estimated
+                from the share of rows read
+        """
+        table = _arrow_table(filepath, columns)
+        total_bytes = os.path.getsize(filepath)
+        chunk_rows = LOADER_SETTINGS['chunk_size_rows']
+
+        for start in range(0, table.num_rows, chunk_rows):
+            chunk = table.slice(start, chunk_rows).to_pandas()
+            rows_read = start + len(chunk)
+            yield chunk, total_bytes * rows_read // max(table.num_rows, 1), total_bytes
+
+    def open_rows(self, filepath):
+        """
+        Open a file for paging through its rows
+
+        Args:
+            filepath: Path to Feather / Arrow IPC file
+
+        Returns:
+            ArrowRowReader: Reader with read_rows(start, stop)
+        """
+        return ArrowRowReader(filepath)
+
+
+class ParquetRowReader:
+    """
+    Reads arbitrary row ranges of a Parquet file, one row group at a time
+
+    Offers the part of the DataFrame interface the data grid needs (len,
+    columns, read_rows), like RowRangeReader does for CSV files. Recently
+    used row groups are kept.
+    """
+
+    def __init__(self, filepath, max_cached_groups=4):
+        """
+        Initialize reader
+
+        Args:
+            filepath: Path to Parquet file
+            max_cached_groups: Decoded row groups kept in memory
+        """
+        self.filepath = filepath
+        self.parquet_file = _parquet_file(filepath)
+        self.metadata = self.parquet_file.metadata
+        self.columns = pd.Index(self.parquet_file.schema_arrow.names)
+        self.max_cached_groups = max_cached_groups
+        self._groups = OrderedDict()
+
+    def __len__(self):
+        """Number of rows in the file"""
+        return self.metadata.num_rows
+
+    def read_rows(self, start, stop):
+        """
+        Read rows [start, stop), decoding only the row groups that hold them
+
+        Args:
+            start: First row position
+            stop: One-past-last row position
+
+        Returns:
+            DataFrame: The rows, indexed by row position
+        """
+        start = max(start, 0)
+        stop = min(stop, len(self))
+        if start >= stop:
+            return pd.DataFrame(columns=self.columns)
+
+        groups = _row_groups_for(self.metadata, start, stop)
+        first_row = sum(self.metadata.row_group(i).num_rows for i in range(groups[0]))
+        frames = [self._group(group) for group in groups]
+        rows = pd.concat(frames) if len(frames) > 1 else frames[0]
+
+        rows = rows.iloc[start - first_row:stop - first_row]
+        rows.index = pd.RangeIndex(start, stop)
+        return rows
+
+    def _group(self, group):
+        """Decode (or reuse) one row group"""
+        if group in self._groups:
+            self._groups.move_to_end(group)
+            return self._groups[group]
+
+        rows = self.parquet_file.read_row_group(group).to_pandas()
+        self._groups[group] = rows
+        if len(self._groups) > self.max_cached_groups:
+            self._groups.popitem(last=False)
+        return rows
+
+
+class ArrowRowReader:
+    """
+    Reads arbitrary row ranges of a memory-mapped Feather / Arrow IPC file
+
+    Slicing the mapped table copies nothing; only the rows of a page are
+    converted to pandas.
+    """
+
+    def __init__(self, filepath):
+        """
+        Initialize reader
+
+        Args:
+            filepath: Path to Feather / Arrow IPC file
+        """
+        self.filepath = filepath
+        self.table = _arrow_table(filepath)
+        self.columns = pd.Index(self.table.column_names)
+
+    def __len__(self):
+        """Number of rows in the file"""
+        return self.table.num_rows
+
+    def read_rows(self, start, stop):
+        """
+        Read rows [start, stop)
+
+        Args:
+            start: First row position
+            stop: One-past-last row position
+
+        Returns:
+            DataFrame: The rows, indexed by row position
+        """
+        start = max(start, 0)
+        stop = min(stop, len(self))
+        if start >= stop:
+            return pd.DataFrame(columns=self.columns)
+
+        rows = self.table.slice(start, stop - start).to_pandas()
+        rows.index = pd.RangeIndex(start, stop)
+        return rows
+
+
+def _parquet_file(filepath):
+    """Open a Parquet file's metadata (data is read on demand)"""
+    import pyarrow.parquet as pq
+    return pq.ParquetFile(filepath, memory_map=True)
+
+
+def _file_order(names, columns):
+    """
+    Requested columns in the order of the file, as CSV reads return them
+
+    Unknown names are kept (last), so the read still reports them.
+    """
+    if columns is None:
+        return None
+    position = {name: i for i, name in enumerate(names)}
+    return sorted(columns, key=lambda name: position.get(name, len(position)))
+
+
+def _row_groups_for(metadata, start, stop):
+    """Indices of the row groups holding rows [start, stop)"""
+    groups = []
+    first_row = 0
+    for group in range(metadata.num_row_groups):
+        group_rows = metadata.row_group(group).num_rows
+        if first_row < stop and first_row + group_rows > start:
+            groups.append(group)
+        first_row += group_rows
+        if first_row >= stop:
+            break
+    return groups or [0]
+
+
+def _arrow_table(filepath, columns=None):
+    """Memory-map a Feather (v1 or v2) or Arrow IPC file or stream"""
+    import pyarrow as pa
+    from pyarrow import feather, ipc
+
+    if columns is not None:
+        schema = _arrow_schema(filepath)
+        if schema is not None:
+            columns = _file_order(schema.names, columns)
+
+    try:
+        return feather.read_table(filepath, columns=columns, memory_map=True)
+    except pa.ArrowInvalid:
+        # The IPC stream format has no footer; it is read batch by batch
+        with pa.memory_map(filepath) as source:
+            table = ipc.open_stream(source).read_all()
+        return table.select(columns) if columns is not None else table
+
+
+def _arrow_schema(filepath):
+    """Schema of an Arrow IPC file or stream (None for Feather V1 files)"""
+    import pyarrow as pa
+    from pyarrow import ipc
+
+    with pa.memory_map(filepath) as source:
+        for open_reader in (ipc.open_file, ipc.open_stream):
+            try:
+                return open_reader(source).schema
+            except pa.ArrowInvalid:
+                source.seek(0)
+    return None
@@ -1,6 +1,10 @@
 # Exports all config settings so users can import from one place
 from src.core.config.app_config import APP_NAME, WINDOW_WIDTH, WINDOW_HEIGHT
-from src.core.config.chart_config import CHART_SETTINGS
+from src.core.config.chart_config import CHART_SETTINGS, AGGREGATION_LABELS
+from src.core.config.loader_config import LOADER_SETTINGS
+from src.core.config.cache_config import CACHE_SETTINGS
+from src.core.config.stats_config import STATS_SETTINGS
+from src.core.config.profiling_config import PROFILING_SETTINGS
 from src.core.config.ui_config import COLORS
 from src.core.config.messages import ERROR_MESSAGES, STATUS_MESSAGES
 
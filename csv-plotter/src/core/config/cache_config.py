@@ -0,0 +1,15 @@
+"""
+Cache Configuration
+Settings for the on-disk cache of parsed CSV files
+"""
+import os
+
+CACHE_SETTINGS = {
+    "enabled": True,
+    "cache_dir": os.path.join(os.path.expanduser("~"), ".cache", "csv-plotter"),
+    # Least recently used entries are evicted above this total size
+    "max_size_mb": 4096,
+    # 'feather' (memory-mapped, needs pyarrow) or 'parquet' (needs pyarrow);
+    # falls back to 'pickle' when pyarrow is not installed
+    "format": "feather",
+}
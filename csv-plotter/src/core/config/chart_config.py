@@ -16,4 +16,30 @@ CHART_SETTINGS = {
     "label_fontsize": 14,
     "title_fontsize": 16,
     "title_pad": 20,
+    # Line charts with more points than this are downsampled before drawing
+    "decimation_threshold": 10_000,
+    # 'lttb' (Largest-Triangle-Three-Buckets) or 'minmax' (min/max per pixel)
+    "decimation_method": "lttb",
+    # Delay before re-decimating the visible range after zoom/pan
+    "zoom_debounce_ms": 150,
+    # Markers are hidden when more points than this are drawn
+    "marker_max_points": 500,
+    # Aggregated bar charts show at most this many bars (top N + "Other")
+    "bar_max_bars": 50,
+    # Equal-width bins used for continuous numeric X columns
+    "bar_bins": 30,
+    # Default bar aggregation: 'none', 'sum', 'mean', 'count', 'min', 'max'
+    "bar_aggregation": "sum",
+    # Resolution of saved and batch-rendered charts
+    "export_dpi": 300,
+}
+
+# Bar aggregation keys and their labels in the UI
+AGGREGATION_LABELS = {
+    "none": "None (one bar per row)",
+    "sum": "Sum",
+    "mean": "Mean",
+    "count": "Count",
+    "min": "Min",
+    "max": "Max",
 }
\ No newline at end of file
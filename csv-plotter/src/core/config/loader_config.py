@@ -0,0 +1,49 @@
+"""
+Loader Configuration
+CSV loading and streaming settings
+"""
+
+LOADER_SETTINGS = {
+    # Files larger than this are read in chunks with progress reporting
+    "streaming_threshold_mb": 50,
+    # Number of rows parsed per chunk in streaming mode
+    "chunk_size_rows": 200_000,
+    # Shrink loaded frames by narrowing numeric dtypes and using categories
+    "optimize_dtypes": True,
+    # Rows sampled from the start of the file to choose text column dtypes
+    "dtype_sample_rows": 10_000,
+    # Text columns at or below both limits are loaded as 'category'
+    "category_max_unique": 1000,
+    "category_max_unique_ratio": 0.5,
+    # Store other text columns as pyarrow strings (needs pyarrow installed)
+    "pyarrow_strings": False,
+    # Files with at least this many columns are loaded in two phases:
+    # header + sample first, plotted columns parsed on demand
+    "projection_min_columns": 50,
+    "projection_sample_rows": 1000,
+    # Files larger than this are parsed on several cores; below it, pool
+    # startup costs more than it saves
+    "parallel_min_mb": 64,
+    # 'auto' (same as 'processes'), 'processes' (byte ranges parsed in a
+    # process pool), 'pyarrow' (pyarrow's streaming parser) or 'off'
+    "parallel_engine": "auto",
+    # Bytes parsed per block by the 'pyarrow' engine
+    "arrow_block_mb": 16,
+    # Worker processes for the 'processes' engine (None = all cores)
+    "parallel_workers": None,
+    # Files larger than this are first indexed (one scan for row offsets)
+    # so the preview can page through them while the full load runs
+    "row_index_min_mb": 200,
+    # Every n-th row offset is kept; a page read parses at most n extra rows
+    "row_index_stride": 256,
+    # Follow mode: how often a followed file is checked for appended rows
+    "follow_interval_ms": 1000,
+    # Most appended bytes parsed per check, so a burst is shown in steps
+    "follow_max_bytes": 16 * 1024 * 1024,
+    # Multi-file loads: files matched in a chosen folder, threads parsing
+    # files at once (None = cores + 4, at most 32) and the column naming
+    # each row's file
+    "shard_pattern": "*.csv",
+    "shard_workers": None,
+    "source_column": "source_file",
+}
@@ -13,6 +13,13 @@ ERROR_MESSAGES = {
     "same_columns": "X-axis and Y-axis cannot be the same column. Please select different columns.",
     "no_column_selected": "Please select columns for both X-axis and Y-axis.",
     "y_not_numeric": "Y-axis column must contain numeric data. Please select a different column.",
+    "load_cancelled": "Loading was cancelled.",
+    "follow_sample": "Only fully loaded files can be followed; this wide file was loaded as a sample.",
+    "no_matching_files": "No files matched the selection.",
+    "follow_multiple": "Only a single loaded file can be followed, not a set of files.",
+    "missing_reader": "Reading this file needs the '{package}' package (pip install {package}).",
+    "follow_format": "Only uncompressed CSV files can be followed.",
+    "column_not_found": "Column not found in the file: {columns}",
 }
 
 STATUS_MESSAGES = {
@@ -20,5 +27,19 @@ STATUS_MESSAGES = {
     "browsing": "Browsing for file...",
     "loading": "Loading file...",
     "loaded": "File loaded successfully",
+    "loading_progress": "Loading: {percent:.0f}% ({rows:,} rows)",
+    "loaded_sample": "Loaded header and sample: {columns} columns (plotted columns are parsed on demand)",
+    "loading_columns": "Loading selected columns...",
+    "cancelling": "Cancelling load...",
+    "indexing_progress": "Indexing rows: {percent:.0f}%",
+    "paged_preview": "Previewing {rows:,} rows from the file; loading in the background...",
+    "following": "Following {file}: {rows:,} rows",
+    "follow_appended": "Following {file}: {rows:,} rows (+{appended:,})",
+    "follow_reloaded": "File was truncated or replaced; reloaded {rows:,} rows",
     "generating": "Generating chart...",
+    "loading_files": "Loading {files} files...",
+    "loaded_files": "Loaded {files} files ({rows:,} rows) from {folder}",
+    "capture_armed": "The next load or chart will be captured with {mode}",
+    "capture_saved": "{mode} capture saved to {path}",
+    "trace_exported": "Trace exported to {path}",
 }
\ No newline at end of file
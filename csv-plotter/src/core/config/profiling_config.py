@@ -0,0 +1,15 @@
+"""
+Profiling Configuration
+Settings for timing spans and profiling captures
+"""
+
+PROFILING_SETTINGS = {
+    # Most recent spans kept for trace export (older ones are dropped)
+    "max_spans": 10_000,
+    # Where cProfile/tracemalloc captures are written (None = temp directory)
+    "capture_dir": None,
+    # Functions or allocation sites listed in a capture's text report
+    "capture_top": 30,
+    # Slowest spans shown in the status bar breakdown
+    "breakdown_items": 5,
+}
@@ -0,0 +1,16 @@
+"""
+Stats Configuration
+Settings for the Statistics tab
+"""
+
+STATS_SETTINGS = {
+    # Use mergeable sketches (approximate median and distinct counts)
+    # instead of exact statistics; can be toggled in the Statistics tab
+    "approximate": False,
+    # KLL quantile sketch size: 200 gives ~1.3% rank error
+    "kll_k": 200,
+    # HyperLogLog register bits: 12 gives ~1.6% distinct-count error
+    "hll_precision": 12,
+    # Rows fed to the sketches at a time when they were not built during load
+    "sketch_chunk_rows": 200_000,
+}
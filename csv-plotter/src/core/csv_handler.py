@@ -1,28 +1,687 @@
 """
 CSV Handler
-Loads and processes CSV files
+Loads and processes CSV files, plain or compressed, and columnar files
+through a registry of readers
 """
+import io
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import pandas as pd
+from pandas.api.types import union_categoricals
+from src.core.config import LOADER_SETTINGS
+from src.core.columnar import ArrowReader, ParquetReader
+from src.core.formats import INPUT_FORMATS, input_format, is_plain_csv
+from src.core.row_index import RowIndex, RowRangeReader
+from src.core.dtype_optimizer import (
+    infer_load_profile,
+    categorize_text,
+    downcast_numeric,
+    estimate_memory_before,
+    pyarrow_available
+)
 
-def load_csv(filepath):
+
+# Byte ranges per worker process, so faster workers pick up more work
+RANGES_PER_WORKER = 4
+
+class LoadCancelledError(Exception):
+    """Raised when a streaming load is cancelled by the caller"""
+
+
+class SplitRowError(Exception):
+    """Raised when a byte range starts or ends inside a quoted field"""
+
+
+class CsvReader:
+    """
+    Reads CSV text, plain or compressed
+
+    Compressed files are decompressed by the parser as it reads them, a
+    block at a time, so nothing is unpacked to disk first.
+    """
+
+    columnar = False
+
+    def read(self, filepath, columns=None):
+        """
+        Read a whole file
+
+        Args:
+            filepath: Path to CSV file
+            columns: Optional list of columns to parse (others are skipped)
+
+        Returns:
+            DataFrame: The data
+        """
+        return pd.read_csv(filepath, usecols=columns, compression=_compression(filepath))
+
+    def read_sample(self, filepath, nrows, columns=None):
+        """
+        Read the header and the first rows
+
+        Args:
+            filepath: Path to CSV file
+            nrows: Number of rows
+            columns: Optional list of columns to parse
+
+        Returns:
+            DataFrame: The first rows
+        """
+        return pd.read_csv(
+            filepath, nrows=nrows, usecols=columns, compression=_compression(filepath)
+        )
+
+
+# Reader name (INPUT_FORMATS[ext]['reader']) → reader
+READERS = {
+    "csv": CsvReader(),
+    "parquet": ParquetReader(),
+    "arrow": ArrowReader(),
+}
+
+
+def register_reader(name, reader, extensions=(), requires=None):
+    """
+    Add a reader for more file formats
+
+    A reader has a `columnar` attribute and read(filepath, columns) and
+    read_sample(filepath, nrows, columns) methods; columnar readers also
+    have iter_batches(filepath, columns) and open_rows(filepath)
+    (see src.core.columnar).
+
+    Args:
+        name: Reader name
+        reader: Reader instance
+        extensions: File extensions (with the dot) read by it
+        requires: Optional package the reader needs, checked when files
+            are validated
+    """
+    READERS[name] = reader
+    for ext in extensions:
+        INPUT_FORMATS[ext.lower()] = {"reader": name, "compression": None, "requires": requires}
+
+
+def get_reader(filepath):
+    """
+    Find the reader for a file from its extension
+
+    Args:
+        filepath: Path to the file
+
+    Returns:
+        Reader for the file (CSV for unknown extensions)
+    """
+    return READERS[input_format(filepath)["reader"]]
+
+
+def load_csv(filepath, optimize=None, usecols=None):
     """
     Load CSV file using pandas
     No validation yet - just basic loading
+    
+    Args:
+        filepath: Path to CSV file
+        optimize: Narrow dtypes to save memory (defaults to LOADER_SETTINGS)
+        usecols: Optional list of columns to parse (others are skipped)
+    
+    Returns:
+        DataFrame: Loaded data
     """
-    df = pd.read_csv(filepath)
+    reader = get_reader(filepath)
+    if reader.columnar:
+        return _load_columnar(reader, filepath, optimize, usecols)
+    
+    profile = _load_profile(filepath, optimize, usecols)
+    if profile is None:
+        return pd.read_csv(filepath, usecols=usecols)
+    
+    df = pd.read_csv(filepath, dtype=profile['dtype'], usecols=usecols)
+    downcast_numeric(df)
+    df.attrs['memory_before'] = estimate_memory_before(df, profile)
     return df
 
 
+def load_csv_chunked(filepath, chunk_size=None, progress_callback=None,
+                     cancel_event=None, optimize=None, usecols=None,
+                     chunk_callback=None):
+    """
+    Load CSV file in chunks, reporting progress and allowing cancellation
+
+    Args:
+        filepath: Path to CSV file
+        chunk_size: Rows per chunk (defaults to LOADER_SETTINGS)
+        progress_callback: Optional callable(bytes_read, total_bytes, rows_read)
+        cancel_event: Optional threading.Event; load stops when it is set
+        optimize: Narrow dtypes to save memory (defaults to LOADER_SETTINGS)
+        usecols: Optional list of columns to parse (others are skipped)
+        chunk_callback: Optional callable(chunk) run on each parsed chunk,
+            e.g. to build statistics while the file streams in
+
+    Returns:
+        DataFrame: Loaded data
+
+    Raises:
+        LoadCancelledError: If cancel_event was set during the load
+    """
+    reader = get_reader(filepath)
+    if reader.columnar:
+        return _load_columnar_chunked(
+            reader, filepath, progress_callback, cancel_event, optimize, usecols,
+            chunk_callback
+        )
+
+    chunk_size = chunk_size or LOADER_SETTINGS['chunk_size_rows']
+    total_bytes = os.path.getsize(filepath)
+    profile = _load_profile(filepath, optimize, usecols)
+    dtypes = profile['dtype'] if profile else None
+
+    chunks = []
+    rows_read = 0
+
+    # Compressed files are decompressed as they stream; progress follows
+    # the position in the compressed file
+    with open(filepath, 'rb') as handle:
+        chunk_reader = pd.read_csv(
+            handle, chunksize=chunk_size, dtype=dtypes, usecols=usecols,
+            compression=input_format(filepath)['compression']
+        )
+        for chunk in chunk_reader:
+            if cancel_event is not None and cancel_event.is_set():
+                chunk_reader.close()
+                raise LoadCancelledError()
+
+            # Downcast per chunk to keep peak memory low; concat
+            # promotes chunks to a common dtype where they differ
+            if profile:
+                downcast_numeric(chunk)
+            if chunk_callback is not None:
+                chunk_callback(chunk)
+            chunks.append(chunk)
+            rows_read += len(chunk)
+
+            if progress_callback is not None:
+                # The parser reads ahead in blocks, so this is approximate
+                bytes_read = min(handle.tell(), total_bytes)
+                progress_callback(bytes_read, total_bytes, rows_read)
+
+    if not chunks:
+        return CsvReader().read(filepath, usecols)
+
+    # Concatenate once at the end instead of growing a frame per chunk
+    df = pd.concat(_align_categories(chunks), ignore_index=True)
+    if profile:
+        df.attrs['memory_before'] = estimate_memory_before(df, profile)
+    return df
+
+
+def load_csv_parallel(filepath, progress_callback=None, cancel_event=None,
+                      optimize=None, usecols=None, chunk_callback=None, engine=None):
+    """
+    Load CSV file using several cores
+    
+    With 'processes' the file is split into newline-aligned byte ranges
+    that are parsed in a process pool with the same dtype profile, then
+    concatenated once. If a split falls inside a quoted field that spans
+    lines, the file is read by load_csv_chunked instead. With 'pyarrow'
+    pyarrow's streaming CSV reader parses the file in blocks, with the
+    column types the default parser picks for the start of the file; if
+    later rows do not fit them, load_csv_chunked reads the file instead.
+    
+    Args:
+        filepath: Path to CSV file
+        progress_callback: Optional callable(bytes_read, total_bytes, rows_read)
+        cancel_event: Optional threading.Event; load stops when it is set
+        optimize: Narrow dtypes to save memory (defaults to LOADER_SETTINGS)
+        usecols: Optional list of columns to parse (others are skipped)
+        chunk_callback: Optional callable(chunk) run on each parsed part
+        engine: 'pyarrow' or 'processes' (defaults to parallel_engine())
+    
+    Returns:
+        DataFrame: Loaded data
+    
+    Raises:
+        LoadCancelledError: If cancel_event was set during the load
+    """
+    engine = engine or parallel_engine(filepath) or 'processes'
+    total_bytes = os.path.getsize(filepath)
+    profile = _load_profile(filepath, optimize, usecols)
+    dtypes = profile['dtype'] if profile else None
+    
+    names = list(pd.read_csv(filepath, nrows=0).columns)
+    
+    def read_chunked():
+        return load_csv_chunked(
+            filepath,
+            progress_callback=progress_callback,
+            cancel_event=cancel_event,
+            optimize=optimize,
+            usecols=usecols,
+            chunk_callback=chunk_callback
+        )
+    
+    if engine == 'pyarrow':
+        chunks = _parse_arrow_blocks(
+            filepath, names, dtypes, usecols, progress_callback, cancel_event
+        )
+        if chunks is None:
+            return read_chunked()
+        if not chunks:
+            return pd.read_csv(filepath, usecols=usecols)
+    else:
+        ranges = _byte_ranges(filepath, _worker_count() * RANGES_PER_WORKER)
+        try:
+            chunks = _parse_ranges(
+                filepath, ranges, names, dtypes, usecols, progress_callback, cancel_event
+            )
+        except SplitRowError:
+            return read_chunked()
+        if not chunks:
+            return pd.read_csv(filepath, usecols=usecols)
+        chunks = _reconcile_text_columns(filepath, ranges, chunks, names, dtypes, usecols)
+    
+    for chunk in chunks:
+        if profile:
+            downcast_numeric(chunk)
+        if chunk_callback is not None:
+            chunk_callback(chunk)
+    
+    df = pd.concat(_align_categories(chunks), ignore_index=True)
+    if profile:
+        df.attrs['memory_before'] = estimate_memory_before(df, profile)
+    return df
+
+
+def parallel_engine(filepath):
+    """
+    Choose how to parse a file on several cores
+    
+    Args:
+        filepath: Path to CSV file
+    
+    Returns:
+        str: 'processes', or 'pyarrow' if configured and installed, or None
+            if the file should be read by the single-threaded parser (small
+            file or single core), and for compressed and columnar files
+    """
+    if not is_plain_csv(filepath):
+        return None
+    
+    engine = LOADER_SETTINGS['parallel_engine']
+    threshold = LOADER_SETTINGS['parallel_min_mb'] * 1024 * 1024
+    if engine == 'off' or os.path.getsize(filepath) <= threshold:
+        return None
+    
+    if engine == 'pyarrow' and pyarrow_available():
+        return 'pyarrow'
+    if _worker_count() < 2:
+        return None
+    return 'processes'
+
+
+def _worker_count():
+    """Worker processes for the 'processes' engine"""
+    return LOADER_SETTINGS['parallel_workers'] or os.cpu_count() or 1
+
+
+def _byte_ranges(filepath, parts):
+    """
+    Split the data part of a file into newline-aligned byte ranges
+    
+    Returns:
+        list: (start, end) offsets; the header line is not included
+    """
+    size = os.path.getsize(filepath)
+    with open(filepath, 'rb') as handle:
+        handle.readline()
+        data_start = handle.tell()
+        
+        bounds = [data_start]
+        for i in range(1, parts):
+            handle.seek(data_start + (size - data_start) * i // parts)
+            handle.readline()  # Move to the start of the next line
+            position = handle.tell()
+            if bounds[-1] < position < size:
+                bounds.append(position)
+        bounds.append(size)
+    
+    return [(start, end) for start, end in zip(bounds, bounds[1:]) if end > start]
+
+
+def _parse_byte_range(filepath, start, end, names, dtype=None, usecols=None):
+    """
+    Parse one byte range of a CSV file (runs in a worker process)
+    
+    Raises:
+        SplitRowError: If the range holds an odd number of quote characters.
+            Quotes come in pairs ("" escapes included), so when every range
+            has an even count, every split lies outside a quoted field.
+    """
+    with open(filepath, 'rb') as handle:
+        handle.seek(start)
+        data = handle.read(end - start)
+    if data.count(b'"') % 2:
+        raise SplitRowError(f"Quoted field spans byte offset {start} or {end}")
+    return pd.read_csv(io.BytesIO(data), header=None, names=names, dtype=dtype, usecols=usecols)
+
+
+def _parse_ranges(filepath, ranges, names, dtypes, usecols, progress_callback, cancel_event):
+    """Parse byte ranges in a process pool, returning frames in file order"""
+    chunks = [None] * len(ranges)
+    total_bytes = os.path.getsize(filepath)
+    bytes_read = ranges[0][0] if ranges else total_bytes  # Header
+    rows_read = 0
+    
+    with ProcessPoolExecutor(max_workers=_worker_count()) as pool:
+        futures = {
+            pool.submit(_parse_byte_range, filepath, start, end, names, dtypes, usecols): i
+            for i, (start, end) in enumerate(ranges)
+        }
+        for future in as_completed(futures):
+            if cancel_event is not None and cancel_event.is_set():
+                pool.shutdown(wait=False, cancel_futures=True)
+                raise LoadCancelledError()
+            
+            i = futures[future]
+            try:
+                chunks[i] = future.result()
+            except SplitRowError:
+                pool.shutdown(wait=False, cancel_futures=True)
+                raise
+            start, end = ranges[i]
+            bytes_read += end - start
+            rows_read += len(chunks[i])
+            if progress_callback is not None:
+                progress_callback(bytes_read, total_bytes, rows_read)
+    
+    return chunks
+
+
+def _parse_arrow_blocks(filepath, names, dtypes, usecols, progress_callback, cancel_event):
+    """
+    Parse a CSV file block by block with pyarrow's streaming reader
+    
+    Column types are fixed from a sample parsed by the default engine, so
+    pyarrow's own inference (timestamps, for one) does not make the frame
+    differ from smaller files of the same data. Values count as missing as
+    they do for the default engine.
+    
+    Returns:
+        list: DataFrames in file order, or None if a later value does not
+            fit its column's type from the sample
+    """
+    import pyarrow as pa
+    from pyarrow import csv as pa_csv
+    from pandas._libs.parsers import STR_NA_VALUES
+    
+    sample = pd.read_csv(
+        filepath, nrows=LOADER_SETTINGS['dtype_sample_rows'], usecols=usecols
+    )
+    column_types = {col: _arrow_type(sample[col].dtype) for col in sample.columns}
+    
+    read_options = pa_csv.ReadOptions(
+        column_names=names,
+        skip_rows=1,
+        block_size=LOADER_SETTINGS['arrow_block_mb'] * 1024 * 1024
+    )
+    convert_options = pa_csv.ConvertOptions(
+        column_types=column_types,
+        include_columns=list(sample.columns),
+        null_values=list(STR_NA_VALUES),
+        strings_can_be_null=True
+    )
+    
+    total_bytes = os.path.getsize(filepath)
+    chunks = []
+    rows_read = 0
+    
+    try:
+        with open(filepath, 'rb') as handle:
+            batches = pa_csv.open_csv(
+                handle, read_options=read_options, convert_options=convert_options
+            )
+            for batch in batches:
+                if cancel_event is not None and cancel_event.is_set():
+                    raise LoadCancelledError()
+                
+                chunk = batch.to_pandas()
+                if dtypes:
+                    chunk = chunk.astype({col: dtypes[col] for col in dtypes if col in chunk})
+                chunks.append(chunk)
+                rows_read += len(chunk)
+                
+                if progress_callback is not None:
+                    # The reader reads ahead, so this is approximate
+                    progress_callback(min(handle.tell(), total_bytes), total_bytes, rows_read)
+    except pa.ArrowInvalid:
+        return None
+    
+    return chunks
+
+
+def _arrow_type(dtype):
+    """pyarrow type that parses a column as the default engine typed it"""
+    import pyarrow as pa
+    
+    if pd.api.types.is_bool_dtype(dtype):
+        return pa.bool_()
+    if pd.api.types.is_unsigned_integer_dtype(dtype):
+        return pa.uint64()
+    if pd.api.types.is_integer_dtype(dtype):
+        return pa.int64()
+    if pd.api.types.is_float_dtype(dtype):
+        return pa.float64()
+    return pa.string()
+
+
+def _reconcile_text_columns(filepath, ranges, chunks, names, dtypes, usecols):
+    """
+    Make columns that are text in some ranges text in all of them
+    
+    Each range infers its own dtypes, so a column with text only near the
+    end of the file is numeric in earlier ranges. Concatenating those would
+    give a mix of numbers and strings, unlike a single-pass parse; such
+    ranges are parsed again with the column read as strings.
+    """
+    mixed = [
+        col for col in chunks[0].columns
+        if len({pd.api.types.is_numeric_dtype(chunk[col].dtype) for chunk in chunks}) > 1
+    ]
+    if not mixed:
+        return chunks
+    
+    dtypes = dict(dtypes or {}, **{col: 'str' for col in mixed})
+    for i, chunk in enumerate(chunks):
+        if any(pd.api.types.is_numeric_dtype(chunk[col].dtype) for col in mixed):
+            start, end = ranges[i]
+            chunks[i] = _parse_byte_range(filepath, start, end, names, dtypes, usecols)
+    return chunks
+
+
+def should_stream(filepath):
+    """
+    Check whether a file is large enough to be loaded in chunks
+
+    Args:
+        filepath: Path to CSV file
+
+    Returns:
+        bool: True if the file exceeds the streaming threshold
+    """
+    threshold = LOADER_SETTINGS['streaming_threshold_mb'] * 1024 * 1024
+    return os.path.getsize(filepath) > threshold
+
+
+def should_index(filepath):
+    """
+    Check whether a file is large enough to be previewed through a row index
+
+    Args:
+        filepath: Path to CSV file
+
+    Returns:
+        bool: True if the file exceeds the row index threshold (compressed
+            CSV is never indexed: its byte offsets are not rows)
+    """
+    if not (is_plain_csv(filepath) or get_reader(filepath).columnar):
+        return False
+    threshold = LOADER_SETTINGS['row_index_min_mb'] * 1024 * 1024
+    return os.path.getsize(filepath) > threshold
+
+
+def open_row_reader(filepath, progress_callback=None, cancel_event=None):
+    """
+    Open a file for reading arbitrary row ranges without a full parse
+
+    The row index is loaded from disk if the file was indexed before,
+    otherwise built with one memory-mapped scan and saved. Columnar files
+    need no index: their metadata locates the rows.
+
+    Args:
+        filepath: Path to CSV, Parquet or Arrow file
+        progress_callback: Optional callable(bytes_scanned, total_bytes)
+        cancel_event: Optional threading.Event; indexing stops when it is set
+
+    Returns:
+        RowRangeReader: Reader with read_rows(start, stop) (or the columnar
+            equivalent)
+
+    Raises:
+        LoadCancelledError: If cancel_event was set while indexing
+    """
+    reader = get_reader(filepath)
+    if reader.columnar:
+        return reader.open_rows(filepath)
+
+    row_index = RowIndex.open(
+        filepath, progress_callback=progress_callback, cancel_event=cancel_event
+    )
+    if row_index is None:
+        raise LoadCancelledError()
+    return RowRangeReader(row_index)
+
+
+def read_sample(filepath, nrows=None):
+    """
+    Read only the header and the first rows of a file
+    
+    Args:
+        filepath: Path to CSV, Parquet or Arrow file
+        nrows: Rows to read (defaults to LOADER_SETTINGS)
+    
+    Returns:
+        DataFrame: Sample of the file
+    """
+    if nrows is None:
+        nrows = LOADER_SETTINGS['projection_sample_rows']
+    return get_reader(filepath).read_sample(filepath, nrows)
+
+
+def get_loader_options():
+    """
+    Loader settings that change the parsed result (used in cache keys)
+    
+    Returns:
+        dict: Option name to value
+    """
+    keys = [
+        'optimize_dtypes',
+        'category_max_unique',
+        'category_max_unique_ratio',
+        'pyarrow_strings',
+    ]
+    return {key: LOADER_SETTINGS[key] for key in keys}
+
+
+def _load_columnar(reader, filepath, optimize, usecols):
+    """Read a columnar file, narrowing dtypes after the read"""
+    df = reader.read(filepath, usecols)
+    if _should_optimize(optimize):
+        downcast_numeric(df)
+        categorize_text(df)
+    return df
+
+
+def _load_columnar_chunked(reader, filepath, progress_callback, cancel_event,
+                           optimize, usecols, chunk_callback):
+    """Read a columnar file batch by batch (see load_csv_chunked)"""
+    optimize = _should_optimize(optimize)
+    chunks = []
+    rows_read = 0
+
+    for chunk, bytes_read, total_bytes in reader.iter_batches(filepath, usecols):
+        if cancel_event is not None and cancel_event.is_set():
+            raise LoadCancelledError()
+
+        if optimize:
+            downcast_numeric(chunk)
+        if chunk_callback is not None:
+            chunk_callback(chunk)
+        chunks.append(chunk)
+        rows_read += len(chunk)
+
+        if progress_callback is not None:
+            progress_callback(bytes_read, total_bytes, rows_read)
+
+    if not chunks:
+        return _load_columnar(reader, filepath, optimize, usecols)
+
+    df = pd.concat(_align_categories(chunks), ignore_index=True)
+    if optimize:
+        categorize_text(df)
+    return df
+
+
+def _compression(filepath):
+    """Compression argument for pandas (inferred for unknown extensions)"""
+    return input_format(filepath)['compression'] or 'infer'
+
+
+def _should_optimize(optimize):
+    """Resolve the optimize argument against LOADER_SETTINGS"""
+    if optimize is None:
+        return LOADER_SETTINGS['optimize_dtypes']
+    return optimize
+
+
+def _load_profile(filepath, optimize, usecols=None):
+    """Return the dtype profile for a load, or None if not optimizing"""
+    if not _should_optimize(optimize):
+        return None
+    return infer_load_profile(filepath, usecols=usecols)
+
+
+def _align_categories(chunks):
+    """
+    Give categorical columns the same categories in every chunk
+    
+    Each chunk is parsed with its own categories, and concatenating
+    categoricals that differ silently falls back to object dtype.
+    """
+    if len(chunks) < 2:
+        return chunks
+    
+    for col in chunks[0].columns:
+        if not isinstance(chunks[0][col].dtype, pd.CategoricalDtype):
+            continue
+        categories = union_categoricals(
+            [chunk[col] for chunk in chunks], ignore_order=True
+        ).categories
+        for chunk in chunks:
+            chunk[col] = chunk[col].cat.set_categories(categories)
+    
+    return chunks
+
+
 def get_columns(df):
     """
     Get list of column names from dataframe
-    
+
     Args:
         df: pandas DataFrame
-        
+
     Returns:
         list: Column names
     """
     if df is None:
         return []
-    return list(df.columns)
\ No newline at end of file
+    return list(df.columns)
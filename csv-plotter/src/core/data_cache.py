@@ -0,0 +1,239 @@
+"""
+Data Cache
+Persistent binary cache of parsed CSV files
+Entries are keyed by absolute path, size, mtime and loader options
+"""
+import hashlib
+import json
+import os
+import threading
+import time
+import pandas as pd
+from src.core.config import CACHE_SETTINGS
+from src.core.dtype_optimizer import pyarrow_available
+
+
+INDEX_FILENAME = "index.json"
+EXTENSIONS = {"feather": ".feather", "parquet": ".parquet", "pickle": ".pkl"}
+
+
+class DataCache:
+    """
+    On-disk cache of parsed DataFrames with an LRU size cap
+    Stored as Feather/Parquet when pyarrow is installed, pickle otherwise
+    """
+
+    def __init__(self, cache_dir=None, max_size_mb=None, file_format=None):
+        """
+        Initialize data cache
+
+        Args:
+            cache_dir: Directory for cache files (defaults to CACHE_SETTINGS)
+            max_size_mb: Total size cap in MB (defaults to CACHE_SETTINGS)
+            file_format: 'feather', 'parquet' or 'pickle' (defaults to CACHE_SETTINGS)
+        """
+        self.cache_dir = cache_dir or CACHE_SETTINGS['cache_dir']
+        self.max_bytes = (max_size_mb or CACHE_SETTINGS['max_size_mb']) * 1024 * 1024
+
+        file_format = file_format or CACHE_SETTINGS['format']
+        if file_format != "pickle" and not pyarrow_available():
+            file_format = "pickle"
+        self.file_format = file_format
+
+        self._lock = threading.Lock()
+
+        # Hits since the index was last written; saved with the next write
+        self._accessed = {}
+
+    def get(self, filepath, options=None, signature=None):
+        """
+        Look up a cached DataFrame for a file
+
+        Args:
+            filepath: Path to the source CSV file
+            options: Dict of loader options that affect the parsed result
+            signature: file_signature taken before the lookup (read now if None)
+
+        Returns:
+            DataFrame: Cached data, or None on a miss
+        """
+        signature = signature or file_signature(filepath)
+        key = self._make_key(filepath, options, signature)
+
+        with self._lock:
+            entry = self._read_index().get(key)
+            if entry is None:
+                return None
+            self._accessed[key] = time.time()
+
+        try:
+            df = self._read_frame(os.path.join(self.cache_dir, entry['filename']))
+        except Exception:
+            # A corrupt or half-written entry is treated as a miss
+            self._remove(key)
+            return None
+
+        df.attrs.update(entry.get('attrs', {}))
+        return df
+
+    def put(self, filepath, df, options=None, signature=None):
+        """
+        Store a parsed DataFrame, evicting old entries if over the size cap
+
+        Caching is best-effort: frames the format cannot store are skipped,
+        and so are frames of a file that changed while it was parsed (they
+        would be stored under the new version but lack its new rows).
+
+        Args:
+            filepath: Path to the source CSV file
+            df: Parsed DataFrame
+            options: Dict of loader options that affect the parsed result
+            signature: file_signature taken before the parse (read now if None)
+
+        Returns:
+            bool: True if the frame was cached
+        """
+        current = file_signature(filepath)
+        if signature is not None and signature != current:
+            return False
+        signature = current
+
+        key = self._make_key(filepath, options, signature)
+        filename = key + EXTENSIONS[self.file_format]
+        path = os.path.join(self.cache_dir, filename)
+
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp_path = path + ".tmp"
+            self._write_frame(df, tmp_path)
+            os.replace(tmp_path, path)
+        except Exception:
+            return False
+
+        source = os.path.abspath(filepath)
+        with self._lock:
+            index = self._read_index()
+
+            # Entries for an older version of the same file can never hit again
+            for stale_key, entry in list(index.items()):
+                if entry['source'] == source and entry['signature'] != signature:
+                    self._delete_entry(index, stale_key)
+
+            index[key] = {
+                'source': source,
+                'signature': signature,
+                'filename': filename,
+                'size': os.path.getsize(path),
+                'last_access': time.time(),
+                'attrs': _json_attrs(df),
+            }
+            self._evict(index, keep=key)
+            self._write_index(index)
+
+        return True
+
+    def clear(self):
+        """Remove every cached entry"""
+        with self._lock:
+            index = self._read_index()
+            for key in list(index):
+                self._delete_entry(index, key)
+            self._write_index(index)
+
+    def _make_key(self, filepath, options, signature):
+        """Hash the file identity and loader options into a cache key"""
+        payload = json.dumps(
+            {
+                'source': os.path.abspath(filepath),
+                'signature': signature,
+                'options': options or {},
+                'format': self.file_format,
+            },
+            sort_keys=True,
+            default=str
+        )
+        return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+    def _evict(self, index, keep):
+        """Drop least recently used entries until the cache fits its cap"""
+        total = sum(entry['size'] for entry in index.values())
+        by_age = sorted(index.items(), key=lambda item: item[1]['last_access'])
+
+        for key, entry in by_age:
+            if total <= self.max_bytes:
+                break
+            if key == keep:
+                continue
+            total -= entry['size']
+            self._delete_entry(index, key)
+
+    def _remove(self, key):
+        """Remove a single entry"""
+        with self._lock:
+            index = self._read_index()
+            if key in index:
+                self._delete_entry(index, key)
+                self._write_index(index)
+
+    def _delete_entry(self, index, key):
+        """Delete an entry's file and drop it from the index"""
+        entry = index.pop(key)
+        try:
+            os.remove(os.path.join(self.cache_dir, entry['filename']))
+        except OSError:
+            pass
+
+    def _read_index(self):
+        """Load the index of cached entries, with the access times of recent hits"""
+        try:
+            with open(os.path.join(self.cache_dir, INDEX_FILENAME), encoding="utf-8") as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+        for key, last_access in self._accessed.items():
+            if key in index:
+                index[key]['last_access'] = last_access
+        return index
+
+    def _write_index(self, index):
+        """Atomically replace the index file"""
+        self._accessed = {}
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = os.path.join(self.cache_dir, INDEX_FILENAME)
+        with open(path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(index, f)
+        os.replace(path + ".tmp", path)
+
+    def _read_frame(self, path):
+        """Read a cached frame in the configured format"""
+        if self.file_format == "feather":
+            from pyarrow import feather
+            # Memory-mapped read avoids copying the file into a buffer first
+            return feather.read_table(path, memory_map=True).to_pandas()
+        if self.file_format == "parquet":
+            return pd.read_parquet(path)
+        return pd.read_pickle(path)
+
+    def _write_frame(self, df, path):
+        """Write a frame in the configured format"""
+        if self.file_format == "feather":
+            df.to_feather(path)
+        elif self.file_format == "parquet":
+            df.to_parquet(path, index=False)
+        else:
+            df.to_pickle(path)
+
+
+def file_signature(filepath):
+    """Size and modification time identifying a version of a file"""
+    stat = os.stat(filepath)
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def _json_attrs(df):
+    """DataFrame attrs that survive a JSON round trip"""
+    return {
+        name: value for name, value in df.attrs.items()
+        if isinstance(value, (int, float, str, bool))
+    }
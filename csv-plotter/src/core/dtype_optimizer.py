@@ -0,0 +1,155 @@
+"""
+Dtype Optimizer
+Shrinks loaded DataFrames by choosing narrower column dtypes
+"""
+import importlib.util
+import numpy as np
+import pandas as pd
+from src.core.config import LOADER_SETTINGS
+
+
+def pyarrow_available():
+    """
+    Check whether pyarrow is installed (without importing it)
+
+    Returns:
+        bool: True if pyarrow can be imported
+    """
+    return importlib.util.find_spec("pyarrow") is not None
+
+
+def is_text_column(series):
+    """
+    Check whether a column holds text (object or string dtype)
+
+    Args:
+        series: pandas Series
+
+    Returns:
+        bool: True for object/string columns
+    """
+    return series.dtype == object or pd.api.types.is_string_dtype(series.dtype)
+
+
+def infer_load_profile(filepath, sample_rows=None, use_pyarrow_strings=None, usecols=None):
+    """
+    Sample the start of a CSV file and decide dtypes to parse it with
+
+    Only text columns are decided from the sample: low-cardinality ones
+    are read as 'category' and, optionally, the rest as pyarrow strings.
+    Numeric columns are downcast after parsing, because a sample cannot
+    prove that later rows fit a narrower type.
+
+    Args:
+        filepath: Path to CSV file
+        sample_rows: Rows to sample (defaults to LOADER_SETTINGS)
+        use_pyarrow_strings: Use 'string[pyarrow]' for high-cardinality text
+        usecols: Optional subset of columns that will be parsed
+
+    Returns:
+        dict: {'dtype': {column: dtype}, 'bytes_per_row': float}
+    """
+    sample_rows = sample_rows or LOADER_SETTINGS['dtype_sample_rows']
+    if use_pyarrow_strings is None:
+        use_pyarrow_strings = LOADER_SETTINGS['pyarrow_strings']
+
+    sample = pd.read_csv(filepath, nrows=sample_rows, usecols=usecols)
+
+    dtypes = {}
+    for col in sample.columns:
+        series = sample[col]
+        if not is_text_column(series):
+            continue
+
+        if _is_low_cardinality(series):
+            dtypes[col] = 'category'
+        elif use_pyarrow_strings and pyarrow_available():
+            dtypes[col] = 'string[pyarrow]'
+
+    # Memory per row with default dtypes, used to report savings
+    bytes_per_row = 0.0
+    if len(sample) > 0:
+        bytes_per_row = sample.memory_usage(deep=True, index=False).sum() / len(sample)
+
+    return {'dtype': dtypes, 'bytes_per_row': bytes_per_row}
+
+
+def downcast_numeric(df):
+    """
+    Downcast numeric columns to the narrowest dtype that holds them exactly
+
+    Integers become the smallest (u)int type; floats become float32 only
+    when no value changes in the conversion.
+
+    Args:
+        df: pandas DataFrame (modified in place)
+
+    Returns:
+        DataFrame: The same DataFrame
+    """
+    for col in df.columns:
+        series = df[col]
+        if pd.api.types.is_bool_dtype(series.dtype):
+            continue
+
+        if pd.api.types.is_integer_dtype(series.dtype):
+            kind = 'unsigned' if len(series) and series.min() >= 0 else 'integer'
+            df[col] = pd.to_numeric(series, downcast=kind)
+
+        elif pd.api.types.is_float_dtype(series.dtype) and series.dtype != np.float32:
+            values = series.to_numpy()
+            narrowed = values.astype(np.float32)
+            with np.errstate(invalid='ignore'):
+                exact = (narrowed.astype(values.dtype) == values) | np.isnan(values)
+            if exact.all():
+                df[col] = narrowed
+
+    return df
+
+
+def categorize_text(df):
+    """
+    Convert low-cardinality text columns to 'category'
+
+    Used for frames read from columnar files, whose text columns are
+    decoded before a dtype profile could be applied.
+
+    Args:
+        df: pandas DataFrame (modified in place)
+
+    Returns:
+        DataFrame: The same DataFrame
+    """
+    for col in df.columns:
+        series = df[col]
+        if is_text_column(series) and _is_low_cardinality(series):
+            df[col] = series.astype('category')
+
+    return df
+
+
+def estimate_memory_before(df, profile):
+    """
+    Estimate the memory the frame would take with pandas default dtypes
+
+    Args:
+        df: Optimized pandas DataFrame
+        profile: Load profile from infer_load_profile
+
+    Returns:
+        int: Estimated bytes
+    """
+    return int(profile['bytes_per_row'] * len(df))
+
+
+def _is_low_cardinality(series):
+    """Check if a text column has few enough distinct values for 'category'"""
+    non_null = series.count()
+    if non_null == 0:
+        return False
+
+    unique = series.nunique()
+    return (
+        unique <= LOADER_SETTINGS['category_max_unique']
+        and unique / non_null <= LOADER_SETTINGS['category_max_unique_ratio']
+    )
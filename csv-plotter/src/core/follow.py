@@ -0,0 +1,271 @@
+"""
+Follow
+Reads rows appended to a CSV file that is still being written
+"""
+import io
+import os
+import numpy as np
+import pandas as pd
+from src.core.config import LOADER_SETTINGS
+from src.core.row_index import row_offset, record_ends
+
+
+class FileReplacedError(Exception):
+    """Raised when a followed file was truncated or replaced (e.g. log rotation)"""
+
+
+class FileFollower:
+    """
+    Tracks how far a CSV file has been read and parses what was added since
+
+    Only bytes past the last read offset are read, and only up to the last
+    complete row: a row that is still being written stays in the file
+    until its newline arrives. A file that shrinks below the offset
+    (truncation) or is a different file than before (rotation) raises
+    FileReplacedError, because the rows already read no longer match it.
+    """
+
+    def __init__(self, filepath, columns, offset, text_columns=()):
+        """
+        Initialize follower (use resume to start from a loaded DataFrame)
+
+        Args:
+            filepath: Path to CSV file
+            columns: Column names (appended lines have no header)
+            offset: Byte offset of the first line not read yet
+            text_columns: Columns parsed as text instead of inferring a type
+        """
+        self.filepath = filepath
+        self.columns = list(columns)
+        self.offset = offset
+        self.dtypes = {col: object for col in text_columns}
+        self.file_id = _file_id(os.stat(filepath))
+
+    @classmethod
+    def resume(cls, filepath, rows, columns, text_columns=()):
+        """
+        Follow a file from the end of its first rows
+
+        Rows are counted as the parser counts them (see row_offset), so
+        quoted newlines and blank lines do not shift where following starts.
+
+        Args:
+            filepath: Path to CSV file
+            rows: Number of data rows already read
+            columns: Column names
+            text_columns: Columns parsed as text instead of inferring a type
+
+        Returns:
+            FileFollower: Follower whose next read starts after those rows
+
+        Raises:
+            FileReplacedError: If the file has fewer rows
+        """
+        offset = row_offset(filepath, rows + 1)  # Row 0 is the header
+        if offset is None:
+            raise FileReplacedError()
+        return cls(filepath, columns, offset, text_columns)
+
+    def read_appended(self, max_bytes=None):
+        """
+        Parse the complete rows appended since the last read
+
+        Args:
+            max_bytes: Most bytes read at once (defaults to LOADER_SETTINGS);
+                the rest is read by later calls
+
+        Returns:
+            DataFrame: New rows (empty if nothing complete was appended)
+
+        Raises:
+            FileReplacedError: If the file was truncated or replaced
+        """
+        max_bytes = max_bytes or LOADER_SETTINGS['follow_max_bytes']
+        try:
+            stat = os.stat(self.filepath)
+        except FileNotFoundError:
+            # Between a rotation's rename and the new file's creation
+            return self._empty()
+
+        if _file_id(stat) != self.file_id or stat.st_size < self.offset:
+            raise FileReplacedError()
+        if stat.st_size == self.offset:
+            return self._empty()
+
+        with open(self.filepath, 'rb') as handle:
+            handle.seek(self.offset)
+            data = handle.read(min(stat.st_size - self.offset, max_bytes))
+
+        # A partial last row is left for the next read; a newline inside a
+        # quoted field does not end it
+        ends, _ = record_ends(np.frombuffer(data, dtype=np.uint8))
+        if len(ends) == 0:
+            return self._empty()
+        end = int(ends[-1]) + 1
+        self.offset += end
+
+        try:
+            return pd.read_csv(
+                io.BytesIO(data[:end]),
+                header=None,
+                names=self.columns,
+                index_col=False,
+                dtype=self.dtypes
+            )
+        except pd.errors.EmptyDataError:
+            return self._empty()  # Only blank lines
+
+    def _empty(self):
+        """A frame with the followed columns and no rows"""
+        return pd.DataFrame(columns=self.columns)
+
+
+class GrowableFrame:
+    """
+    DataFrame columns in preallocated arrays that rows are appended to
+
+    Each column lives in a NumPy buffer with spare capacity. Appending
+    writes into the spare rows, and a full buffer grows by a constant
+    factor, so appending n rows costs O(n) overall instead of copying the
+    whole frame per append as pd.concat would. frame() returns a DataFrame
+    viewing the filled part of the buffers without copying numeric columns.
+
+    Numeric columns keep their (downcast) dtype while appended values fit
+    it exactly and are widened otherwise. Categorical columns keep integer
+    codes and gain categories as new values appear. Other columns are
+    stored as Python objects.
+    """
+
+    GROWTH_FACTOR = 1.5
+
+    def __init__(self, df, min_capacity=1024):
+        """
+        Copy a DataFrame into growable buffers
+
+        Args:
+            df: pandas DataFrame
+            min_capacity: Rows allocated at least
+        """
+        self.columns = list(df.columns)
+        self.length = len(df)
+        self.capacity = max(int(self.length * self.GROWTH_FACTOR), min_capacity)
+        self.categories = {}
+        self.buffers = {}
+
+        for col in self.columns:
+            series = df[col]
+            if isinstance(series.dtype, pd.CategoricalDtype):
+                self.categories[col] = series.cat.categories
+                values = series.cat.codes.to_numpy().astype(np.int32)
+            elif isinstance(series.dtype, np.dtype) and series.dtype.kind in 'biuf':
+                values = series.to_numpy()
+            else:
+                values = series.to_numpy(dtype=object)
+
+            buffer = np.empty(self.capacity, dtype=values.dtype)
+            buffer[:self.length] = values
+            self.buffers[col] = buffer
+
+    def __len__(self):
+        """Number of rows"""
+        return self.length
+
+    def text_columns(self):
+        """
+        Columns whose appended values should be parsed as text
+
+        Returns:
+            list: Categorical and object column names
+        """
+        return [col for col in self.columns
+                if col in self.categories or self.buffers[col].dtype == object]
+
+    def append(self, rows):
+        """
+        Append rows
+
+        Args:
+            rows: DataFrame with the same columns
+        """
+        count = len(rows)
+        if count == 0:
+            return
+
+        end = self.length + count
+        if end > self.capacity:
+            self._reserve(end)
+
+        for col in self.columns:
+            if col in self.categories:
+                values = self._encode(col, rows[col].to_numpy(dtype=object))
+            else:
+                values = rows[col].to_numpy()
+                dtype = _common_dtype(self.buffers[col].dtype, values)
+                if dtype != self.buffers[col].dtype:
+                    self.buffers[col] = self.buffers[col].astype(dtype)
+            self.buffers[col][self.length:end] = values
+
+        self.length = end
+
+    def frame(self):
+        """
+        The rows appended so far
+
+        Returns:
+            DataFrame: View of the buffers (later appends do not change it)
+        """
+        data = {}
+        for col in self.columns:
+            values = self.buffers[col][:self.length]
+            if col in self.categories:
+                data[col] = pd.Categorical.from_codes(
+                    values,
+                    dtype=pd.CategoricalDtype(self.categories[col]),
+                    validate=False
+                )
+            else:
+                data[col] = pd.Series(values, dtype=values.dtype, copy=False)
+        return pd.DataFrame(data, copy=False)
+
+    def _reserve(self, rows):
+        """Grow every buffer to hold at least this many rows"""
+        self.capacity = max(rows, int(self.capacity * self.GROWTH_FACTOR))
+        for col, buffer in self.buffers.items():
+            grown = np.empty(self.capacity, dtype=buffer.dtype)
+            grown[:self.length] = buffer[:self.length]
+            self.buffers[col] = grown
+
+    def _encode(self, col, values):
+        """Category codes of values, adding categories not seen before"""
+        categories = self.categories[col]
+        codes = categories.get_indexer(values)
+
+        unseen = (codes == -1) & pd.notna(values)
+        if unseen.any():
+            categories = categories.append(pd.Index(pd.unique(values[unseen])))
+            self.categories[col] = categories
+            codes[unseen] = categories.get_indexer(values[unseen])
+
+        return codes
+
+
+def _common_dtype(current, values):
+    """Narrowest dtype holding a buffer's values and the appended ones"""
+    if values.dtype == current or np.can_cast(values.dtype, current):
+        return current
+    if current == object or values.dtype == object:
+        return np.dtype(object)
+
+    # Keep a downcast dtype while the appended values fit it exactly
+    with np.errstate(all='ignore'):
+        same = values.astype(current) == values
+    if current.kind == 'f':
+        same |= np.isnan(values)
+    if same.all():
+        return current
+    return np.promote_types(current, values.dtype)
+
+
+def _file_id(stat):
+    """Identity of a file that survives appends but not replacement"""
+    return (stat.st_dev, stat.st_ino)
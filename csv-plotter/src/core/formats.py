@@ -0,0 +1,113 @@
+"""
+Formats
+Input file formats by extension (no pandas needed, so validators and
+file dialogs can use it at startup)
+"""
+import importlib.util
+import os
+
+
+# Extension → reader name (see csv_handler.READERS), compression of text
+# files, and the optional package the reader needs
+INPUT_FORMATS = {
+    ".csv": {"reader": "csv", "compression": None, "requires": None},
+    ".csv.gz": {"reader": "csv", "compression": "gzip", "requires": None},
+    ".csv.bz2": {"reader": "csv", "compression": "bz2", "requires": None},
+    ".csv.zst": {"reader": "csv", "compression": "zstd", "requires": "zstandard"},
+    ".parquet": {"reader": "parquet", "compression": None, "requires": "pyarrow"},
+    ".feather": {"reader": "arrow", "compression": None, "requires": "pyarrow"},
+    ".arrow": {"reader": "arrow", "compression": None, "requires": "pyarrow"},
+    ".ipc": {"reader": "arrow", "compression": None, "requires": "pyarrow"},
+}
+
+# Files with other extensions are read as plain CSV text
+DEFAULT_FORMAT = INPUT_FORMATS[".csv"]
+
+# Groups offered in the file dialog
+BROWSE_GROUPS = (
+    ("CSV files", ("csv",), False),
+    ("Compressed CSV", ("csv",), True),
+    ("Parquet", ("parquet",), False),
+    ("Feather / Arrow IPC", ("arrow",), False),
+)
+
+
+def input_format(filepath):
+    """
+    Look up how a file is read, by its (longest matching) extension
+
+    Args:
+        filepath: Path to the file
+
+    Returns:
+        dict: {'reader', 'compression', 'requires'}
+    """
+    name = os.path.basename(filepath).lower()
+    matches = [ext for ext in INPUT_FORMATS if name.endswith(ext)]
+    if not matches:
+        return DEFAULT_FORMAT
+    return INPUT_FORMATS[max(matches, key=len)]
+
+
+def is_plain_csv(filepath):
+    """
+    Check whether a file is uncompressed CSV text (byte offsets are rows)
+
+    Args:
+        filepath: Path to the file
+
+    Returns:
+        bool: True if rows can be found by scanning the file's bytes
+    """
+    file_format = input_format(filepath)
+    return file_format["reader"] == "csv" and file_format["compression"] is None
+
+
+def is_columnar(filepath):
+    """
+    Check whether a file is in a columnar binary format (Parquet, Arrow)
+
+    Args:
+        filepath: Path to the file
+
+    Returns:
+        bool: True if the file is not CSV text
+    """
+    return input_format(filepath)["reader"] != "csv"
+
+
+def missing_dependency(filepath):
+    """
+    Optional package needed to read a file that is not installed
+
+    Args:
+        filepath: Path to the file
+
+    Returns:
+        str: Package name, or None if the file can be read
+    """
+    package = input_format(filepath)["requires"]
+    if package is None or importlib.util.find_spec(package) is not None:
+        return None
+    return package
+
+
+def browse_filetypes():
+    """
+    File type filters for open dialogs
+
+    Returns:
+        list: (label, patterns) tuples, all supported formats first
+    """
+    groups = []
+    for label, readers, compressed in BROWSE_GROUPS:
+        extensions = [
+            ext for ext, file_format in INPUT_FORMATS.items()
+            if file_format["reader"] in readers
+            and (file_format["compression"] is not None) == compressed
+        ]
+        if extensions:
+            groups.append((label, " ".join(f"*{ext}" for ext in extensions)))
+
+    every = " ".join(f"*{ext}" for ext in INPUT_FORMATS)
+    return [("Data files", every)] + groups + [("All files", "*.*")]
@@ -0,0 +1,348 @@
+"""
+Row Index
+Byte offsets of CSV rows for reading any row range without a full parse
+"""
+import hashlib
+import io
+import json
+import mmap
+import os
+from collections import OrderedDict
+import numpy as np
+import pandas as pd
+from src.core.config import CACHE_SETTINGS, LOADER_SETTINGS
+from src.core.data_cache import file_signature
+
+
+# Bytes scanned per step when building an index
+SCAN_BLOCK_BYTES = 64 * 1024 * 1024
+
+INDEX_SUBDIR = "row-index"
+
+
+class RowIndex:
+    """
+    Sparse index of where rows start in a CSV file
+
+    One scan over the memory-mapped file finds every newline; the byte
+    offset of every `stride`-th data row is kept in an int64 array (8 bytes
+    per stride rows), so any row range can be read by seeking to the
+    nearest indexed row. Each line is assumed to hold one row: quoted
+    fields containing newlines are not supported.
+    """
+
+    def __init__(self, filepath, offsets, row_count, stride):
+        """
+        Initialize from scan results (use build or open instead)
+
+        Args:
+            filepath: Path to CSV file
+            offsets: int64 array; offsets[i] is where data row i * stride starts
+            row_count: Number of data rows (lines after the header)
+            stride: Rows between indexed offsets
+        """
+        self.filepath = filepath
+        self.offsets = offsets
+        self.row_count = row_count
+        self.stride = stride
+        self.file_size = os.path.getsize(filepath)
+
+    @classmethod
+    def build(cls, filepath, stride=None, progress_callback=None, cancel_event=None):
+        """
+        Scan a file for row offsets
+
+        Args:
+            filepath: Path to CSV file
+            stride: Rows between indexed offsets (defaults to LOADER_SETTINGS)
+            progress_callback: Optional callable(bytes_scanned, total_bytes)
+            cancel_event: Optional threading.Event; scanning stops when set
+
+        Returns:
+            RowIndex: The index, or None if cancel_event was set
+        """
+        stride = stride or LOADER_SETTINGS['row_index_stride']
+        size = os.path.getsize(filepath)
+        if size == 0:
+            return cls(filepath, np.empty(0, dtype=np.int64), 0, stride)
+
+        picks = []
+        newlines = 0
+
+        with open(filepath, 'rb') as handle, \
+                mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            for start in range(0, size, SCAN_BLOCK_BYTES):
+                if cancel_event is not None and cancel_event.is_set():
+                    return None
+
+                block = np.frombuffer(
+                    mapped, dtype=np.uint8,
+                    count=min(SCAN_BLOCK_BYTES, size - start), offset=start
+                )
+                # Line k + 1 (data row k) starts after the (k + 1)-th newline
+                positions = np.flatnonzero(block == ord('\n'))
+                first = (-newlines) % stride
+                picks.append(positions[first::stride] + (start + 1))
+                newlines += len(positions)
+                # The buffer must be released before the map is closed
+                del block, positions
+
+                if progress_callback is not None:
+                    progress_callback(min(start + SCAN_BLOCK_BYTES, size), size)
+
+            ends_with_newline = mapped[size - 1:size] == b'\n'
+
+        offsets = np.concatenate(picks).astype(np.int64)
+        offsets = offsets[offsets < size]  # A trailing newline starts no row
+
+        lines = newlines if ends_with_newline else newlines + 1
+        return cls(filepath, offsets, max(lines - 1, 0), stride)
+
+    @classmethod
+    def open(cls, filepath, stride=None, index_dir=None, progress_callback=None,
+             cancel_event=None):
+        """
+        Load a saved index for the current version of a file, or build and save one
+        Saving an index deletes those saved for earlier versions of the file.
+
+        Args:
+            filepath: Path to CSV file
+            stride: Rows between indexed offsets (defaults to LOADER_SETTINGS)
+            index_dir: Directory for saved indexes (defaults to next to the cache)
+            progress_callback: Optional callable(bytes_scanned, total_bytes)
+            cancel_event: Optional threading.Event; scanning stops when set
+
+        Returns:
+            RowIndex: The index, or None if cancel_event was set
+        """
+        stride = stride or LOADER_SETTINGS['row_index_stride']
+        path = _index_path(filepath, stride, index_dir)
+
+        try:
+            with np.load(path) as saved:
+                return cls(filepath, saved['offsets'], int(saved['row_count']), stride)
+        except (OSError, KeyError, ValueError):
+            pass
+
+        index = cls.build(filepath, stride, progress_callback, cancel_event)
+        if index is not None:
+            index.save(path)
+            _remove_stale_indexes(path)
+        return index
+
+    def save(self, path):
+        """
+        Write the index to disk (best-effort)
+
+        Args:
+            path: Destination .npz file
+        """
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = path + ".tmp.npz"
+            np.savez(tmp_path, offsets=self.offsets, row_count=self.row_count)
+            os.replace(tmp_path, path)
+        except OSError:
+            pass
+
+    def byte_range(self, block):
+        """
+        Bytes holding one block of `stride` rows
+
+        Args:
+            block: Block number (rows block * stride onwards)
+
+        Returns:
+            tuple: (start, end) byte offsets
+        """
+        start = self.offsets[block]
+        end = self.offsets[block + 1] if block + 1 < len(self.offsets) else self.file_size
+        return int(start), int(end)
+
+
+class RowRangeReader:
+    """
+    Parses arbitrary row ranges of a CSV file through a RowIndex
+
+    Rows are parsed one index block at a time and recently used blocks
+    are kept, so paging back and forth through a huge file only parses
+    what is on screen. Offers the small part of the DataFrame interface
+    the data grid needs (len, columns, read_rows).
+    """
+
+    def __init__(self, row_index, max_cached_blocks=64):
+        """
+        Initialize reader
+
+        Args:
+            row_index: RowIndex of the file
+            max_cached_blocks: Parsed blocks kept in memory
+        """
+        self.row_index = row_index
+        self.filepath = row_index.filepath
+        self.max_cached_blocks = max_cached_blocks
+        self.columns = pd.read_csv(self.filepath, nrows=0).columns
+        self._blocks = OrderedDict()
+
+    def __len__(self):
+        """Number of data rows in the file"""
+        return self.row_index.row_count
+
+    def read_rows(self, start, stop):
+        """
+        Parse rows [start, stop) of the file
+
+        Args:
+            start: First row position
+            stop: One-past-last row position
+
+        Returns:
+            DataFrame: The rows, indexed by row position
+        """
+        start = max(start, 0)
+        stop = min(stop, len(self))
+        if start >= stop:
+            return pd.DataFrame(columns=self.columns)
+
+        stride = self.row_index.stride
+        blocks = [self._block(b) for b in range(start // stride, (stop - 1) // stride + 1)]
+        rows = pd.concat(blocks) if len(blocks) > 1 else blocks[0]
+        return rows.loc[start:stop - 1]
+
+    def _block(self, block):
+        """Parse (or reuse) one index block of rows"""
+        if block in self._blocks:
+            self._blocks.move_to_end(block)
+            return self._blocks[block]
+
+        start, end = self.row_index.byte_range(block)
+        with open(self.filepath, 'rb') as handle:
+            handle.seek(start)
+            data = handle.read(end - start)
+
+        rows = pd.read_csv(io.BytesIO(data), header=None, names=self.columns)
+        first_row = block * self.row_index.stride
+        rows.index = pd.RangeIndex(first_row, first_row + len(rows))
+
+        self._blocks[block] = rows
+        if len(self._blocks) > self.max_cached_blocks:
+            self._blocks.popitem(last=False)
+        return rows
+
+
+def row_offset(filepath, row):
+    """
+    Byte offset where a row of a CSV file starts
+
+    Scans the memory-mapped file like RowIndex.build, but counts rows the
+    way the parser does: a newline inside a quoted field does not end a
+    row, and blank lines are skipped. Stops as soon as the row is found.
+
+    Args:
+        filepath: Path to CSV file
+        row: Row number (0 is the header)
+
+    Returns:
+        int: Offset of the row's first byte, or None if the file has fewer
+            complete rows before it
+    """
+    if row == 0:
+        return 0
+
+    size = os.path.getsize(filepath)
+    if size == 0:
+        return None
+
+    rows = 0
+    quotes = 0
+    with open(filepath, 'rb') as handle, \
+            mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        data = np.frombuffer(mapped, dtype=np.uint8)
+        try:
+            for start in range(0, size, SCAN_BLOCK_BYTES):
+                ends, quotes = record_ends(data[start:start + SCAN_BLOCK_BYTES], quotes)
+                ends = _skip_blank_lines(data, ends + start)
+
+                # The row starts after the newline ending the row before it
+                if rows + len(ends) >= row:
+                    return int(ends[row - rows - 1]) + 1
+                rows += len(ends)
+        finally:
+            del data
+
+    return None
+
+
+def record_ends(data, quotes=0):
+    """
+    Positions of the newlines that end CSV records
+
+    A newline preceded by an odd number of quote characters is inside a
+    quoted field and does not end a record.
+
+    Args:
+        data: uint8 NumPy array of file bytes
+        quotes: Quote characters before data (only its parity matters)
+
+    Returns:
+        tuple: (int64 array of newline positions in data, quotes counted
+            up to the end of data)
+    """
+    newlines = np.flatnonzero(data == ord('\n'))
+    quote_positions = np.flatnonzero(data == ord('"'))
+    if len(quote_positions) or quotes % 2:
+        before = quotes + np.searchsorted(quote_positions, newlines)
+        newlines = newlines[before % 2 == 0]
+    return newlines, quotes + len(quote_positions)
+
+
+def _skip_blank_lines(data, ends):
+    """Drop the newlines ending blank lines (empty or a lone carriage return)"""
+    before = data[np.maximum(ends - 1, 0)]
+    before[ends < 1] = ord('\n')
+    second = data[np.maximum(ends - 2, 0)]
+    second[ends < 2] = ord('\n')
+
+    blank = (before == ord('\n')) | (before == ord('\r')) & (second == ord('\n'))
+    return ends[~blank]
+
+
+def _index_path(filepath, stride, index_dir=None):
+    """
+    Where the index of the current version of a file is saved
+
+    Named '<source hash>-<version hash>.npz', so indexes of other versions
+    of the same file share the prefix.
+    """
+    index_dir = index_dir or os.path.join(CACHE_SETTINGS['cache_dir'], INDEX_SUBDIR)
+    version = json.dumps(
+        {'signature': file_signature(filepath), 'stride': stride},
+        sort_keys=True
+    )
+    return os.path.join(
+        index_dir, f"{_sha1(os.path.abspath(filepath))}-{_sha1(version)}.npz"
+    )
+
+
+def _remove_stale_indexes(path):
+    """Delete saved indexes of other versions of the file indexed at path"""
+    directory, name = os.path.split(path)
+    prefix = name.split("-")[0] + "-"
+    try:
+        others = os.listdir(directory)
+    except OSError:
+        return
+
+    for other in others:
+        if other == name or not other.endswith(".npz") or ".tmp" in other:
+            continue
+        if other.startswith(prefix):
+            try:
+                os.remove(os.path.join(directory, other))
+            except OSError:
+                pass
+
+
+def _sha1(text):
+    """Hex SHA-1 of a string"""
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
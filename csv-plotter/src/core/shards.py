@@ -0,0 +1,219 @@
+"""
+Shards
+Loads a dataset split over many CSV files (e.g. one per day) as one DataFrame
+"""
+import glob
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import numpy as np
+import pandas as pd
+from pandas.api.types import union_categoricals
+from src.core.config import LOADER_SETTINGS
+from src.core.csv_handler import LoadCancelledError
+
+
+# Characters that make a source a glob pattern rather than a path
+GLOB_CHARACTERS = "*?["
+
+
+def expand_sources(sources, pattern=None):
+    """
+    Turn files, directories and glob patterns into a list of files
+
+    Args:
+        sources: Paths; a directory stands for its files matching pattern,
+            and a path containing * ? or [ is expanded as a glob
+            (** matches subdirectories)
+        pattern: File pattern used inside directories
+            (defaults to LOADER_SETTINGS['shard_pattern'])
+
+    Returns:
+        list: File paths in source order, each directory and glob sorted
+            by name, without duplicates
+    """
+    pattern = pattern or LOADER_SETTINGS['shard_pattern']
+    files = []
+    for source in sources:
+        if os.path.isdir(source):
+            matches = sorted(glob.glob(os.path.join(source, pattern)))
+        elif any(char in source for char in GLOB_CHARACTERS):
+            matches = sorted(glob.glob(source, recursive=True))
+        else:
+            matches = [source]  # Checked later by validate_file_path
+        files.extend(path for path in matches if not os.path.isdir(path))
+
+    return list(dict.fromkeys(files))
+
+
+def load_shards(filepaths, load_shard, progress_callback=None, cancel_event=None,
+                workers=None):
+    """
+    Load files concurrently
+
+    Shards are parsed on a thread pool: pandas' parser releases the GIL
+    for most of its work, and frames do not have to be copied back from
+    worker processes.
+
+    Args:
+        filepaths: CSV file paths
+        load_shard: Callable(filepath) returning a DataFrame (e.g. a
+            cache lookup falling back to a parse); it should parse in the
+            calling thread, as every thread of the pool runs one
+        progress_callback: Optional callable(bytes_read, total_bytes, rows_read),
+            called as each file finishes
+        cancel_event: Optional threading.Event; loading stops when it is set
+        workers: Threads (defaults to LOADER_SETTINGS['shard_workers'])
+
+    Returns:
+        list: DataFrames in the order of filepaths
+
+    Raises:
+        LoadCancelledError: If cancel_event was set during the load
+    """
+    workers = workers or LOADER_SETTINGS['shard_workers'] or min(32, (os.cpu_count() or 1) + 4)
+    sizes = [os.path.getsize(path) for path in filepaths]
+    total_bytes = sum(sizes)
+    bytes_read = rows_read = 0
+    frames = [None] * len(filepaths)
+
+    with ThreadPoolExecutor(max_workers=min(workers, len(filepaths))) as pool:
+        futures = {pool.submit(load_shard, path): i for i, path in enumerate(filepaths)}
+        for future in as_completed(futures):
+            if cancel_event is not None and cancel_event.is_set():
+                pool.shutdown(wait=False, cancel_futures=True)
+                raise LoadCancelledError()
+
+            i = futures[future]
+            try:
+                frames[i] = future.result()
+            except Exception as e:
+                pool.shutdown(wait=False, cancel_futures=True)
+                raise ValueError(f"{os.path.basename(filepaths[i])}: {str(e)}") from e
+
+            bytes_read += sizes[i]
+            rows_read += len(frames[i])
+            if progress_callback is not None:
+                progress_callback(bytes_read, total_bytes, rows_read)
+
+    return frames
+
+
+def combine_shards(frames, filepaths, source_column=None):
+    """
+    Concatenate shards into one DataFrame tagged with each row's file
+
+    Args:
+        frames: DataFrames, one per file (modified in place)
+        filepaths: The files the frames came from
+        source_column: Name of the tag column (defaults to
+            LOADER_SETTINGS['source_column']; a suffix is added if the
+            data already has a column of that name)
+
+    Returns:
+        DataFrame: All rows, with a categorical source column holding
+            each file's path relative to the files' common directory
+    """
+    frames = reconcile_dtypes(frames)
+    df = pd.concat(frames, ignore_index=True)
+
+    name = source_column or LOADER_SETTINGS['source_column']
+    while name in df.columns:
+        name += "_"
+
+    codes = np.repeat(
+        np.arange(len(frames), dtype=np.int32),
+        [len(frame) for frame in frames]
+    )
+    df[name] = pd.Categorical.from_codes(codes, categories=shard_labels(filepaths))
+
+    df.attrs['source_files'] = list(filepaths)
+    return df
+
+
+def reconcile_dtypes(frames):
+    """
+    Give every shard the same columns and dtypes
+
+    Each shard's dtypes are inferred from its own rows, so the same column
+    may be int8 in one file and float32 or text in another, and a column
+    may be missing from some files. Concatenating such frames would upcast
+    to object or fail; instead every column is cast to one dtype holding
+    all shards' values, and missing columns are filled with NA.
+
+    Args:
+        frames: DataFrames (modified in place)
+
+    Returns:
+        list: The frames
+    """
+    if len(frames) < 2:
+        return frames
+
+    columns = list(dict.fromkeys(col for frame in frames for col in frame.columns))
+    for col in columns:
+        present = [frame[col] for frame in frames if col in frame.columns]
+        target = _common_dtype(present, missing=len(present) < len(frames))
+
+        for frame in frames:
+            if col not in frame.columns:
+                frame[col] = pd.Series(index=frame.index, dtype=target)
+            elif frame[col].dtype != target:
+                frame[col] = frame[col].astype(target)
+
+    # Same column order everywhere
+    return [frame[columns] for frame in frames]
+
+
+def shard_labels(filepaths):
+    """
+    Short, unique names for files: paths relative to their common directory
+
+    Args:
+        filepaths: File paths
+
+    Returns:
+        list: One label per file
+    """
+    paths = [os.path.abspath(path) for path in filepaths]
+    if len(paths) == 1:
+        return [os.path.basename(paths[0])]
+    root = os.path.commonpath(paths)
+    return [os.path.relpath(path, root) for path in paths]
+
+
+def _common_dtype(series, missing=False):
+    """
+    Dtype that holds the values of all series
+
+    Categoricals get the union of their categories. Numeric columns get the
+    smallest NumPy type holding every shard's type (float if some shards
+    lack the column, so it can hold NA). A column that is text in some
+    shards and numeric in others becomes text, as one parse of all the
+    rows would make it. Shards without rows (a header-only file parses to
+    object columns) do not take part unless no shard has rows.
+    """
+    if any(len(s) for s in series):
+        series = [s for s in series if len(s)]
+    dtypes = [s.dtype for s in series]
+    first = dtypes[0]
+
+    if all(isinstance(dtype, pd.CategoricalDtype) for dtype in dtypes):
+        categories = union_categoricals(list(series), ignore_order=True).categories
+        return pd.CategoricalDtype(categories)
+
+    if all(isinstance(dtype, np.dtype) and dtype.kind in 'biuf' for dtype in dtypes):
+        common = np.result_type(*dtypes)
+        if missing and common.kind in 'biu':
+            return np.dtype(object) if common.kind == 'b' else np.dtype('float64')
+        return common
+
+    if all(dtype == first for dtype in dtypes):
+        return first
+
+    # Text in some shards (as categories or strings): strings everywhere,
+    # numbers included, as single-file loads do for mixed columns
+    text = [
+        dtype for dtype in dtypes
+        if not isinstance(dtype, pd.CategoricalDtype) and pd.api.types.is_string_dtype(dtype)
+    ]
+    return text[0] if text else "str"
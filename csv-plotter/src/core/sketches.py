@@ -0,0 +1,393 @@
+"""
+Sketches
+Mergeable summaries for computing statistics chunk by chunk
+"""
+import numpy as np
+import pandas as pd
+
+
+class MomentsSketch:
+    """
+    Count, mean, variance, min and max of several columns at once
+
+    Each update reduces a 2-D block (rows x columns) in a few vectorized
+    operations and merges it into the running totals with Chan's parallel
+    form of Welford's algorithm, so results are exact and numerically
+    stable no matter how the data is split into chunks.
+    """
+
+    def __init__(self, width):
+        """
+        Initialize an empty sketch
+
+        Args:
+            width: Number of columns
+        """
+        self.count = np.zeros(width)
+        self.mean = np.zeros(width)
+        self.m2 = np.zeros(width)
+        self.min = np.full(width, np.nan)
+        self.max = np.full(width, np.nan)
+
+    def update(self, block):
+        """
+        Add a block of rows
+
+        Args:
+            block: 2-D float array (rows x columns), NaN for missing values
+        """
+        if len(block) == 0:
+            return
+        missing = np.isnan(block)
+
+        if missing.any():
+            count = len(block) - missing.sum(axis=0)
+            filled = np.where(missing, 0.0, block)
+            with np.errstate(invalid='ignore', divide='ignore'):
+                mean = np.nan_to_num(filled.sum(axis=0) / count)
+            deviation = np.where(missing, 0.0, block - mean)
+        else:
+            count = np.full(block.shape[1], len(block))
+            mean = block.mean(axis=0)
+            deviation = block - mean
+        m2 = np.einsum('ij,ij->j', deviation, deviation)
+
+        # fmin/fmax ignore NaN, so all-missing columns stay NaN
+        self.min = np.fmin(self.min, np.fmin.reduce(block, axis=0))
+        self.max = np.fmax(self.max, np.fmax.reduce(block, axis=0))
+        self._combine(count, mean, m2)
+
+    def merge(self, other):
+        """
+        Add the data summarized by another sketch of the same columns
+
+        Args:
+            other: MomentsSketch
+        """
+        self.min = np.fmin(self.min, other.min)
+        self.max = np.fmax(self.max, other.max)
+        self._combine(other.count, other.mean, other.m2)
+
+    def means(self):
+        """
+        Returns:
+            ndarray: Mean per column (NaN if a column has no values)
+        """
+        return np.where(self.count > 0, self.mean, np.nan)
+
+    def stds(self):
+        """
+        Returns:
+            ndarray: Sample standard deviation per column (ddof=1)
+        """
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return np.where(self.count > 1, np.sqrt(self.m2 / (self.count - 1)), np.nan)
+
+    def _combine(self, count, mean, m2):
+        """Merge partial count/mean/M2 into the running totals"""
+        total = self.count + count
+        safe_total = np.where(total > 0, total, 1)
+        delta = mean - self.mean
+        self.mean = self.mean + delta * count / safe_total
+        self.m2 = self.m2 + m2 + delta * delta * self.count * count / safe_total
+        self.count = total
+
+
+class KLLSketch:
+    """
+    Streaming quantile sketch (Karnin, Lang & Liberty)
+
+    Values are kept in levels of compactors; an item at level h stands
+    for 2**h input values. A full level is sorted and every other item
+    (random offset) is promoted to the next level. Lower levels get
+    geometrically smaller capacities, so memory stays around 3 * k items
+    while quantiles keep a bounded rank error (see rank_error).
+    """
+
+    def __init__(self, k=200, seed=None):
+        """
+        Initialize an empty sketch
+
+        Args:
+            k: Size of the top compactor; larger is more accurate
+            seed: Optional seed for the compaction offsets
+        """
+        self.k = k
+        self.count = 0
+        self.levels = [np.empty(0)]
+        self._rng = np.random.default_rng(seed)
+
+    def update(self, values):
+        """
+        Add values (NaN values are ignored)
+
+        Args:
+            values: 1-D float array
+        """
+        values = values[~np.isnan(values)]
+        if len(values) == 0:
+            return
+        self.count += len(values)
+        self.levels[0] = np.concatenate([self.levels[0], values])
+        self._compress()
+
+    def merge(self, other):
+        """
+        Add the values summarized by another sketch
+
+        Args:
+            other: KLLSketch
+        """
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0))
+        for level, items in enumerate(other.levels):
+            self.levels[level] = np.concatenate([self.levels[level], items])
+        self.count += other.count
+        self._compress()
+
+    def quantile(self, q):
+        """
+        Estimate a quantile
+
+        Args:
+            q: Quantile in [0, 1] (0.5 is the median)
+
+        Returns:
+            float: Estimated value (NaN if the sketch is empty)
+        """
+        if self.count == 0:
+            return np.nan
+
+        values = np.concatenate(self.levels)
+        weights = np.concatenate([
+            np.full(len(items), 2.0 ** level) for level, items in enumerate(self.levels)
+        ])
+        order = np.argsort(values, kind='stable')
+        cumulative = np.cumsum(weights[order])
+        position = np.searchsorted(cumulative, q * cumulative[-1], side='left')
+        return float(values[order][min(position, len(values) - 1)])
+
+    def rank_error(self):
+        """
+        Normalized rank error of quantile estimates
+
+        Returns:
+            float: Error as a fraction of the number of values (~99% confidence)
+        """
+        return kll_rank_error(self.k)
+
+    def _capacity(self, level):
+        """Capacity of a level; the top level holds k items"""
+        depth = len(self.levels) - level - 1
+        return max(int(np.ceil(self.k * (2 / 3) ** depth)), 2)
+
+    def _compress(self):
+        """Compact the lowest over-full levels until everything fits"""
+        while True:
+            size = sum(len(items) for items in self.levels)
+            capacity = sum(self._capacity(level) for level in range(len(self.levels)))
+            if size <= capacity:
+                return
+
+            for level, items in enumerate(self.levels):
+                if len(items) > self._capacity(level):
+                    self._compact(level)
+                    break
+
+    def _compact(self, level):
+        """Promote every other sorted item of a level to the next one"""
+        items = np.sort(self.levels[level])
+        if level + 1 == len(self.levels):
+            self.levels.append(np.empty(0))
+
+        # With an odd count one item stays behind at this level
+        leftover = items[len(items) - len(items) % 2:]
+        pairs = items[:len(items) - len(leftover)]
+        promoted = pairs[self._rng.integers(2)::2]
+
+        self.levels[level + 1] = np.concatenate([self.levels[level + 1], promoted])
+        self.levels[level] = leftover
+
+
+class HyperLogLog:
+    """
+    Distinct-count sketch (Flajolet et al.)
+
+    Each value is hashed once; the first `precision` bits choose one of
+    2**precision registers, which keeps the longest run of leading zeros
+    seen in the rest of the hash. Registers merge with an element-wise max.
+    """
+
+    def __init__(self, precision=12):
+        """
+        Initialize an empty sketch
+
+        Args:
+            precision: Register index bits (4-18); 12 gives ~1.6% error in 4 KB
+        """
+        self.precision = precision
+        self.registers = np.zeros(1 << precision, dtype=np.uint8)
+
+    def update(self, series):
+        """
+        Add the non-missing values of a column
+
+        Args:
+            series: pandas Series
+        """
+        series = series.dropna()
+        if len(series) == 0:
+            return
+        hashes = pd.util.hash_pandas_object(series, index=False).to_numpy()
+        self.update_hashes(hashes)
+
+    def update_hashes(self, hashes):
+        """
+        Add pre-computed 64-bit hashes
+
+        Args:
+            hashes: 1-D uint64 array
+        """
+        rest_bits = 64 - self.precision
+        index = (hashes >> np.uint64(rest_bits)).astype(np.intp)
+        rest = hashes & np.uint64((1 << rest_bits) - 1)
+
+        # frexp's exponent is the bit length (0 for 0); rank = leading zeros + 1
+        bit_length = np.frexp(rest.astype(np.float64))[1]
+        rank = (rest_bits - bit_length + 1).astype(np.uint8)
+        np.maximum.at(self.registers, index, rank)
+
+    def merge(self, other):
+        """
+        Add the values summarized by another sketch of the same precision
+
+        Args:
+            other: HyperLogLog
+        """
+        np.maximum(self.registers, other.registers, out=self.registers)
+
+    def estimate(self):
+        """
+        Estimate the number of distinct values
+
+        Returns:
+            int: Estimated distinct count
+        """
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        raw = alpha * m * m / np.sum(np.ldexp(1.0, -self.registers.astype(np.int64)))
+
+        # Small-range correction: linear counting while registers are empty
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if raw <= 2.5 * m and zeros > 0:
+            return int(round(m * np.log(m / zeros)))
+        return int(round(raw))
+
+    def relative_error(self):
+        """
+        Returns:
+            float: Standard error of estimate() as a fraction
+        """
+        return hll_relative_error(self.precision)
+
+
+class DistinctSketch:
+    """
+    Distinct count that is exact for low-cardinality columns
+
+    Distinct values are collected exactly until there are more than
+    `limit` of them (so short value lists can still be shown); beyond
+    that only the HyperLogLog estimate is available.
+    """
+
+    def __init__(self, limit=10, precision=12):
+        """
+        Initialize an empty sketch
+
+        Args:
+            limit: Largest number of distinct values kept exactly
+            precision: HyperLogLog precision
+        """
+        self.limit = limit
+        self.values = {}
+        self.overflowed = False
+        self.hll = HyperLogLog(precision)
+
+    def update(self, series):
+        """
+        Add a column chunk
+
+        Args:
+            series: pandas Series
+        """
+        self.hll.update(series)
+        if not self.overflowed:
+            self._collect(series.dropna().unique())
+
+    def merge(self, other):
+        """
+        Add the values summarized by another sketch
+
+        Args:
+            other: DistinctSketch
+        """
+        self.hll.merge(other.hll)
+        if other.overflowed:
+            self.overflowed = True
+            self.values = {}
+        elif not self.overflowed:
+            self._collect(list(other.values))
+
+    def is_exact(self):
+        """
+        Returns:
+            bool: True if count() is exact
+        """
+        return not self.overflowed
+
+    def count(self):
+        """
+        Returns:
+            int: Number of distinct non-missing values (estimated if not exact)
+        """
+        if self.overflowed:
+            return self.hll.estimate()
+        return len(self.values)
+
+    def _collect(self, values):
+        """Add distinct values in order of appearance, up to the limit"""
+        for value in values:
+            self.values.setdefault(value, None)
+            if len(self.values) > self.limit:
+                self.overflowed = True
+                self.values = {}
+                return
+
+
+def kll_rank_error(k):
+    """
+    Normalized rank error of a KLL sketch
+
+    Empirical fit used by Apache DataSketches for single quantile
+    queries at ~99% confidence.
+
+    Args:
+        k: KLL size parameter
+
+    Returns:
+        float: Error as a fraction of the number of values
+    """
+    return 2.296 / k ** 0.9723
+
+
+def hll_relative_error(precision):
+    """
+    Standard error of a HyperLogLog estimate
+
+    Args:
+        precision: Register index bits
+
+    Returns:
+        float: 1.04 / sqrt(number of registers)
+    """
+    return 1.04 / np.sqrt(1 << precision)
@@ -0,0 +1,402 @@
+"""
+Stats
+Vectorized summary statistics for the Statistics tab
+"""
+import numpy as np
+import pandas as pd
+from src.core.config import STATS_SETTINGS
+from src.core.sketches import (
+    MomentsSketch,
+    KLLSketch,
+    DistinctSketch,
+    kll_rank_error,
+    hll_relative_error
+)
+
+
+NUMERIC_STATS = ['count', 'mean', 'median', 'std', 'min', 'max', 'missing']
+TEXT_STATS = ['count', 'unique', 'missing']
+
+# Columns with at most this many distinct values list them
+MAX_LISTED_VALUES = 10
+
+# Cells per row chunk in numeric_moments (2 MiB of float64)
+STATS_CHUNK_CELLS = 262_144
+
+# Rows sampled to estimate the size of Python string columns
+MEMORY_SAMPLE_ROWS = 10_000
+
+
+def compute_statistics(df, approximate=False, accumulator=None):
+    """
+    Summarize a DataFrame for display
+
+    Collects everything iter_statistics yields into one result.
+
+    Args:
+        df: pandas DataFrame
+        approximate: Use sketches for the median and distinct counts
+        accumulator: Optional StatisticsAccumulator already fed with every
+            row of df (e.g. during a streaming load)
+
+    Returns:
+        dict: The summary from iter_statistics plus {
+            'numeric': DataFrame indexed by column with NUMERIC_STATS,
+            'text': DataFrame indexed by column with TEXT_STATS,
+            'values': {column: distinct values} for low-cardinality text,
+            'estimated_unique': Set of columns whose distinct count is estimated
+        }
+    """
+    stats = None
+    numeric = {}
+    text = {}
+    values = {}
+    estimated_unique = set()
+
+    for kind, *payload in iter_statistics(df, approximate, accumulator):
+        if kind == 'summary':
+            stats = payload[0]
+        elif kind == 'numeric':
+            column, row = payload
+            numeric[column] = row
+        else:
+            column, row = payload
+            text[column] = {name: row[name] for name in TEXT_STATS}
+            if row['values'] is not None:
+                values[column] = row['values']
+            if row['estimated']:
+                estimated_unique.add(column)
+
+    stats.update({
+        'numeric': pd.DataFrame.from_dict(numeric, orient='index', columns=NUMERIC_STATS),
+        'text': pd.DataFrame.from_dict(text, orient='index', columns=TEXT_STATS),
+        'values': values,
+        'estimated_unique': estimated_unique,
+    })
+    return stats
+
+
+def iter_statistics(df, approximate=False, accumulator=None):
+    """
+    Compute statistics piece by piece so they can be shown as they arrive
+
+    Numeric aggregates come from a single chunked pass over the numeric
+    block, missing counts are derived from the non-null counts rather than
+    a separate isna() scan, cardinality is computed once per text column
+    and string memory is estimated from a sample. Only the exact median
+    and distinct counts are left to the per-column steps.
+
+    In approximate mode the median comes from a KLL sketch and distinct
+    counts from HyperLogLog (see StatisticsAccumulator); counts, mean,
+    standard deviation, min and max stay exact.
+
+    Args:
+        df: pandas DataFrame
+        approximate: Use sketches for the median and distinct counts
+        accumulator: Optional StatisticsAccumulator already fed with every
+            row of df (e.g. during a streaming load); built from df if
+            missing or out of date
+
+    Yields:
+        tuple: First ('summary', {
+                'rows', 'columns': Frame shape,
+                'memory_bytes': Memory usage in bytes,
+                'memory_estimated': True if string columns were sampled,
+                'memory_before': Size before dtype optimization (0 if unknown),
+                'dtypes': {column: dtype name},
+                'approximate': True if sketches are used,
+                'median_error': Normalized rank error of medians (0 if exact),
+                'unique_error': Relative standard error of estimated distinct counts
+            }),
+            then ('numeric', column, {NUMERIC_STATS}) per numeric column,
+            then ('text', column, {TEXT_STATS, 'values', 'estimated'}) per
+            other column; 'values' lists the distinct values of
+            low-cardinality columns (else None) and 'estimated' is True if
+            'unique' is a sketch estimate
+    """
+    rows = len(df)
+    memory_bytes, memory_estimated = estimate_memory(df)
+
+    if approximate and (accumulator is None or accumulator.rows != rows):
+        accumulator = StatisticsAccumulator.from_dataframe(df)
+
+    yield ('summary', {
+        'rows': rows,
+        'columns': len(df.columns),
+        'memory_bytes': memory_bytes,
+        'memory_estimated': memory_estimated,
+        'memory_before': df.attrs.get('memory_before', 0),
+        'dtypes': {col: str(dtype) for col, dtype in df.dtypes.items()},
+        'approximate': approximate,
+        'median_error': accumulator.median_error() if approximate else 0.0,
+        'unique_error': accumulator.unique_error() if approximate else 0.0,
+    })
+
+    if approximate:
+        yield from accumulator.iter_results()
+        return
+
+    numeric = df.select_dtypes(include=['number'])
+    moments = numeric_moments(numeric)
+    for i, col in enumerate(numeric.columns):
+        yield ('numeric', col, _numeric_row(moments, i, rows, _median(numeric[col])))
+
+    for col in df.select_dtypes(exclude=['number']).columns:
+        series = df[col]
+        count = int(series.count())
+        unique = int(series.nunique())
+        yield ('text', col, {
+            'count': count,
+            'unique': unique,
+            'missing': rows - count,
+            'values': list(series.unique()[:MAX_LISTED_VALUES])
+                      if unique <= MAX_LISTED_VALUES else None,
+            'estimated': False,
+        })
+
+
+class StatisticsAccumulator:
+    """
+    Builds approximate statistics chunk by chunk
+
+    Pass `update` as the chunk callback of a streaming load so the sketches
+    are filled while the file is parsed. Numeric columns get exact moments
+    and a KLL quantile sketch each, other columns a distinct-count sketch.
+    Accumulators over different parts of the same columns can be merged.
+    """
+
+    def __init__(self, k=None, precision=None):
+        """
+        Initialize an empty accumulator
+
+        Args:
+            k: KLL size (defaults to STATS_SETTINGS)
+            precision: HyperLogLog precision (defaults to STATS_SETTINGS)
+        """
+        self.k = k or STATS_SETTINGS['kll_k']
+        self.precision = precision or STATS_SETTINGS['hll_precision']
+        self.rows = 0
+        self.numeric_columns = None
+        self.text_columns = None
+
+    @classmethod
+    def from_dataframe(cls, df, chunk_rows=None):
+        """
+        Build an accumulator from a DataFrame already in memory
+
+        Args:
+            df: pandas DataFrame
+            chunk_rows: Rows per update (defaults to STATS_SETTINGS)
+
+        Returns:
+            StatisticsAccumulator: Accumulator fed with every row of df
+        """
+        chunk_rows = chunk_rows or STATS_SETTINGS['sketch_chunk_rows']
+        accumulator = cls()
+        accumulator._start_from(df)
+        for start in range(0, len(df), chunk_rows):
+            accumulator.update(df.iloc[start:start + chunk_rows])
+        return accumulator
+
+    def update(self, chunk):
+        """
+        Add a chunk of rows
+
+        Args:
+            chunk: pandas DataFrame with the same columns as earlier chunks
+        """
+        if self.numeric_columns is None:
+            self._start_from(chunk)
+        if len(chunk) == 0:
+            return
+
+        numeric = chunk[self.numeric_columns]
+        if len(numeric.select_dtypes(include=['number']).columns) < len(self.numeric_columns):
+            # A later chunk can hold stray text in a column that started numeric
+            numeric = numeric.apply(pd.to_numeric, errors='coerce')
+        block = _float_block(numeric)
+
+        self.moments.update(block)
+        for i, sketch in enumerate(self.quantiles):
+            sketch.update(block[:, i])
+
+        text = chunk[self.text_columns]
+        self.text_counts += text.count().to_numpy()
+        for col, sketch in zip(self.text_columns, self.distinct):
+            sketch.update(text[col])
+
+        self.rows += len(chunk)
+
+    def merge(self, other):
+        """
+        Add the rows summarized by another accumulator
+
+        Args:
+            other: StatisticsAccumulator over the same columns
+
+        Raises:
+            ValueError: If the columns differ
+        """
+        if other.numeric_columns is None:
+            return
+        if self.numeric_columns is None:
+            self._start(other.numeric_columns, other.text_columns)
+        if (self.numeric_columns != other.numeric_columns
+                or self.text_columns != other.text_columns):
+            raise ValueError("Cannot merge statistics of different columns")
+
+        self.moments.merge(other.moments)
+        for sketch, other_sketch in zip(self.quantiles, other.quantiles):
+            sketch.merge(other_sketch)
+        for sketch, other_sketch in zip(self.distinct, other.distinct):
+            sketch.merge(other_sketch)
+        self.text_counts += other.text_counts
+        self.rows += other.rows
+
+    def median_error(self):
+        """
+        Returns:
+            float: Normalized rank error of the estimated medians
+        """
+        return kll_rank_error(self.k)
+
+    def unique_error(self):
+        """
+        Returns:
+            float: Relative standard error of estimated distinct counts
+        """
+        return hll_relative_error(self.precision)
+
+    def iter_results(self):
+        """
+        Per-column statistics from the sketches
+
+        Yields:
+            tuple: ('numeric', column, row) and ('text', column, row) items
+                as described in iter_statistics
+        """
+        if self.numeric_columns is None:
+            self._start([], [])
+
+        for i, (col, sketch) in enumerate(zip(self.numeric_columns, self.quantiles)):
+            yield ('numeric', col, _numeric_row(self.moments, i, self.rows, sketch.quantile(0.5)))
+
+        for i, (col, sketch) in enumerate(zip(self.text_columns, self.distinct)):
+            count = int(self.text_counts[i])
+            yield ('text', col, {
+                'count': count,
+                'unique': sketch.count(),
+                'missing': self.rows - count,
+                'values': list(sketch.values) if sketch.is_exact() else None,
+                'estimated': not sketch.is_exact(),
+            })
+
+    def _start_from(self, df):
+        """Create sketches for the columns of a DataFrame"""
+        numeric = list(df.select_dtypes(include=['number']).columns)
+        text = [col for col in df.columns if col not in set(numeric)]
+        self._start(numeric, text)
+
+    def _start(self, numeric_columns, text_columns):
+        """Create one sketch per column"""
+        self.numeric_columns = list(numeric_columns)
+        self.text_columns = list(text_columns)
+        self.moments = MomentsSketch(len(self.numeric_columns))
+        self.quantiles = [KLLSketch(self.k) for _ in self.numeric_columns]
+        self.distinct = [
+            DistinctSketch(MAX_LISTED_VALUES, self.precision) for _ in self.text_columns
+        ]
+        self.text_counts = np.zeros(len(self.text_columns))
+
+
+def numeric_moments(numeric, chunk_cells=None):
+    """
+    Count, mean, variance, min and max of every numeric column in one pass
+
+    The block is read in row chunks small enough to stay in cache; each
+    chunk is converted to a 2-D float array once and reduced for all
+    columns together (see MomentsSketch).
+
+    Args:
+        numeric: DataFrame containing only numeric columns
+        chunk_cells: Cells per chunk (defaults to STATS_CHUNK_CELLS)
+
+    Returns:
+        MomentsSketch: Moments of every column
+    """
+    rows, width = numeric.shape
+    moments = MomentsSketch(width)
+    if width == 0:
+        return moments
+
+    step = max((chunk_cells or STATS_CHUNK_CELLS) // width, 1)
+    for start in range(0, rows, step):
+        moments.update(_float_block(numeric.iloc[start:start + step]))
+    return moments
+
+
+def _numeric_row(moments, i, rows, median):
+    """Summary of one numeric column"""
+    count = int(moments.count[i])
+    return {
+        'count': count,
+        'mean': moments.means()[i],
+        'median': median,
+        'std': moments.stds()[i],
+        'min': moments.min[i],
+        'max': moments.max[i],
+        'missing': rows - count,
+    }
+
+
+def _float_block(numeric):
+    """Numeric columns as a 2-D float64 array with NaN for missing values"""
+    return numeric.to_numpy(dtype=np.float64, na_value=np.nan)
+
+
+def _median(series):
+    """Exact median of a numeric column, ignoring missing values"""
+    values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+    values = values[~np.isnan(values)]
+    return float(np.median(values)) if len(values) else np.nan
+
+
+def estimate_memory(df, sample_rows=None):
+    """
+    Memory usage without walking every Python string
+
+    Columns backed by NumPy, Arrow or categories report their size
+    directly. Object and Python-string columns are measured on a sample
+    of rows and scaled up.
+
+    Args:
+        df: pandas DataFrame
+        sample_rows: Rows sampled per string column (defaults to MEMORY_SAMPLE_ROWS)
+
+    Returns:
+        tuple: (bytes, True if any column was estimated from a sample)
+    """
+    sample_rows = sample_rows or MEMORY_SAMPLE_ROWS
+    rows = len(df)
+    total = int(df.index.memory_usage())
+    estimated = False
+
+    for col in df.columns:
+        series = df[col]
+        if _holds_python_objects(series.dtype) and rows > sample_rows:
+            step = rows // sample_rows
+            sample = series.iloc[::step][:sample_rows]
+            per_row = sample.memory_usage(deep=True, index=False) / len(sample)
+            total += int(per_row * rows)
+            estimated = True
+        else:
+            total += int(series.memory_usage(deep=True, index=False))
+
+    return total, estimated
+
+
+def _holds_python_objects(dtype):
+    """Check if a dtype stores one Python object per value"""
+    if dtype == object:
+        return True
+    return isinstance(dtype, pd.StringDtype) and dtype.storage == "python"
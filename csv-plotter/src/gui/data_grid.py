@@ -0,0 +1,419 @@
+"""
+Data Grid
+Virtualized table for previewing DataFrames of any size
+Only the rows and columns currently visible are turned into widgets
+"""
+import tkinter as tk
+from tkinter import ttk
+
+
+class DataGrid:
+    """
+    Treeview-based table that shows a window of a DataFrame
+
+    Scrolling moves a row/column offset and re-slices the frame with
+    iloc, so the cost of a scroll step does not depend on the number of
+    rows. Clicking a header sorts by that column using a cached argsort.
+
+    Instead of a DataFrame the grid can page through a file that is not
+    loaded at all: any source with len(), columns and read_rows(start, stop)
+    (see RowRangeReader). Such sources cannot be sorted.
+    """
+
+    ROW_LABEL_COLUMN = "#row"
+
+    def __init__(self, parent, visible_rows=20, visible_columns=10, column_width=110):
+        """
+        Initialize data grid
+
+        Args:
+            parent: Parent widget
+            visible_rows: Number of rows shown at once
+            visible_columns: Number of data columns shown at once
+            column_width: Width of each column in pixels
+        """
+        self.frame = tk.Frame(parent)
+
+        self.visible_rows = visible_rows
+        self.visible_columns = visible_columns
+        self.column_width = column_width
+
+        self.df = None
+        self.row_offset = 0
+        self.col_offset = 0
+        self.sort_column = None
+        self.sort_ascending = True
+        self.order = None
+        self._sort_cache = {}
+        self._shown_columns = None
+        self.on_view_change = None
+
+        self.tree = ttk.Treeview(
+            self.frame,
+            show="headings",
+            height=visible_rows,
+            selectmode="browse"
+        )
+        self.v_scroll = tk.Scrollbar(self.frame, orient=tk.VERTICAL, command=self.yview)
+        self.h_scroll = tk.Scrollbar(self.frame, orient=tk.HORIZONTAL, command=self.xview)
+
+        self.tree.grid(row=0, column=0, sticky="nsew")
+        self.v_scroll.grid(row=0, column=1, sticky="ns")
+        self.h_scroll.grid(row=1, column=0, sticky="ew")
+        self.frame.grid_rowconfigure(0, weight=1)
+        self.frame.grid_columnconfigure(0, weight=1)
+
+        # Mouse wheel (Windows/macOS send <MouseWheel>, X11 sends buttons 4/5)
+        self.tree.bind("<MouseWheel>", self.on_mousewheel)
+        self.tree.bind("<Button-4>", lambda e: self.scroll_rows(-3))
+        self.tree.bind("<Button-5>", lambda e: self.scroll_rows(3))
+        self.tree.bind("<Shift-MouseWheel>", self.on_shift_mousewheel)
+
+    def pack(self, **kwargs):
+        """Pack the frame"""
+        self.frame.pack(**kwargs)
+
+    def set_dataframe(self, df):
+        """
+        Show a new DataFrame, resetting scroll position and sorting
+
+        Args:
+            df: pandas DataFrame, paged row source (see class docstring)
+                or None to clear
+        """
+        self.df = df
+        self.row_offset = 0
+        self.col_offset = 0
+        self.sort_column = None
+        self.sort_ascending = True
+        self.order = None
+        self._sort_cache = {}
+        self._shown_columns = None
+        self.render()
+
+    def extend_dataframe(self, df):
+        """
+        Show a DataFrame that grew by rows appended at the end
+
+        Scroll position and sorting are kept; a view showing the last row
+        keeps following the end, like `tail -f`.
+
+        Args:
+            df: pandas DataFrame starting with the rows currently shown
+        """
+        at_end = self.df is not None and self.visible_range()[1] >= self.row_count()
+        old_rows = self.row_count()
+
+        self.df = df
+        self._sort_cache = {}
+        if self.sort_column is not None:
+            # Only the appended rows are sorted, then merged into the order
+            key = (self.sort_column, self.sort_ascending)
+            self.order = self._merge_appended(self.order, old_rows, *key)
+            self._sort_cache[key] = self.order
+
+        if at_end and self.sort_column is None:
+            self.row_offset = self._clamp_row_offset(self.row_count())
+        self.render()
+
+    def set_visible_rows(self, visible_rows):
+        """
+        Change how many rows are shown at once
+
+        Only the rows entering or leaving the window are inserted or
+        deleted; the headings and the rows that stay are left as they are.
+
+        Args:
+            visible_rows: Number of rows
+        """
+        old_start, old_end = self.visible_range()
+        self.visible_rows = max(int(visible_rows), 1)
+        self.tree.configure(height=self.visible_rows)
+
+        offset = self._clamp_row_offset(self.row_offset)
+        if self.df is None or offset != self.row_offset:
+            # Growing at the end of the data shifts the whole window
+            self.row_offset = offset
+            self.render()
+            return
+
+        _, new_end = self.visible_range()
+        if new_end < old_end:
+            self.tree.delete(*self.tree.get_children()[new_end - old_start:])
+        elif new_end > old_end:
+            for label, values in self.page_rows(old_end, new_end):
+                self.tree.insert("", tk.END, values=[label] + values)
+        else:
+            return
+
+        self._update_scrollbars()
+        if self.on_view_change is not None:
+            self.on_view_change()
+
+    def is_paged(self):
+        """
+        Check whether rows are read from a file page by page
+
+        Returns:
+            bool: True for a paged row source, False for a DataFrame
+        """
+        return self.df is not None and hasattr(self.df, "read_rows")
+
+    def row_count(self):
+        """
+        Number of rows in the current DataFrame
+
+        Returns:
+            int: Row count (0 if nothing is loaded)
+        """
+        return 0 if self.df is None else len(self.df)
+
+    def visible_range(self):
+        """
+        Positions of the first and one-past-last visible rows
+
+        Returns:
+            tuple: (start, end)
+        """
+        start = self.row_offset
+        return start, min(start + self.visible_rows, self.row_count())
+
+    # ===== Rendering =====
+
+    def render(self):
+        """Rebuild the visible rows (and headings if the columns changed)"""
+        self.tree.delete(*self.tree.get_children())
+
+        if self.df is None:
+            self.tree["columns"] = ()
+            self._shown_columns = None
+            self._update_scrollbars()
+            return
+
+        columns = list(self.df.columns[self.col_offset:self.col_offset + self.visible_columns])
+        if columns != self._shown_columns:
+            self._set_headings(columns)
+        else:
+            self._update_heading_labels()
+
+        for label, values in self.page_rows():
+            self.tree.insert("", tk.END, values=[label] + values)
+
+        self._update_scrollbars()
+        if self.on_view_change is not None:
+            self.on_view_change()
+
+    def page_rows(self, start=None, end=None):
+        """
+        Format the visible window of the DataFrame (or part of it)
+
+        Args:
+            start: First row position (defaults to the window start)
+            end: One-past-last row position (defaults to the window end)
+
+        Returns:
+            list: (row label, list of cell strings) per row
+        """
+        visible_start, visible_end = self.visible_range()
+        start = visible_start if start is None else start
+        end = visible_end if end is None else end
+        if start >= end:
+            return []
+
+        col_end = self.col_offset + self.visible_columns
+        if self.is_paged():
+            page = self.df.read_rows(start, end).iloc[:, self.col_offset:col_end]
+        elif self.order is None:
+            page = self.df.iloc[start:end, self.col_offset:col_end]
+        else:
+            page = self.df.iloc[self.order[start:end], self.col_offset:col_end]
+
+        rows = []
+        for label, row in zip(page.index, page.itertuples(index=False, name=None)):
+            rows.append((str(label), [_format_cell(value) for value in row]))
+        return rows
+
+    def _set_headings(self, columns):
+        """Configure Treeview columns for the visible data columns"""
+        ids = [self.ROW_LABEL_COLUMN] + [f"c{i}" for i in range(len(columns))]
+        self.tree["columns"] = ids
+
+        self.tree.heading(self.ROW_LABEL_COLUMN, text="#")
+        self.tree.column(self.ROW_LABEL_COLUMN, width=70, anchor=tk.E, stretch=False)
+
+        for col_id, name in zip(ids[1:], columns):
+            self.tree.heading(col_id, command=lambda c=name: self.sort_by(c))
+            self.tree.column(col_id, width=self.column_width, anchor=tk.W, stretch=False)
+
+        self._shown_columns = columns
+        self._update_heading_labels()
+
+    def _update_heading_labels(self):
+        """Show the sort direction on the sorted column's heading"""
+        for i, name in enumerate(self._shown_columns):
+            text = str(name)
+            if name == self.sort_column:
+                text += " ▲" if self.sort_ascending else " ▼"
+            self.tree.heading(f"c{i}", text=text)
+
+    def _update_scrollbars(self):
+        """Position the scrollbars to reflect the visible window"""
+        rows = self.row_count()
+        if rows == 0:
+            self.v_scroll.set(0, 1)
+        else:
+            start, end = self.visible_range()
+            self.v_scroll.set(start / rows, end / rows)
+
+        columns = 0 if self.df is None else len(self.df.columns)
+        if columns == 0:
+            self.h_scroll.set(0, 1)
+        else:
+            col_end = min(self.col_offset + self.visible_columns, columns)
+            self.h_scroll.set(self.col_offset / columns, col_end / columns)
+
+    # ===== Scrolling =====
+
+    def yview(self, *args):
+        """Scrollbar command for vertical scrolling ('moveto' / 'scroll')"""
+        rows = self.row_count()
+        if args[0] == "moveto":
+            offset = int(float(args[1]) * rows)
+        elif args[0] == "scroll":
+            step = self.visible_rows if args[2] == "pages" else 1
+            offset = self.row_offset + int(args[1]) * step
+        else:
+            return
+        self.row_offset = self._clamp_row_offset(offset)
+        self.render()
+
+    def xview(self, *args):
+        """Scrollbar command for horizontal scrolling, one column per unit"""
+        columns = 0 if self.df is None else len(self.df.columns)
+        if args[0] == "moveto":
+            offset = int(float(args[1]) * columns)
+        elif args[0] == "scroll":
+            step = self.visible_columns if args[2] == "pages" else 1
+            offset = self.col_offset + int(args[1]) * step
+        else:
+            return
+        max_offset = max(columns - self.visible_columns, 0)
+        new_offset = min(max(offset, 0), max_offset)
+        if new_offset != self.col_offset:
+            self.col_offset = new_offset
+            self.render()
+
+    def scroll_rows(self, delta):
+        """
+        Scroll by a number of rows
+
+        Args:
+            delta: Rows to move (negative scrolls up)
+        """
+        offset = self._clamp_row_offset(self.row_offset + delta)
+        if offset != self.row_offset:
+            self.row_offset = offset
+            self.render()
+
+    def on_mousewheel(self, event):
+        """Vertical mouse wheel"""
+        self.scroll_rows(-3 if event.delta > 0 else 3)
+        return "break"
+
+    def on_shift_mousewheel(self, event):
+        """Horizontal scrolling with Shift + wheel"""
+        self.xview("scroll", -1 if event.delta > 0 else 1, "units")
+        return "break"
+
+    def _clamp_row_offset(self, offset):
+        """Keep the offset within the DataFrame"""
+        max_offset = max(self.row_count() - self.visible_rows, 0)
+        return min(max(int(offset), 0), max_offset)
+
+    # ===== Sorting =====
+
+    def sort_by(self, column):
+        """
+        Sort by a column; clicking the same column again reverses the order
+
+        Args:
+            column: Column name
+        """
+        if self.is_paged():
+            return
+
+        if column == self.sort_column:
+            self.sort_ascending = not self.sort_ascending
+        else:
+            self.sort_column = column
+            self.sort_ascending = True
+
+        self.order = self.sort_order(column, self.sort_ascending)
+        self.row_offset = 0
+        self.render()
+
+    def sort_order(self, column, ascending=True):
+        """
+        Row positions in sorted order, computed once per column and direction
+
+        Args:
+            column: Column name
+            ascending: Sort direction
+
+        Returns:
+            ndarray: Positions into the DataFrame
+        """
+        key = (column, ascending)
+        if key not in self._sort_cache:
+            ordered = self.df[column].reset_index(drop=True).sort_values(
+                ascending=ascending, kind="stable", na_position="last"
+            )
+            self._sort_cache[key] = ordered.index.to_numpy()
+        return self._sort_cache[key]
+
+    def _merge_appended(self, order, old_rows, column, ascending):
+        """
+        Sort order of the whole DataFrame from the order of its first rows
+
+        The appended rows are sorted on their own and inserted into the
+        existing order by binary search, in the same stable order (missing
+        values last) as sort_order.
+        """
+        import numpy as np
+        import pandas as pd
+
+        series = self.df[column].reset_index(drop=True)
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            # Categories are only added at the end, so codes keep their order
+            keys = series.cat.codes.to_numpy()
+            missing = keys == -1
+        else:
+            keys = series.to_numpy()
+            missing = series.isna().to_numpy()
+
+        appended = series.iloc[old_rows:].sort_values(
+            ascending=ascending, kind="stable", na_position="last"
+        ).index.to_numpy()
+        appended_missing = missing[appended]
+
+        # Rows with a value come first in the order; the missing ones follow
+        present = old_rows - int(missing[:old_rows].sum())
+        sorted_keys = keys[order[:present]]
+        new_keys = keys[appended[~appended_missing]]
+        if ascending:
+            at = np.searchsorted(sorted_keys, new_keys, side="right")
+        else:
+            at = present - np.searchsorted(sorted_keys[::-1], new_keys, side="left")
+
+        return np.concatenate([
+            np.insert(order[:present], at, appended[~appended_missing]),
+            order[present:],
+            appended[appended_missing],
+        ])
+
+
+def _format_cell(value):
+    """Format a cell value for display"""
+    if isinstance(value, float):
+        return f"{value:.6g}"
+    return str(value)
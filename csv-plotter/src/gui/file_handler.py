@@ -2,10 +2,15 @@
 File Handler
 Handles file operations separately from UI
 Follows Single Responsibility Principle
+The pandas-based core modules are imported by the methods that use them,
+so the main window can open before pandas is loaded
 """
-from tkinter import filedialog, messagebox
-from src.core.csv_handler import load_csv, get_columns
+import os
+from tkinter import filedialog, messagebox, simpledialog
+from src.core.config import ERROR_MESSAGES, LOADER_SETTINGS, CACHE_SETTINGS, STATS_SETTINGS
+from src.core.formats import browse_filetypes, is_columnar, is_plain_csv
 from src.utils.validators import validate_file_path, validate_dataframe 
+from src.utils.instrumentation import traced
 
 
 class FileHandler:
@@ -14,31 +19,98 @@ class FileHandler:
     Decoupled from UI following Dependency Inversion Principle
     """
     
-    def __init__(self):
-        """Initialize file handler"""
+    def __init__(self, cache=None):
+        """
+        Initialize file handler
+        
+        Args:
+            cache: Optional DataCache (one is created if caching is enabled)
+        """
+        # Created on first use (see the cache property)
+        self._cache = cache
+        
         self.current_file = None
         self.dataframe = None
+        
+        # Every file the data came from; several for a multi-file load,
+        # which leaves current_file None
+        self.source_files = []
+        
+        # Wide files are loaded in two phases: only a sample is kept in
+        # self.dataframe and plotted columns are parsed into column_cache
+        self.is_sample = False
+        self.column_cache = None
+        
+        # Approximate statistics sketched while a large file streams in
+        self.stats_sketch = None
+        
+        # Follow mode: appended rows are read by follower into follow_rows
+        self.follower = None
+        self.follow_rows = None
+    
+    @property
+    def cache(self):
+        """
+        DataCache for parsed files, or None if caching is disabled
+        
+        Returns:
+            DataCache: The cache
+        """
+        if self._cache is None and CACHE_SETTINGS['enabled']:
+            from src.core.data_cache import DataCache
+            self._cache = DataCache()
+        return self._cache
+    
+    def browse_files(self):
+        """
+        Open file dialog allowing several files to be selected
+        
+        Returns:
+            list: Selected filepaths (empty if cancelled)
+        """
+        filepaths = filedialog.askopenfilenames(
+            title="Select one or more data files",
+            filetypes=browse_filetypes()
+        )
+        
+        return list(filepaths)
     
-    def browse_file(self):
+    def browse_folder(self):
         """
-        Open file dialog and return selected filepath
+        Ask for a folder and a file pattern within it
         
         Returns:
-            str: Selected filepath or None
+            str: Glob pattern (e.g. "/data/2024/*.csv") or None
         """
-        filepath = filedialog.askopenfilename(
-            title="Select a CSV file",
-            filetypes=[("CSV files", "*.csv"), ("All files", "*.*")]
+        directory = filedialog.askdirectory(title="Select a folder of CSV files")
+        if not directory:
+            return None
+        
+        pattern = simpledialog.askstring(
+            "Files to load",
+            "File pattern (use **/ to include subfolders):",
+            initialvalue=LOADER_SETTINGS['shard_pattern']
         )
+        if not pattern:
+            return None
         
-        return filepath
+        return os.path.join(directory, pattern)
     
-    def load_file(self, filepath):
+    @traced("load_file")
+    def load_file(self, filepath, progress_callback=None, cancel_event=None,
+                  sketch_statistics=None):
         """
         Load and validate CSV file
+        Large files are streamed in chunks so progress can be reported.
+        Wide files only have their header and a sample loaded; columns
+        are parsed later by get_plot_data.
         
         Args:
             filepath: Path to CSV file
+            progress_callback: Optional callable(bytes_read, total_bytes, rows_read)
+            cancel_event: Optional threading.Event to cancel a streaming load
+            sketch_statistics: Build approximate statistics while streaming
+                (defaults to STATS_SETTINGS['approximate'])
         
         Returns:
             tuple: (success, dataframe or error_message)
@@ -48,9 +120,24 @@ class FileHandler:
         if not is_valid:
             return False, error_message
         
+        from src.core.csv_handler import read_sample, LoadCancelledError
+        from src.core.stats import StatisticsAccumulator
+        
+        if sketch_statistics is None:
+            sketch_statistics = STATS_SETTINGS['approximate']
+        sketch = StatisticsAccumulator() if sketch_statistics else None
+        
         # Load CSV
         try:
-            df = load_csv(filepath)
+            df = read_sample(filepath)
+            is_sample = len(df.columns) >= LOADER_SETTINGS['projection_min_columns']
+            if not is_sample:
+                df = self._read_csv(
+                    filepath, progress_callback, cancel_event,
+                    chunk_callback=sketch.update if sketch else None
+                )
+        except LoadCancelledError:
+            return False, ERROR_MESSAGES["load_cancelled"]
         except Exception as e:
             return False, f"Failed to load CSV: {str(e)}"
         
@@ -59,36 +146,422 @@ class FileHandler:
         if not is_valid:
             return False, error_message
         
+        # A cancelled load must not replace the data currently shown
+        if cancel_event is not None and cancel_event.is_set():
+            return False, ERROR_MESSAGES["load_cancelled"]
+        
         # Store successful load
+        self.stop_follow()
         self.current_file = filepath
+        self.source_files = [filepath]
         self.dataframe = df
+        self.is_sample = is_sample
+        self.column_cache = None
+        
+        # Only streamed loads feed the sketch (not cache hits or small files)
+        if sketch is not None and sketch.rows != len(df):
+            sketch = None
+        self.stats_sketch = sketch
         
         return True, df
     
-    def get_columns(self):
+    @traced("load_files")
+    def load_files(self, sources, progress_callback=None, cancel_event=None):
         """
-        Get column names from loaded dataframe
+        Load several CSV files as one dataset
+        
+        Files are parsed concurrently (each through the cache, so files
+        that did not change since they were last loaded are not parsed
+        again), their dtypes are reconciled and they are concatenated
+        once. A column names the file each row came from. Wide files are
+        loaded fully rather than as a sample.
+        
+        Args:
+            sources: File paths, folders and glob patterns (see expand_sources)
+            progress_callback: Optional callable(bytes_read, total_bytes, rows_read)
+            cancel_event: Optional threading.Event to cancel the load
         
         Returns:
-            list: Column names or empty list
+            tuple: (success, dataframe or error_message)
         """
-        if self.dataframe is not None:
-            return get_columns(self.dataframe)
-        return []
+        from src.core.csv_handler import LoadCancelledError
+        from src.core.shards import expand_sources, load_shards, combine_shards
+        
+        filepaths = expand_sources(sources)
+        if not filepaths:
+            return False, ERROR_MESSAGES["no_matching_files"]
+        if len(filepaths) == 1:
+            return self.load_file(filepaths[0], progress_callback, cancel_event)
+        
+        for filepath in filepaths:
+            is_valid, error_message = validate_file_path(filepath)
+            if not is_valid:
+                return False, f"{filepath}: {error_message}"
+        
+        try:
+            # The shards are spread over a thread pool already, so each one
+            # is parsed in its thread rather than in a process pool of its own
+            frames = load_shards(
+                filepaths,
+                lambda filepath: self._read_csv(
+                    filepath, cancel_event=cancel_event, parallel=False
+                ),
+                progress_callback,
+                cancel_event
+            )
+            df = combine_shards(frames, filepaths)
+        except LoadCancelledError:
+            return False, ERROR_MESSAGES["load_cancelled"]
+        except Exception as e:
+            return False, f"Failed to load CSV files: {str(e)}"
+        
+        is_valid, error_message = validate_dataframe(df)
+        if not is_valid:
+            return False, error_message
+        
+        if cancel_event is not None and cancel_event.is_set():
+            return False, ERROR_MESSAGES["load_cancelled"]
+        
+        self.stop_follow()
+        self.current_file = None
+        self.source_files = filepaths
+        self.dataframe = df
+        self.is_sample = False
+        self.column_cache = None
+        self.stats_sketch = None
+        
+        return True, df
+    
+    def can_follow(self):
+        """
+        Check whether the loaded data comes from a file that can be followed
+        
+        Returns:
+            bool: True for a single uncompressed CSV file
+        """
+        return (
+            self.current_file is not None
+            and not self.is_multi_file()
+            and is_plain_csv(self.current_file)
+        )
+    
+    def is_multi_file(self):
+        """
+        Check whether the data was loaded from several files
+        
+        Returns:
+            bool: True after a multi-file load
+        """
+        return len(self.source_files) > 1
+    
+    def source_folder(self):
+        """
+        Folder holding all the files the data came from
+        
+        Returns:
+            str: Common directory of source_files ("" if nothing is loaded)
+        """
+        if not self.source_files:
+            return ""
+        paths = [os.path.dirname(os.path.abspath(path)) for path in self.source_files]
+        return os.path.commonpath(paths)
+    
+    def needs_paged_preview(self, filepath):
+        """
+        Check whether a file is big enough to page through before it loads
+        
+        Args:
+            filepath: Path to CSV file
+        
+        Returns:
+            bool: True if open_paged_preview should run before load_file
+        """
+        from src.core.csv_handler import should_index
+        
+        is_valid, _ = validate_file_path(filepath)
+        return is_valid and should_index(filepath)
+    
+    @traced("index_rows")
+    def open_paged_preview(self, filepath, progress_callback=None, cancel_event=None):
+        """
+        Index a file's rows so any page can be shown without a full parse
+        The row index is saved next to the cache and reused on reopen.
+        
+        Args:
+            filepath: Path to CSV file
+            progress_callback: Optional callable(bytes_scanned, total_bytes)
+            cancel_event: Optional threading.Event to cancel indexing
+        
+        Returns:
+            tuple: (success, RowRangeReader or error_message)
+        """
+        from src.core.csv_handler import open_row_reader, LoadCancelledError
+        
+        try:
+            reader = open_row_reader(filepath, progress_callback, cancel_event)
+        except LoadCancelledError:
+            return False, ERROR_MESSAGES["load_cancelled"]
+        except Exception as e:
+            return False, f"Failed to index CSV: {str(e)}"
+        
+        return True, reader
+    
+    def start_follow(self):
+        """
+        Follow the current file: poll_follow then adds rows appended to it
+        A file that changed in other ways since it was loaded is loaded again.
+        
+        Returns:
+            tuple: (success, dataframe or error_message)
+        """
+        if self.dataframe is None:
+            return False, ERROR_MESSAGES["no_data"]
+        if self.is_multi_file():
+            return False, ERROR_MESSAGES["follow_multiple"]
+        if not is_plain_csv(self.current_file):
+            return False, ERROR_MESSAGES["follow_format"]
+        if self.is_sample:
+            return False, ERROR_MESSAGES["follow_sample"]
+        
+        from src.core.follow import FileReplacedError
+        
+        try:
+            try:
+                self._resume_follow()
+            except FileReplacedError:
+                success, result = self.load_file(self.current_file, sketch_statistics=False)
+                if not success:
+                    return False, result
+                self._resume_follow()
+        except Exception as e:
+            self.stop_follow()
+            return False, f"Failed to follow file: {str(e)}"
+        
+        return True, self.dataframe
+    
+    def poll_follow(self):
+        """
+        Add the rows appended to the followed file since the last poll
+        A truncated or replaced file (e.g. after log rotation) is only
+        reported; the caller reloads it with reload_follow.
+        
+        Returns:
+            tuple: (success, {'appended': rows added, 'replaced': bool}
+                or error_message)
+        """
+        from src.core.follow import FileReplacedError
+        
+        follower, rows = self.follower, self.follow_rows
+        if follower is None:
+            return True, {'appended': 0, 'replaced': False}
+        
+        try:
+            appended = follower.read_appended()
+        except FileReplacedError:
+            return True, {'appended': 0, 'replaced': follower is self.follower}
+        except Exception as e:
+            return False, f"Failed to read appended rows: {str(e)}"
+        
+        # Following may have stopped (e.g. another file loaded) meanwhile
+        if follower is not self.follower or len(appended) == 0:
+            return True, {'appended': 0, 'replaced': False}
+        
+        # Appended values may not fit the loaded columns' types
+        try:
+            rows.append(appended)
+            self.dataframe = rows.frame()
+        except Exception as e:
+            return False, f"Failed to add appended rows: {str(e)}"
+        return True, {'appended': len(appended), 'replaced': False}
+    
+    def reload_follow(self, filepath, progress_callback=None, cancel_event=None):
+        """
+        Load a followed file that was replaced again and keep following it
+        
+        Args:
+            filepath: Path of the followed file
+            progress_callback: Optional callable(bytes_read, total_bytes, rows_read)
+            cancel_event: Optional threading.Event to cancel the load
+        
+        Returns:
+            tuple: (success, dataframe or error_message)
+        """
+        success, result = self.load_file(
+            filepath, progress_callback, cancel_event, sketch_statistics=False
+        )
+        if not success:
+            return False, result
+        return self.start_follow()
+    
+    def stop_follow(self):
+        """Stop following; the rows read so far stay loaded"""
+        self.follower = None
+        self.follow_rows = None
+    
+    def is_following(self):
+        """
+        Check whether the current file is being followed
+        
+        Returns:
+            bool: True between start_follow and stop_follow
+        """
+        return self.follower is not None
+    
+    def _resume_follow(self):
+        """Move the loaded rows into a growable frame and follow the file"""
+        from src.core.follow import FileFollower, GrowableFrame
+        
+        # The last row is read again, as it may have been an incomplete row
+        rows = GrowableFrame(self.dataframe.iloc[:max(len(self.dataframe) - 1, 0)])
+        follower = FileFollower.resume(
+            self.current_file, len(rows), rows.columns, rows.text_columns()
+        )
+        rows.append(follower.read_appended())
+        
+        self.follower = follower
+        self.follow_rows = rows
+        self.dataframe = rows.frame()
+        # A sketch built during the load no longer covers every row
+        self.stats_sketch = None
     
-    def get_preview_text(self, num_rows=5):
+    @traced("load_columns")
+    def get_plot_data(self, columns, progress_callback=None, cancel_event=None):
         """
-        Get preview text of dataframe
+        Get full-length data for the given columns
+        In two-phase mode only columns not parsed before are read from disk
         
         Args:
-            num_rows: Number of rows to preview
+            columns: Column names to return
+            progress_callback: Optional callable(bytes_read, total_bytes, rows_read)
+            cancel_event: Optional threading.Event to cancel a streaming load
+        
+        Returns:
+            tuple: (success, dataframe or error_message)
+        """
+        if self.dataframe is None:
+            return False, ERROR_MESSAGES["no_data"]
+        
+        if not self.is_sample:
+            return True, self.dataframe[columns]
+        
+        from src.core.csv_handler import LoadCancelledError
+        
+        missing = [col for col in columns if self.column_cache is None
+                   or col not in self.column_cache.columns]
+        if missing:
+            try:
+                df = self._read_csv(
+                    self.current_file, progress_callback, cancel_event, usecols=missing
+                )
+            except LoadCancelledError:
+                return False, ERROR_MESSAGES["load_cancelled"]
+            except Exception as e:
+                return False, f"Failed to load columns: {str(e)}"
+            
+            if self.column_cache is None:
+                self.column_cache = df
+            else:
+                for col in missing:
+                    self.column_cache[col] = df[col]
+        
+        return True, self.column_cache[columns]
+    
+    def _read_csv(self, filepath, progress_callback=None, cancel_event=None, usecols=None,
+                  chunk_callback=None, parallel=True):
+        """
+        Read a file from the cache, or parse it and cache the result
+        Columnar files are read directly: they load as fast as the cache.
+        """
+        from src.core.csv_handler import get_loader_options
+        from src.core.data_cache import file_signature
+        
+        if self.cache is None or is_columnar(filepath):
+            return self._parse_csv(
+                filepath, progress_callback, cancel_event, usecols, chunk_callback, parallel
+            )
+        
+        options = get_loader_options()
+        # Taken before parsing: a file that grows meanwhile is not cached
+        # under its new version (see DataCache.put)
+        signature = file_signature(filepath)
+        
+        if usecols is None:
+            df = self.cache.get(filepath, options, signature)
+            if df is None:
+                df = self._parse_csv(
+                    filepath, progress_callback, cancel_event,
+                    chunk_callback=chunk_callback, parallel=parallel
+                )
+                self.cache.put(filepath, df, options, signature)
+            return df
+        
+        # Projected loads are cached one column at a time so any later
+        # combination of columns can be served from the cache
+        cached = {}
+        for col in usecols:
+            hit = self.cache.get(filepath, dict(options, column=col), signature)
+            if hit is not None:
+                cached[col] = hit
+        
+        missing = [col for col in usecols if col not in cached]
+        if missing:
+            parsed = self._parse_csv(
+                filepath, progress_callback, cancel_event, missing, parallel=parallel
+            )
+            for col in missing:
+                cached[col] = parsed[[col]]
+                self.cache.put(filepath, cached[col], dict(options, column=col), signature)
+        
+        df = cached[usecols[0]]
+        for col in usecols[1:]:
+            df[col] = cached[col][col]
+        return df
+    
+    def _parse_csv(self, filepath, progress_callback=None, cancel_event=None, usecols=None,
+                   chunk_callback=None, parallel=True):
+        """
+        Parse a CSV file on several cores, or in chunks, if it is large
+        parallel=False keeps the parse in this thread (no process pool).
+        """
+        from src.core.csv_handler import (
+            load_csv,
+            load_csv_chunked,
+            load_csv_parallel,
+            parallel_engine,
+            should_stream
+        )
+        
+        engine = parallel_engine(filepath) if parallel else None
+        if engine is not None:
+            return load_csv_parallel(
+                filepath,
+                progress_callback=progress_callback,
+                cancel_event=cancel_event,
+                usecols=usecols,
+                chunk_callback=chunk_callback,
+                engine=engine
+            )
+        if should_stream(filepath):
+            return load_csv_chunked(
+                filepath,
+                progress_callback=progress_callback,
+                cancel_event=cancel_event,
+                usecols=usecols,
+                chunk_callback=chunk_callback
+            )
+        return load_csv(filepath, usecols=usecols)
+    
+    def get_columns(self):
+        """
+        Get column names from loaded dataframe
         
         Returns:
-            str: Preview text
+            list: Column names or empty list
         """
         if self.dataframe is not None:
-            return self.dataframe.head(num_rows).to_string()
-        return ""
+            from src.core.csv_handler import get_columns
+            return get_columns(self.dataframe)
+        return []
     
     def get_dataframe(self):
         """
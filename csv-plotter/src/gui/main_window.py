@@ -1,7 +1,9 @@
 import tkinter as tk
-from tkinter import scrolledtext, messagebox
-from src.core.config import APP_NAME, WINDOW_WIDTH, WINDOW_HEIGHT
-from src.core.charts import create_line_chart, create_bar_chart
+from tkinter import scrolledtext, messagebox, filedialog
+from src.core.config import (
+    APP_NAME, WINDOW_WIDTH, WINDOW_HEIGHT, STATUS_MESSAGES, ERROR_MESSAGES, CHART_SETTINGS,
+    LOADER_SETTINGS, AGGREGATION_LABELS
+)
 from src.utils.validators import validate_column_selection, validate_numeric_data
 from src.gui.widgets import (
     create_button, create_label, create_combobox, 
@@ -10,6 +12,8 @@ from src.gui.widgets import (
 from src.gui.file_handler import FileHandler
 from src.gui.status_bar import StatusBar
 from src.gui.preview_panel import PreviewPanel
+from src.gui.task_runner import TaskRunner
+from src.utils.instrumentation import TRACER, format_breakdown
 class MainWindow:
     """
     Main application window
@@ -21,7 +25,12 @@ class MainWindow:
         """Initialize the main window"""
         self.root = root
         self.file_handler = FileHandler()  # Dependency injection
+        self.load_runner = TaskRunner(root)
+        self.follow_runner = TaskRunner(root)
+        self.follow_job = None
         self.chart_window = None
+        self.chart_session = None  # One reusable chart window, see get_chart_session
+        self.reported_capture = None
         self.setup_window()
         self.create_ui()
     
@@ -57,6 +66,7 @@ class MainWindow:
         
         # Status bar
         self.status_bar = StatusBar(self.root)
+        self.create_profiling_tools()
 
     def create_file_section(self):
         """Create file selection section"""
@@ -65,12 +75,44 @@ class MainWindow:
         
         self.browse_btn = create_button(
             file_frame,
-            text="Browse CSV File",
+            text="Browse CSV Files",
             command=self.handle_browse,
             width=20,
             height=2
         )
-        self.browse_btn.pack()
+        self.browse_btn.pack(side=tk.LEFT, padx=5)
+        
+        # A folder (or glob pattern) of shards loaded as one dataset
+        self.folder_btn = create_button(
+            file_frame,
+            text="Browse Folder",
+            command=self.handle_browse_folder,
+            width=14,
+            height=2
+        )
+        self.folder_btn.pack(side=tk.LEFT, padx=5)
+        
+        self.cancel_btn = create_button(
+            file_frame,
+            text="Cancel",
+            command=self.handle_cancel_load,
+            width=10,
+            height=2,
+            state="disabled"
+        )
+        self.cancel_btn.pack(side=tk.LEFT, padx=5)
+        
+        # Follow mode: keep adding rows appended to the file (e.g. by a logger)
+        self.follow_var = tk.BooleanVar(value=False)
+        self.follow_check = tk.Checkbutton(
+            file_frame,
+            text="Follow file",
+            variable=self.follow_var,
+            command=self.handle_follow_toggle,
+            state="disabled",
+            font=("Arial", 9)
+        )
+        self.follow_check.pack(side=tk.LEFT, padx=5)
     
     def create_column_section(self):
         """Create column selection section"""
@@ -112,6 +154,15 @@ class MainWindow:
             radio_frame, "Bar Chart", self.chart_type, "bar"
         )
         bar_radio.pack(side=tk.LEFT, padx=5)
+        
+        # Bar aggregation (per X value, keeps high-cardinality X drawable)
+        agg_label = create_label(column_frame, "Bar Aggregation:", font_size=10)
+        agg_label.grid(row=3, column=0, padx=10, pady=5, sticky="e")
+        
+        self.aggregation_combo = create_combobox(column_frame, width=25, state="readonly")
+        self.aggregation_combo['values'] = list(AGGREGATION_LABELS.values())
+        self.aggregation_combo.set(AGGREGATION_LABELS[CHART_SETTINGS['bar_aggregation']])
+        self.aggregation_combo.grid(row=3, column=1, padx=10, pady=5)
     
     def create_generate_button(self):
         """Create generate chart button"""
@@ -126,7 +177,41 @@ class MainWindow:
             state="disabled",
             style="primary"
         )
-        self.generate_btn.grid(row=3, column=0, columnspan=2, pady=15)
+        self.generate_btn.grid(row=4, column=0, columnspan=2, pady=15)
+    
+    def create_profiling_tools(self):
+        """Add timing and profiling entries to the status bar's tools menu"""
+        self.status_bar.add_tool("Export timing trace...", self.handle_export_trace)
+        self.status_bar.add_tool(
+            "Profile next operation (cProfile)",
+            lambda: self.handle_arm_capture("cprofile")
+        )
+        self.status_bar.add_tool(
+            "Trace allocations of next operation (tracemalloc)",
+            lambda: self.handle_arm_capture("tracemalloc")
+        )
+        self.preview_panel.on_statistics_done = self.show_timings
+    
+    def get_chart_session(self):
+        """
+        The reusable chart window session, created for the first chart
+        matplotlib is imported here rather than at startup
+        
+        Returns:
+            ChartSession: The session
+        """
+        if self.chart_session is None:
+            from src.core.charts.chart_session import ChartSession
+            self.chart_session = ChartSession()
+        return self.chart_session
+    
+    def get_aggregation(self):
+        """Get the selected bar aggregation key"""
+        label = self.aggregation_combo.get()
+        for key, text in AGGREGATION_LABELS.items():
+            if text == label:
+                return key
+        return CHART_SETTINGS['bar_aggregation']
     
     # ===== Event Handlers =====
     
@@ -134,30 +219,356 @@ class MainWindow:
         """Handle file browse action"""
         self.status_bar.set_info("Browsing for file...")
         
-        # Get file path
-        filepath = self.file_handler.browse_file()
+        # Get file paths (several files are loaded as one dataset)
+        filepaths = self.file_handler.browse_files()
         
-        if not filepath:
+        if not filepaths:
             self.status_bar.clear()
             return
+        if len(filepaths) > 1:
+            self.start_load_files(filepaths)
+            return
+        
+        filepath = filepaths[0]
+        self.stop_follow()
+        self.set_loading_state(True)
+        TRACER.begin_operation("Load")
+        
+        # Huge files are indexed first so the preview can page through
+        # them right away; the full load follows in the background
+        if self.file_handler.needs_paged_preview(filepath):
+            self.load_runner.start(
+                lambda progress, cancel_event: self.file_handler.open_paged_preview(
+                    filepath,
+                    progress_callback=progress,
+                    cancel_event=cancel_event
+                ),
+                on_done=lambda result: self.handle_index_done(filepath, result),
+                on_progress=self.handle_index_progress
+            )
+            return
+        
+        self.start_load(filepath)
+    
+    def handle_browse_folder(self):
+        """Handle folder browse action: load the folder's matching files"""
+        self.status_bar.set_info("Browsing for folder...")
         
-        # Load file
+        source = self.file_handler.browse_folder()
+        if not source:
+            self.status_bar.clear()
+            return
+        
+        self.start_load_files([source])
+    
+    def start_load_files(self, sources):
+        """Load several files as one dataset on a worker thread"""
+        self.stop_follow()
+        self.set_loading_state(True)
+        TRACER.begin_operation("Load")
+        
+        if len(sources) > 1:
+            self.status_bar.set_info(STATUS_MESSAGES["loading_files"].format(files=len(sources)))
+        else:
+            self.status_bar.set_info(f"Loading: {sources[0]}")
+        self.load_runner.start(
+            lambda progress, cancel_event: self.file_handler.load_files(
+                sources,
+                progress_callback=progress,
+                cancel_event=cancel_event
+            ),
+            on_done=self.handle_load_done,
+            on_progress=self.handle_load_progress
+        )
+    
+    def start_load(self, filepath):
+        """Load a file on a worker thread so the mainloop stays responsive"""
         self.status_bar.set_info(f"Loading: {filepath}")
-        success, result = self.file_handler.load_file(filepath)
+        # Read the Tk variable here; the load itself runs on another thread
+        sketch_statistics = self.preview_panel.approximate.get()
+        self.load_runner.start(
+            lambda progress, cancel_event: self.file_handler.load_file(
+                filepath,
+                progress_callback=progress,
+                cancel_event=cancel_event,
+                sketch_statistics=sketch_statistics
+            ),
+            on_done=self.handle_load_done,
+            on_progress=self.handle_load_progress
+        )
+    
+    def handle_index_done(self, filepath, index_result):
+        """Show the paged preview, then start the full load (Tk thread)"""
+        success, result = index_result
+        
+        if self.load_runner.cancel_event.is_set():
+            self.set_loading_state(False)
+            self.status_bar.set_warning(ERROR_MESSAGES["load_cancelled"])
+            self.finish_operation()
+            return
+        
+        # Without an index the file is still loaded, just without paging first
+        if success:
+            self.preview_panel.show_paged_preview(result)
+            self.status_bar.set_info(
+                STATUS_MESSAGES["paged_preview"].format(rows=len(result))
+            )
+        
+        self.start_load(filepath)
+    
+    def handle_index_progress(self, bytes_scanned, total_bytes):
+        """Show row indexing progress in the status bar"""
+        percent = 100 * bytes_scanned / total_bytes if total_bytes else 100
+        self.status_bar.set_info(STATUS_MESSAGES["indexing_progress"].format(percent=percent))
+    
+    def handle_load_done(self, load_result):
+        """Handle the result of a background load (runs on the Tk thread)"""
+        success, result = load_result
+        self.set_loading_state(False)
         
         if not success:
+            # A paged preview belongs to the file that did not load
+            if self.preview_panel.data_grid.is_paged():
+                self.restore_preview()
+            self.finish_operation()
+            if self.load_runner.cancel_event.is_set():
+                self.status_bar.set_warning(result)
+                return
             messagebox.showerror("Error", result)
             self.status_bar.set_error("Failed to load file")
             return
         
         # Success - update UI
-        self.status_bar.set_success(f"Loaded: {self.file_handler.current_file}")
+        if self.file_handler.is_sample:
+            self.status_bar.set_success(
+                STATUS_MESSAGES["loaded_sample"].format(columns=len(result.columns))
+            )
+        elif self.file_handler.is_multi_file():
+            self.status_bar.set_success(STATUS_MESSAGES["loaded_files"].format(
+                files=len(self.file_handler.source_files),
+                rows=len(result),
+                folder=self.file_handler.source_folder()
+            ))
+        else:
+            self.status_bar.set_success(f"Loaded: {self.file_handler.current_file}")
         self.update_ui_after_load()
+        self.finish_operation()
+    
+    def restore_preview(self):
+        """Show the data that is currently loaded (if any) in the preview"""
+        df = self.file_handler.get_dataframe()
+        if df is None:
+            self.preview_panel.data_grid.set_dataframe(None)
+            return
+        self.preview_panel.show_preview(
+            df,
+            is_sample=self.file_handler.is_sample,
+            stats_sketch=self.file_handler.stats_sketch
+        )
+    
+    def handle_cancel_load(self):
+        """Handle cancel button while a load is in flight"""
+        self.load_runner.cancel()
+        self.cancel_btn['state'] = 'disabled'
+        self.status_bar.set_info(STATUS_MESSAGES["cancelling"])
+    
+    def set_loading_state(self, loading):
+        """Enable/disable controls while a load is in flight"""
+        self.browse_btn['state'] = 'disabled' if loading else 'normal'
+        self.folder_btn['state'] = 'disabled' if loading else 'normal'
+        self.cancel_btn['state'] = 'normal' if loading else 'disabled'
+        
+        has_data = self.file_handler.get_dataframe() is not None
+        self.generate_btn['state'] = 'normal' if has_data and not loading else 'disabled'
+        can_follow = has_data and not loading and self.file_handler.can_follow()
+        self.follow_check['state'] = 'normal' if can_follow else 'disabled'
+    
+    def handle_follow_toggle(self):
+        """Start or stop following the loaded file"""
+        if not self.follow_var.get():
+            self.stop_follow()
+            self.status_bar.set_info(f"Stopped following: {self.file_handler.current_file}")
+            return
+        
+        # Finding where the loaded rows end scans the file, off the UI thread
+        self.set_loading_state(True)
+        self.cancel_btn['state'] = 'disabled'
+        self.load_runner.start(
+            lambda progress, cancel_event: self.file_handler.start_follow(),
+            on_done=self.handle_follow_started,
+            on_error=lambda error: self.handle_follow_started(
+                (False, f"Failed to follow file: {str(error)}")
+            )
+        )
+    
+    def handle_follow_started(self, follow_result, reloaded=False):
+        """Show the followed data and start polling (Tk thread)"""
+        success, result = follow_result
+        self.set_loading_state(False)
+        
+        if not success:
+            self.follow_var.set(False)
+            if self.load_runner.cancel_event.is_set():
+                self.status_bar.set_warning(result)
+                return
+            messagebox.showerror("Error", result)
+            self.status_bar.set_error("Failed to follow file")
+            return
+        
+        # Text columns are held differently while following, so redraw fully;
+        # a replacing file may also have other columns
+        columns = self.file_handler.get_columns()
+        if reloaded and list(self.x_column_combo['values']) != columns:
+            self.update_ui_after_load()
+        else:
+            self.restore_preview()
+        if self.chart_session is not None:
+            self.chart_session.extend(result)
+        if reloaded:
+            self.status_bar.set_warning(
+                STATUS_MESSAGES["follow_reloaded"].format(rows=len(result))
+            )
+        else:
+            self.status_bar.set_info(STATUS_MESSAGES["following"].format(
+                file=self.file_handler.current_file, rows=len(result)
+            ))
+        self.schedule_follow_poll()
+    
+    def reload_follow(self, filepath):
+        """Load a replaced followed file again on a worker thread"""
+        self.set_loading_state(True)
+        self.status_bar.set_info(f"Loading: {filepath}")
+        self.load_runner.start(
+            lambda progress, cancel_event: self.file_handler.reload_follow(
+                filepath,
+                progress_callback=progress,
+                cancel_event=cancel_event
+            ),
+            on_done=lambda result: self.handle_follow_started(result, reloaded=True),
+            on_progress=self.handle_load_progress,
+            on_error=lambda error: self.handle_follow_started(
+                (False, f"Failed to follow file: {str(error)}")
+            )
+        )
+    
+    def schedule_follow_poll(self):
+        """Check the followed file again after the follow interval"""
+        self.follow_job = self.root.after(
+            LOADER_SETTINGS['follow_interval_ms'], self.poll_follow
+        )
+    
+    def poll_follow(self):
+        """Read appended rows on a worker thread"""
+        self.follow_job = None
+        if not self.file_handler.is_following():
+            return
+        self.follow_runner.start(
+            lambda progress, cancel_event: self.file_handler.poll_follow(),
+            on_done=self.handle_follow_update,
+            on_error=lambda error: self.handle_follow_update(
+                (False, f"Failed to read appended rows: {str(error)}")
+            )
+        )
+    
+    def handle_follow_update(self, poll_result):
+        """Show appended rows in the preview and an open line chart (Tk thread)"""
+        if not self.file_handler.is_following():
+            return  # Stopped while the poll ran
+        
+        success, result = poll_result
+        if not success:
+            self.stop_follow()
+            messagebox.showerror("Error", result)
+            self.status_bar.set_error("Stopped following file")
+            return
+        
+        if result['replaced']:
+            # Reload only the file still followed, on the load runner
+            filepath = self.file_handler.follower.filepath
+            if filepath != self.file_handler.current_file:
+                self.stop_follow()
+                return
+            self.reload_follow(filepath)
+            return
+        
+        df = self.file_handler.get_dataframe()
+        if result['appended']:
+            self.preview_panel.show_appended(df)
+            self.status_bar.set_info(STATUS_MESSAGES["follow_appended"].format(
+                file=self.file_handler.current_file, rows=len(df), appended=result['appended']
+            ))
+        
+        if self.chart_session is not None and result['appended']:
+            try:
+                self.chart_session.extend(df, result['appended'])
+            except Exception as e:
+                self.status_bar.set_error(f"Chart update failed: {str(e)}")
+        
+        self.schedule_follow_poll()
+    
+    def stop_follow(self):
+        """Stop following; the rows read so far stay loaded"""
+        self.follow_var.set(False)
+        if self.follow_job is not None:
+            self.root.after_cancel(self.follow_job)
+            self.follow_job = None
+        self.file_handler.stop_follow()
+    
+    def finish_operation(self):
+        """End the current timed operation and show its breakdown"""
+        TRACER.end_operation()
+        self.show_timings()
+    
+    def show_timings(self):
+        """Show the last operation's timings, and where a capture was saved"""
+        operation = TRACER.current_operation()
+        if operation is None:
+            return
+        self.status_bar.set_timings(format_breakdown(operation))
+        
+        if operation.capture_path and operation is not self.reported_capture:
+            self.reported_capture = operation
+            self.status_bar.set_info(STATUS_MESSAGES["capture_saved"].format(
+                mode=operation.capture_mode, path=operation.capture_path
+            ))
+    
+    def handle_arm_capture(self, mode):
+        """Capture the next load or chart with cProfile or tracemalloc"""
+        TRACER.arm_capture(mode)
+        self.status_bar.set_info(STATUS_MESSAGES["capture_armed"].format(mode=mode))
+    
+    def handle_export_trace(self):
+        """Save the recorded timing spans as a Chrome trace"""
+        filepath = filedialog.asksaveasfilename(
+            defaultextension=".json",
+            initialfile="csv-plotter-trace.json",
+            filetypes=[("Chrome trace", "*.json"), ("All files", "*.*")],
+            title="Export Timing Trace"
+        )
+        if not filepath:
+            return
+        
+        try:
+            TRACER.export_chrome_trace(filepath)
+            self.status_bar.set_success(STATUS_MESSAGES["trace_exported"].format(path=filepath))
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to export trace:\n{str(e)}")
+    
+    def handle_load_progress(self, bytes_read, total_bytes, rows_read):
+        """Show streaming load progress in the status bar"""
+        percent = 100 * bytes_read / total_bytes if total_bytes else 100
+        self.status_bar.set_info(
+            STATUS_MESSAGES["loading_progress"].format(percent=percent, rows=rows_read)
+        )
     
     def update_ui_after_load(self):
         """Update UI elements after successful file load"""
         # Show preview with new panel
-        self.preview_panel.show_preview(self.file_handler.get_dataframe())
+        self.preview_panel.show_preview(
+            self.file_handler.get_dataframe(),
+            is_sample=self.file_handler.is_sample,
+            stats_sketch=self.file_handler.stats_sketch
+        )
         
         # Populate dropdowns
         columns = self.file_handler.get_columns()
@@ -176,9 +587,6 @@ class MainWindow:
         
         # Enable generate button
         self.generate_btn['state'] = 'normal'
-        
-        print(f"File loaded: {self.file_handler.current_file}")
-        print(f"Columns: {columns}")
 
     def handle_generate(self):
         """Handle chart generation action"""
@@ -188,6 +596,8 @@ class MainWindow:
             messagebox.showerror("Error", "No data loaded")
             return
         
+        TRACER.begin_operation("Chart")
+        
         # Get selections
         x_column = self.x_column_combo.get()
         y_column = self.y_column_combo.get()
@@ -195,13 +605,50 @@ class MainWindow:
         # Validate column selection
         is_valid, error_message = validate_column_selection(x_column, y_column)
         if not is_valid:
+            self.finish_operation()
             messagebox.showerror("Error", error_message)
             self.status_bar.set_error("Invalid column selection")
             return
         
+        if self.file_handler.is_sample:
+            # Two-phase load: parse only the selected columns, off the UI thread
+            self.status_bar.set_info(STATUS_MESSAGES["loading_columns"])
+            self.set_loading_state(True)
+            self.load_runner.start(
+                lambda progress, cancel_event: self.file_handler.get_plot_data(
+                    [x_column, y_column],
+                    progress_callback=progress,
+                    cancel_event=cancel_event
+                ),
+                on_done=lambda result: self.handle_plot_data_ready(result, x_column, y_column),
+                on_progress=self.handle_load_progress
+            )
+            return
+        
+        self.generate_chart(df, x_column, y_column)
+    
+    def handle_plot_data_ready(self, load_result, x_column, y_column):
+        """Handle columns parsed for a chart (runs on the Tk thread)"""
+        success, result = load_result
+        self.set_loading_state(False)
+        
+        if not success:
+            self.finish_operation()
+            if self.load_runner.cancel_event.is_set():
+                self.status_bar.set_warning(result)
+                return
+            messagebox.showerror("Error", result)
+            self.status_bar.set_error("Failed to load columns")
+            return
+        
+        self.generate_chart(result, x_column, y_column)
+    
+    def generate_chart(self, df, x_column, y_column):
+        """Validate the Y column and open the selected chart type"""
         # Validate numeric data
         is_valid, error_message = validate_numeric_data(df, y_column)
         if not is_valid:
+            self.finish_operation()
             messagebox.showerror("Error", error_message)
             self.status_bar.set_error("Y-axis must be numeric")
             return
@@ -211,12 +658,15 @@ class MainWindow:
         self.status_bar.set_info(f"Generating {chart_type} chart...")
         
         try:
-            if chart_type == "line":
-                self.chart_window = create_line_chart(df, x_column, y_column)
-                self.status_bar.set_success(f"Line chart generated: {y_column} vs {x_column}")
-            elif chart_type == "bar":
-                self.chart_window = create_bar_chart(df, x_column, y_column)
-                self.status_bar.set_success(f"Bar chart generated: {y_column} vs {x_column}")
+            # Reuses the open chart window and figure instead of a new one per click
+            self.chart_window = self.get_chart_session().show(
+                df, x_column, y_column, chart_type, self.get_aggregation()
+            )
+            label = "Line" if chart_type == "line" else "Bar"
+            self.status_bar.set_success(f"{label} chart generated: {y_column} vs {x_column}")
         except Exception as e:
             messagebox.showerror("Error", f"Failed to generate chart: {str(e)}")
             self.status_bar.set_error("Chart generation failed")
+        
+        # The canvas redraws when idle; end the operation after that draw
+        self.root.after_idle(self.finish_operation)
@@ -4,6 +4,10 @@ Enhanced CSV data preview with statistics
 """
 import tkinter as tk
 from tkinter import scrolledtext, ttk
+from src.core.config import STATS_SETTINGS
+from src.gui.data_grid import DataGrid
+from src.gui.task_runner import TaskRunner
+from src.utils.instrumentation import TRACER, traced
 
 
 class PreviewPanel:
@@ -11,6 +15,10 @@ class PreviewPanel:
     Enhanced preview panel showing data and statistics
     """
     
+    # Range of the "Show rows" spinbox
+    MIN_ROWS = 5
+    MAX_ROWS = 100
+    
     def __init__(self, parent):
         """
         Initialize preview panel
@@ -22,6 +30,18 @@ class PreviewPanel:
         
         # ✅ FIXED: Define num_rows BEFORE create_header
         self.num_rows = tk.IntVar(value=10)
+        self.approximate = tk.BooleanVar(value=STATS_SETTINGS['approximate'])
+        self.is_sample = False
+        self.current_df = None
+        self.stats_sketch = None
+        
+        # Statistics text per (DataFrame identity, approximate mode)
+        self._stats_cache = {}
+        self._stats_key = None
+        self.stats_runner = TaskRunner(self.frame)
+        
+        # Called after a statistics run finishes (e.g. to show its timing)
+        self.on_statistics_done = None
         
         # Header with title and controls
         self.create_header()
@@ -34,19 +54,19 @@ class PreviewPanel:
         self.data_frame = tk.Frame(self.notebook)
         self.notebook.add(self.data_frame, text="📊 Data Preview")
         
-        self.preview_text = scrolledtext.ScrolledText(
+        self.preview_info = tk.Label(
             self.data_frame,
-            width=90,
-            height=20,
-            font=("Courier", 9),
-            wrap=tk.NONE
+            text="",
+            anchor=tk.W,
+            font=("Arial", 9)
         )
-        self.preview_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        self.preview_info.pack(fill=tk.X, padx=5, pady=(5, 0))
         
-        # Add horizontal scrollbar for wide data
-        h_scroll = tk.Scrollbar(self.data_frame, orient=tk.HORIZONTAL, command=self.preview_text.xview)
-        self.preview_text.configure(xscrollcommand=h_scroll.set)
-        h_scroll.pack(side=tk.BOTTOM, fill=tk.X)
+        # Virtualized grid: only visible rows/columns are materialized,
+        # so scrolling stays smooth regardless of file size
+        self.data_grid = DataGrid(self.data_frame, visible_rows=self.num_rows.get())
+        self.data_grid.on_view_change = self.update_preview_info
+        self.data_grid.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         
         # Tab 2: Statistics
         self.stats_frame = tk.Frame(self.notebook)
@@ -59,6 +79,9 @@ class PreviewPanel:
             font=("Courier", 9)
         )
         self.stats_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        
+        # Statistics are only computed once their tab is opened
+        self.notebook.bind("<<NotebookTabChanged>>", self.on_tab_changed)
     
     def create_header(self):
         """Create header with controls"""
@@ -81,98 +104,338 @@ class PreviewPanel:
         
         row_spinbox = tk.Spinbox(
             row_frame,
-            from_=5,
-            to=100,
+            from_=self.MIN_ROWS,
+            to=self.MAX_ROWS,
             increment=5,
             textvariable=self.num_rows,
             width=5,
             font=("Arial", 9)
         )
         row_spinbox.pack(side=tk.LEFT)
+        
+        # Resize the grid as the value changes (arrows or typing)
+        self.num_rows.trace_add("write", self.on_rows_changed)
+        
+        # Sketch-based statistics for huge files
+        tk.Checkbutton(
+            header,
+            text="Approximate stats",
+            variable=self.approximate,
+            command=self.refresh_statistics,
+            font=("Arial", 9)
+        ).pack(side=tk.RIGHT, padx=(0, 10))
     
     def pack(self, **kwargs):
         """Pack the frame"""
         self.frame.pack(**kwargs)
     
-    def show_preview(self, df):
+    @traced("show_preview")
+    def show_preview(self, df, is_sample=False, stats_sketch=None):
         """
         Display dataframe preview
+        Statistics are computed later, when the Statistics tab is opened
         
         Args:
             df: pandas DataFrame
+            is_sample: True if df is only the first rows of the file
+            stats_sketch: Optional StatisticsAccumulator built during the load
         """
         if df is None:
             return
         
-        # Clear previous content
-        self.preview_text.delete(1.0, tk.END)
-        self.stats_text.delete(1.0, tk.END)
+        # Statistics of the previous DataFrame are no longer needed
+        if df is not self.current_df:
+            self._stats_cache = {}
         
         # Show data preview
-        num_rows = self.num_rows.get()
-        preview_data = df.head(num_rows).to_string()
+        self.is_sample = is_sample
+        self.current_df = df
+        self.stats_sketch = stats_sketch
+        self.data_grid.set_dataframe(df)
+        
+        self.refresh_statistics()
+    
+    def show_appended(self, df):
+        """
+        Display a DataFrame that grew by appended rows (follow mode)
+        The grid keeps its position; statistics are recomputed when shown.
         
-        info_line = f"Showing first {min(num_rows, len(df))} of {len(df)} rows, {len(df.columns)} columns\n"
-        info_line += "=" * 80 + "\n"
+        Args:
+            df: pandas DataFrame starting with the rows currently shown
+        """
+        self._stats_cache = {}
+        self._stats_key = None
+        self.current_df = df
+        self.stats_sketch = None
+        self.data_grid.extend_dataframe(df)
         
-        self.preview_text.insert(1.0, info_line + preview_data)
+        # A run in flight picks up the new data when it finishes, so
+        # frequent appends cannot keep restarting it
+        if self.is_statistics_tab_selected() and not self.stats_runner.is_running():
+            self.show_statistics()
+    
+    def on_rows_changed(self, *args):
+        """Show the spinbox's number of rows; statistics are not touched"""
+        try:
+            rows = self.num_rows.get()
+        except tk.TclError:
+            return  # Empty or partly typed value
         
-        # Show statistics
-        self.show_statistics(df)
+        rows = min(max(rows, self.MIN_ROWS), self.MAX_ROWS)
+        if rows != self.data_grid.visible_rows:
+            self.data_grid.set_visible_rows(rows)
     
-    def show_statistics(self, df):
+    def show_paged_preview(self, reader):
         """
-        Display statistics for numeric columns
+        Page through a file that has not been loaded (yet)
+        Statistics wait for the DataFrame from show_preview.
         
         Args:
-            df: pandas DataFrame
+            reader: RowRangeReader for the file
         """
-        stats_output = "📊 DATA STATISTICS\n"
-        stats_output += "=" * 80 + "\n\n"
-        
-        # Basic info
-        stats_output += f"Total Rows: {len(df)}\n"
-        stats_output += f"Total Columns: {len(df.columns)}\n"
-        stats_output += f"Memory Usage: {df.memory_usage(deep=True).sum() / 1024:.2f} KB\n\n"
-        
-        # Column types
-        stats_output += "COLUMN TYPES:\n"
-        stats_output += "-" * 80 + "\n"
-        for col in df.columns:
-            stats_output += f"  {col}: {df[col].dtype}\n"
-        stats_output += "\n"
-        
-        # Numeric columns statistics
-        numeric_cols = df.select_dtypes(include=['number']).columns
-        
-        if len(numeric_cols) > 0:
-            stats_output += "NUMERIC COLUMNS SUMMARY:\n"
-            stats_output += "-" * 80 + "\n\n"
+        self.is_sample = False
+        self.current_df = None
+        self.stats_sketch = None
+        self._stats_cache = {}
+        self.data_grid.set_dataframe(reader)
+        self.refresh_statistics()
+    
+    def refresh_statistics(self):
+        """Redisplay statistics (e.g. after new data or a mode change)"""
+        self.stats_runner.cancel()
+        self._stats_key = None
+        self.stats_text.delete(1.0, tk.END)
+        if self.is_statistics_tab_selected():
+            self.show_statistics()
+    
+    def on_tab_changed(self, event=None):
+        """Compute statistics the first time their tab is opened"""
+        if self.is_statistics_tab_selected():
+            self.show_statistics()
+    
+    def is_statistics_tab_selected(self):
+        """
+        Check whether the Statistics tab is showing
+        
+        Returns:
+            bool: True if it is the selected tab
+        """
+        return self.notebook.select() == str(self.stats_frame)
+    
+    def update_preview_info(self):
+        """Describe the rows currently visible in the data grid"""
+        grid = self.data_grid
+        total = grid.row_count()
+        if grid.df is None:
+            self.preview_info.config(text="")
+            return
+        
+        start, end = grid.visible_range()
+        info = f"Rows {min(start + 1, end):,}–{end:,} of {total:,}, {len(grid.df.columns)} columns"
+        if self.is_sample:
+            info += " (sample - columns are fully loaded when plotted)"
+        if grid.is_paged():
+            info += " (paged from file - sorting is available once loaded)"
+        if grid.sort_column is not None:
+            direction = "ascending" if grid.sort_ascending else "descending"
+            info += f" · sorted by {grid.sort_column} ({direction})"
+        
+        self.preview_info.config(text=info)
+    
+    def show_statistics(self):
+        """
+        Display statistics for the current data
+        
+        Results are cached per DataFrame and mode, so switching tabs shows
+        them again instantly. Otherwise they are computed on a worker thread
+        and streamed into the tab one column at a time.
+        """
+        if self.current_df is None:
+            return
+        
+        approximate = self.approximate.get()
+        key = (id(self.current_df), approximate)
+        if key == self._stats_key:
+            return  # Already shown or streaming in
+        
+        # Wait for a cancelled run to finish; its on_done comes back here
+        if self.stats_runner.is_running():
+            self.stats_runner.cancel()
+            return
+        
+        self._stats_key = key
+        self.stats_text.delete(1.0, tk.END)
+        
+        if key in self._stats_cache:
+            self.stats_text.insert(tk.END, self._stats_cache[key])
+            return
+        
+        df = self.current_df
+        is_sample = self.is_sample
+        stats_sketch = self.stats_sketch
+        parts = []
+        
+        # Part of the current operation (e.g. a load), or an operation of its own
+        standalone = TRACER.current_operation() is None or not TRACER.current_operation().is_open()
+        if standalone:
+            TRACER.begin_operation("Statistics")
+        span = TRACER.start_span("show_statistics", rows=len(df), approximate=approximate)
+        if standalone:
+            TRACER.end_operation()
+        
+        def compute(progress, cancel_event):
+            with span.profiled():
+                for text in statistics_text(df, approximate, stats_sketch, is_sample):
+                    if cancel_event.is_set():
+                        return False
+                    progress(text)
+            return True
+        
+        def on_progress(text):
+            if self._stats_key == key:
+                parts.append(text)
+                self.stats_text.insert(tk.END, text)
+        
+        def on_done(completed):
+            span.finish()
+            if self.on_statistics_done is not None:
+                self.on_statistics_done()
             
-            for col in numeric_cols:
-                stats_output += f"📈 {col}:\n"
-                stats_output += f"  Count:   {df[col].count()}\n"
-                stats_output += f"  Mean:    {df[col].mean():.2f}\n"
-                stats_output += f"  Median:  {df[col].median():.2f}\n"
-                stats_output += f"  Std Dev: {df[col].std():.2f}\n"
-                stats_output += f"  Min:     {df[col].min():.2f}\n"
-                stats_output += f"  Max:     {df[col].max():.2f}\n"
-                stats_output += f"  Missing: {df[col].isna().sum()}\n\n"
-        
-        # Non-numeric columns
-        non_numeric_cols = df.select_dtypes(exclude=['number']).columns
-        
-        if len(non_numeric_cols) > 0:
-            stats_output += "NON-NUMERIC COLUMNS SUMMARY:\n"
-            stats_output += "-" * 80 + "\n\n"
+            if completed and self._stats_key == key:
+                self._stats_cache[key] = "".join(parts)
+            elif self._stats_key == key:
+                self._stats_key = None
+            # Data or mode may have changed while this run was finishing
+            if self.is_statistics_tab_selected():
+                self.show_statistics()
+        
+        def on_error(error):
+            span.finish()
+            if self.on_statistics_done is not None:
+                self.on_statistics_done()
             
-            for col in non_numeric_cols:
-                stats_output += f"📝 {col}:\n"
-                stats_output += f"  Count:   {df[col].count()}\n"
-                stats_output += f"  Unique:  {df[col].nunique()}\n"
-                stats_output += f"  Missing: {df[col].isna().sum()}\n"
-                if df[col].nunique() <= 10:
-                    stats_output += f"  Values:  {', '.join(map(str, df[col].unique()[:10]))}\n"
-                stats_output += "\n"
-        
-        self.stats_text.insert(1.0, stats_output)
\ No newline at end of file
+            if self._stats_key == key:
+                self.stats_text.insert(tk.END, f"\n⚠ Failed to compute statistics: {error}\n")
+                # Let the next show_statistics try again
+                self._stats_key = None
+        
+        self.stats_runner.start(
+            compute,
+            on_done=on_done,
+            on_progress=on_progress,
+            on_error=on_error,
+            coalesce_progress=False
+        )
+
+
+def statistics_text(df, approximate=False, stats_sketch=None, is_sample=False):
+    """
+    Format statistics for the Statistics tab as they are computed
+    
+    Args:
+        df: pandas DataFrame
+        approximate: Use sketches for the median and distinct counts
+        stats_sketch: Optional StatisticsAccumulator built during the load
+        is_sample: True if df is only the first rows of the file
+    
+    Yields:
+        str: Text for the summary, then for each column
+    """
+    # Imported on first use (on the worker thread), not at startup
+    from src.core.stats import iter_statistics
+    
+    summary = None
+    section = None
+    
+    for kind, *payload in iter_statistics(df, approximate, stats_sketch):
+        if kind == 'summary':
+            summary = payload[0]
+            yield _format_summary(summary, is_sample)
+            continue
+        
+        stats_output = ""
+        if kind != section:
+            section = kind
+            title = "NUMERIC" if kind == 'numeric' else "NON-NUMERIC"
+            stats_output += f"{title} COLUMNS SUMMARY:\n"
+            stats_output += "-" * 80 + "\n\n"
+        
+        column, row = payload
+        if kind == 'numeric':
+            stats_output += _format_numeric_column(column, row, summary)
+        else:
+            stats_output += _format_text_column(column, row, summary)
+        yield stats_output
+
+
+def _format_summary(summary, is_sample):
+    """Header, basic info and column types"""
+    stats_output = "📊 DATA STATISTICS\n"
+    stats_output += "=" * 80 + "\n\n"
+    
+    if is_sample:
+        stats_output += f"⚠ Computed on the first {summary['rows']} rows only (wide file sample)\n\n"
+    
+    if summary['approximate']:
+        stats_output += (
+            "≈ Approximate mode: medians from a KLL sketch "
+            f"(±{summary['median_error']:.1%} rank error), distinct counts from "
+            f"HyperLogLog (±{summary['unique_error']:.1%} std. error)\n\n"
+        )
+    
+    # Basic info
+    stats_output += f"Total Rows: {summary['rows']}\n"
+    stats_output += f"Total Columns: {summary['columns']}\n"
+    memory_kb = summary['memory_bytes'] / 1024
+    approx = "~" if summary['memory_estimated'] else ""
+    stats_output += f"Memory Usage: {approx}{memory_kb:.2f} KB\n"
+    
+    # Savings from dtype optimization at load time (see dtype_optimizer)
+    memory_before_kb = summary['memory_before'] / 1024
+    if memory_before_kb > memory_kb > 0:
+        stats_output += (
+            f"Before Dtype Optimization: ~{memory_before_kb:.2f} KB "
+            f"({memory_before_kb / memory_kb:.1f}x smaller)\n"
+        )
+    stats_output += "\n"
+    
+    # Column types
+    stats_output += "COLUMN TYPES:\n"
+    stats_output += "-" * 80 + "\n"
+    for col, dtype in summary['dtypes'].items():
+        stats_output += f"  {col}: {dtype}\n"
+    stats_output += "\n"
+    
+    return stats_output
+
+
+def _format_numeric_column(column, row, summary):
+    """Statistics of one numeric column"""
+    median_note = ""
+    if summary['approximate']:
+        median_note = f"  (≈, ±{summary['median_error']:.1%} rank)"
+    
+    stats_output = f"📈 {column}:\n"
+    stats_output += f"  Count:   {row['count']}\n"
+    stats_output += f"  Mean:    {row['mean']:.2f}\n"
+    stats_output += f"  Median:  {row['median']:.2f}{median_note}\n"
+    stats_output += f"  Std Dev: {row['std']:.2f}\n"
+    stats_output += f"  Min:     {row['min']:.2f}\n"
+    stats_output += f"  Max:     {row['max']:.2f}\n"
+    stats_output += f"  Missing: {row['missing']}\n\n"
+    return stats_output
+
+
+def _format_text_column(column, row, summary):
+    """Statistics of one non-numeric column"""
+    stats_output = f"📝 {column}:\n"
+    stats_output += f"  Count:   {row['count']}\n"
+    if row['estimated']:
+        stats_output += f"  Unique:  ~{row['unique']}  (≈, ±{summary['unique_error']:.1%})\n"
+    else:
+        stats_output += f"  Unique:  {row['unique']}\n"
+    stats_output += f"  Missing: {row['missing']}\n"
+    if row['values'] is not None:
+        stats_output += f"  Values:  {', '.join(map(str, row['values']))}\n"
+    stats_output += "\n"
+    return stats_output
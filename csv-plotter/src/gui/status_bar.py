@@ -23,6 +23,29 @@ class StatusBar:
         self.frame = tk.Frame(parent, relief=tk.SUNKEN, bd=1)
         self.frame.pack(side=tk.BOTTOM, fill=tk.X)
         
+        # Profiling tools, filled in by add_tool
+        self.tools_button = tk.Menubutton(
+            self.frame,
+            text="⏱",
+            relief=tk.FLAT,
+            font=("Arial", 9)
+        )
+        self.tools_menu = tk.Menu(self.tools_button, tearoff=False)
+        self.tools_button.config(menu=self.tools_menu)
+        self.tools_button.pack(side=tk.RIGHT, padx=(0, 5))
+        
+        # Timing breakdown of the last operation
+        self.timing_label = tk.Label(
+            self.frame,
+            text="",
+            anchor=tk.E,
+            padx=10,
+            pady=5,
+            font=("Arial", 9),
+            fg="gray"
+        )
+        self.timing_label.pack(side=tk.RIGHT)
+        
         self.label = tk.Label(
             self.frame,
             text="Ready",
@@ -75,6 +98,25 @@ class StatusBar:
         """Shortcut for warning message"""
         self.set_message(message, "warning")
     
+    def set_timings(self, text):
+        """
+        Show a timing breakdown next to the status message
+        
+        Args:
+            text: Breakdown text (empty to hide)
+        """
+        self.timing_label.config(text=text)
+    
+    def add_tool(self, label, command):
+        """
+        Add an entry to the profiling tools menu
+        
+        Args:
+            label: Menu entry text
+            command: Callable run when the entry is chosen
+        """
+        self.tools_menu.add_command(label=label, command=command)
+    
     def clear(self):
         """Clear status message and show default"""
         self.label.config(text=self.default_text, fg="black")
\ No newline at end of file
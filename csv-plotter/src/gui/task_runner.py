@@ -0,0 +1,126 @@
+"""
+Task Runner
+Runs long operations on a worker thread without blocking the UI
+Results are marshalled back to the Tk thread via root.after
+"""
+import queue
+import threading
+
+
+class TaskRunner:
+    """
+    Runs one background task at a time and delivers its progress
+    and result on the Tk thread (tkinter widgets are not thread-safe)
+    """
+
+    def __init__(self, root, poll_interval_ms=50):
+        """
+        Initialize task runner
+
+        Args:
+            root: Tk root window used for scheduling callbacks
+            poll_interval_ms: How often to check the worker for messages
+        """
+        self.root = root
+        self.poll_interval_ms = poll_interval_ms
+        self.cancel_event = None
+        self._active = False
+
+    def is_running(self):
+        """
+        Check whether a task is in flight
+
+        Returns:
+            bool: True until the task's result has been delivered
+        """
+        return self._active
+
+    def start(self, target, on_done, on_progress=None, on_error=None,
+              coalesce_progress=True):
+        """
+        Start a task on a worker thread
+
+        Args:
+            target: Callable(progress_callback, cancel_event) run on the worker
+            on_done: Called on the Tk thread with the target's return value
+            on_progress: Optional, called on the Tk thread with progress args
+            on_error: Optional, called on the Tk thread with a raised exception
+            coalesce_progress: Deliver only the latest progress per poll;
+                False delivers every progress message in order (for tasks
+                that stream partial results)
+
+        Returns:
+            bool: False if another task is already running
+        """
+        if self.is_running():
+            return False
+
+        # Fresh queue per task so messages from an old task are never delivered
+        task_queue = queue.Queue()
+        cancel_event = threading.Event()
+
+        def report_progress(*args):
+            task_queue.put(("progress", args))
+
+        def worker():
+            try:
+                result = target(report_progress, cancel_event)
+                task_queue.put(("done", result))
+            except Exception as e:
+                task_queue.put(("error", e))
+
+        self.cancel_event = cancel_event
+        self._active = True
+        threading.Thread(target=worker, daemon=True).start()
+
+        self._schedule_poll(task_queue, on_done, on_progress, on_error, coalesce_progress)
+        return True
+
+    def cancel(self):
+        """Ask the running task to stop"""
+        if self.cancel_event is not None:
+            self.cancel_event.set()
+
+    def _schedule_poll(self, *poll_args):
+        """Check the worker's queue again after the poll interval"""
+        self.root.after(self.poll_interval_ms, self._poll, *poll_args)
+
+    def _poll(self, task_queue, on_done, on_progress, on_error, coalesce_progress):
+        """Drain worker messages on the Tk thread"""
+        pending_progress = []
+
+        while True:
+            try:
+                kind, payload = task_queue.get_nowait()
+            except queue.Empty:
+                break
+
+            if kind == "progress":
+                # Usually only the most recent progress update is worth drawing
+                if coalesce_progress:
+                    pending_progress = [payload]
+                else:
+                    pending_progress.append(payload)
+                continue
+
+            # Streamed partial results must all arrive before the result
+            if not coalesce_progress:
+                self._deliver_progress(on_progress, pending_progress)
+            self._active = False
+            if kind == "done":
+                on_done(payload)
+            elif on_error is not None:
+                on_error(payload)
+            else:
+                raise payload
+            return
+
+        self._deliver_progress(on_progress, pending_progress)
+        self._schedule_poll(task_queue, on_done, on_progress, on_error, coalesce_progress)
+
+    def _deliver_progress(self, on_progress, pending_progress):
+        """Pass queued progress messages to the progress callback"""
+        if on_progress is None:
+            return
+        for args in pending_progress:
+            on_progress(*args)
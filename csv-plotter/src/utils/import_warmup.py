@@ -0,0 +1,42 @@
+"""
+Import Warmup
+Loads the heavy libraries in the background once the window is shown
+"""
+import importlib
+import threading
+
+
+# What the first Browse and Generate need (pandas, numpy, matplotlib
+# and the core modules built on them)
+WARMUP_MODULES = (
+    "src.core.csv_handler",
+    "src.core.stats",
+    "src.core.follow",
+    "src.core.charts.chart_session",
+)
+
+
+def warm_up_imports(modules=WARMUP_MODULES):
+    """
+    Import modules on a daemon thread
+    
+    Modules are imported lazily where they are used; importing them early
+    here just means the first Browse or Generate finds them loaded.
+    Import locks make it safe for the UI thread to need one meanwhile.
+    
+    Args:
+        modules: Module names to import, in order
+    
+    Returns:
+        threading.Thread: The started thread
+    """
+    def run():
+        for name in modules:
+            try:
+                importlib.import_module(name)
+            except Exception:
+                pass  # Raised again, and reported, where the module is used
+    
+    thread = threading.Thread(target=run, name="import-warmup", daemon=True)
+    thread.start()
+    return thread
@@ -0,0 +1,458 @@
+"""
+Instrumentation
+Timing spans grouped by user operation, exportable as a Chrome trace
+An operation can also be captured with cProfile or tracemalloc
+"""
+import collections
+import contextlib
+import cProfile
+import functools
+import io
+import json
+import os
+import pstats
+import re
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from src.core.config import PROFILING_SETTINGS
+
+
+CAPTURE_MODES = ("cprofile", "tracemalloc")
+
+# Before Python 3.12 a cProfile profiler sees only the thread that enabled
+# it; from 3.12 one profiler sees every thread and a second cannot be enabled
+PROFILE_PER_THREAD = sys.version_info < (3, 12)
+
+
+class Span:
+    """
+    One timed piece of work
+
+    Spans are usually timed with Tracer.span. Work that starts on one
+    thread and finishes on another can call Tracer.start_span and
+    Span.finish instead.
+    """
+
+    def __init__(self, tracer, name, operation, args):
+        self.tracer = tracer
+        self.name = name
+        self.operation = operation
+        self.args = args
+        self.thread_id = threading.get_ident()
+        self.thread_name = threading.current_thread().name
+        self.start = time.perf_counter()
+        self.end = None
+
+    @property
+    def duration(self):
+        """Seconds from start to finish (so far, if still running)"""
+        return (self.end if self.end is not None else time.perf_counter()) - self.start
+
+    def finish(self):
+        """Record the span as finished (later calls do nothing)"""
+        if self.end is None:
+            self.tracer._finish_span(self)
+
+    @contextlib.contextmanager
+    def profiled(self):
+        """
+        Run code under the span's operation's cProfile capture, if any
+
+        Tracer.span does this itself; use it for the part of a manually
+        finished span that runs on a worker thread.
+        """
+        with self.tracer._thread_profile(self.operation):
+            yield
+
+
+class Operation:
+    """
+    Spans belonging to one user action (e.g. loading a file)
+
+    Spans started while the operation is open belong to it, whichever
+    thread they run on. A capture of the operation stays active until it
+    has ended and its last span has finished.
+    """
+
+    def __init__(self, name, capture=None):
+        self.name = name
+        self.capture = capture  # Mode while the capture is running
+        self.capture_mode = capture
+        self.capture_path = None
+        self.start = time.perf_counter()
+        self.spans = []
+        self.open_spans = 0
+        self.ended = False
+        self.profiles = []
+
+    def is_open(self):
+        """
+        Check whether new spans still join this operation
+
+        Returns:
+            bool: True until end_operation
+        """
+        return not self.ended
+
+    def is_finished(self):
+        """
+        Check whether the operation has ended and all its spans finished
+
+        Returns:
+            bool: True if nothing more will be added
+        """
+        return self.ended and self.open_spans == 0
+
+    def breakdown(self):
+        """
+        Total time per span name, slowest first
+
+        Returns:
+            tuple: (wall seconds from start to the last finished span,
+                list of (span name, seconds))
+        """
+        totals = collections.defaultdict(float)
+        last_end = self.start
+        for span in self.spans:
+            totals[span.name] += span.duration
+            last_end = max(last_end, span.end)
+        return last_end - self.start, sorted(totals.items(), key=lambda item: -item[1])
+
+
+class Tracer:
+    """
+    Collects spans and operations from any thread
+
+    Timing a span costs two perf_counter calls and a lock, so spans stay
+    enabled all the time. Only the most recent PROFILING_SETTINGS['max_spans']
+    spans are kept for export.
+    """
+
+    def __init__(self, max_spans=None):
+        """
+        Initialize tracer
+
+        Args:
+            max_spans: Spans kept for export (defaults to PROFILING_SETTINGS)
+        """
+        self.spans = collections.deque(maxlen=max_spans or PROFILING_SETTINGS['max_spans'])
+        self.operations = collections.deque(maxlen=100)
+        self.operation = None
+        self.armed_capture = None
+        self.epoch = time.perf_counter()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    # ===== Operations =====
+
+    def arm_capture(self, mode):
+        """
+        Capture the next operation with cProfile or tracemalloc
+
+        Args:
+            mode: One of CAPTURE_MODES, or None to disarm
+        """
+        if mode is not None and mode not in CAPTURE_MODES:
+            raise ValueError(f"Unknown capture mode: {mode}")
+        self.armed_capture = mode
+
+    def begin_operation(self, name):
+        """
+        Start an operation; an operation still open is ended first
+
+        Args:
+            name: Label shown in the breakdown
+
+        Returns:
+            Operation: The new current operation
+        """
+        previous = self.operation
+        if previous is not None:
+            # Its capture is finished with whatever was recorded so far
+            self.end_operation(previous)
+            self._finish_capture(previous)
+
+        operation = Operation(name, self.armed_capture)
+        self.armed_capture = None
+        if operation.capture == "tracemalloc":
+            tracemalloc.start()
+        elif operation.capture == "cprofile" and not PROFILE_PER_THREAD:
+            # One profiler for the whole capture, stopped by _finish_capture
+            profile = _enable_profile()
+            if profile is not None:
+                operation.profiles.append(profile)
+
+        with self._lock:
+            self.operation = operation
+            self.operations.append(operation)
+        return operation
+
+    def end_operation(self, operation=None):
+        """
+        Stop adding new spans to an operation
+
+        Args:
+            operation: Operation to end (defaults to the current one)
+        """
+        operation = operation or self.operation
+        if operation is None:
+            return
+        with self._lock:
+            operation.ended = True
+            finished = operation.open_spans == 0
+        if finished:
+            self._finish_capture(operation)
+
+    def current_operation(self):
+        """
+        The most recently begun operation
+
+        Returns:
+            Operation: The operation (possibly ended) or None
+        """
+        return self.operation
+
+    # ===== Spans =====
+
+    @contextlib.contextmanager
+    def span(self, name, **args):
+        """
+        Time a block of code
+
+        Args:
+            name: Span name (spans with the same name add up in the breakdown)
+            **args: Extra details shown in the trace viewer
+
+        Yields:
+            Span: The running span
+        """
+        span = self.start_span(name, **args)
+        try:
+            with span.profiled():
+                yield span
+        finally:
+            span.finish()
+
+    def start_span(self, name, **args):
+        """
+        Start a span that is finished later with Span.finish
+
+        Args:
+            name: Span name
+            **args: Extra details shown in the trace viewer
+
+        Returns:
+            Span: The running span
+        """
+        with self._lock:
+            operation = self.operation
+            if operation is not None and not operation.ended:
+                operation.open_spans += 1
+            else:
+                operation = None
+        return Span(self, name, operation, args)
+
+    def _finish_span(self, span):
+        """Record a finished span and complete its operation's capture if due"""
+        span.end = time.perf_counter()
+        operation = span.operation
+        with self._lock:
+            self.spans.append(span)
+            if operation is not None:
+                operation.spans.append(span)
+                operation.open_spans -= 1
+                finished = operation.is_finished()
+        if operation is not None and finished:
+            self._finish_capture(operation)
+
+    @contextlib.contextmanager
+    def _thread_profile(self, operation):
+        """
+        Profile this thread while inside the outermost span of a cProfile capture
+        (only before Python 3.12; later the capture's one profiler sees all threads)
+        """
+        if (not PROFILE_PER_THREAD or operation is None or operation.capture != "cprofile"
+                or getattr(self._local, "profiling", False)):
+            yield
+            return
+
+        profile = _enable_profile()
+        if profile is None:
+            yield
+            return
+
+        self._local.profiling = True
+        try:
+            yield
+        finally:
+            profile.disable()
+            self._local.profiling = False
+            with self._lock:
+                operation.profiles.append(profile)
+
+    # ===== Output =====
+
+    def export_chrome_trace(self, filepath):
+        """
+        Write the recorded spans and operations as a Chrome trace
+
+        Open the file in chrome://tracing or https://ui.perfetto.dev.
+
+        Args:
+            filepath: Destination .json path
+        """
+        pid = os.getpid()
+        with self._lock:
+            spans = list(self.spans)
+            operations = list(self.operations)
+
+        events = []
+        threads = {}
+        for span in spans:
+            threads[span.thread_id] = span.thread_name
+            event = self._trace_event(span.name, "span", span.start, span.end, pid, span.thread_id)
+            event["args"] = {key: str(value) for key, value in span.args.items()}
+            if span.operation is not None:
+                event["args"]["operation"] = span.operation.name
+            events.append(event)
+
+        # Operations on a track of their own above the threads
+        for operation in operations:
+            wall, _ = operation.breakdown()
+            events.append(self._trace_event(
+                operation.name, "operation", operation.start, operation.start + wall, pid, 0
+            ))
+
+        threads[0] = "Operations"
+        for tid, name in threads.items():
+            events.append({"name": "thread_name", "ph": "M", "pid": pid, "tid": tid,
+                           "args": {"name": name}})
+
+        with open(filepath, "w", encoding="utf-8") as handle:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, handle)
+
+    def _trace_event(self, name, category, start, end, pid, tid):
+        """A complete ('X') trace event with microsecond timestamps"""
+        return {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": (start - self.epoch) * 1e6,
+            "dur": (end - start) * 1e6,
+            "pid": pid,
+            "tid": tid,
+        }
+
+    def _finish_capture(self, operation):
+        """Stop an operation's capture and write its report"""
+        with self._lock:
+            mode = operation.capture
+            operation.capture = None
+            profiles = operation.profiles
+            operation.profiles = []
+        if mode is None:
+            return
+        if mode == "cprofile" and not PROFILE_PER_THREAD:
+            for profile in profiles:
+                profile.disable()
+
+        directory = PROFILING_SETTINGS['capture_dir'] or os.path.join(
+            tempfile.gettempdir(), "csv-plotter-profiles"
+        )
+        os.makedirs(directory, exist_ok=True)
+        stem = os.path.join(directory, f"{_slug(operation.name)}-{time.strftime('%Y%m%d-%H%M%S')}")
+        top = PROFILING_SETTINGS['capture_top']
+
+        if mode == "tracemalloc":
+            snapshot = tracemalloc.take_snapshot()
+            current, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            path = stem + "-allocations.txt"
+            with open(path, "w", encoding="utf-8") as handle:
+                handle.write(f"Operation: {operation.name}\n")
+                handle.write(f"Peak traced: {peak / 2**20:.1f} MB, still allocated: "
+                             f"{current / 2**20:.1f} MB\n\n")
+                for stat in snapshot.statistics("lineno")[:top]:
+                    handle.write(f"{stat}\n")
+        else:
+            if not profiles:
+                return
+            stats = pstats.Stats(profiles[0])
+            for profile in profiles[1:]:
+                stats.add(profile)
+            path = stem + ".prof"
+            stats.dump_stats(path)
+
+            report = io.StringIO()
+            stats.stream = report
+            stats.sort_stats("cumulative").print_stats(top)
+            with open(stem + "-profile.txt", "w", encoding="utf-8") as handle:
+                handle.write(f"Operation: {operation.name}\n")
+                handle.write(report.getvalue())
+
+        operation.capture_path = path
+
+
+def traced(name):
+    """
+    Decorator timing every call of a function as a span of TRACER
+
+    Args:
+        name: Span name
+
+    Returns:
+        callable: Decorator
+    """
+    def decorate(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            with TRACER.span(name):
+                return function(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def format_breakdown(operation, items=None):
+    """
+    Summarize an operation's timings in one line
+
+    Args:
+        operation: Operation
+        items: Slowest spans listed (defaults to PROFILING_SETTINGS)
+
+    Returns:
+        str: e.g. "Load: 1.32 s (load_file 1.10 s · show_preview 48 ms)"
+    """
+    items = items or PROFILING_SETTINGS['breakdown_items']
+    wall, totals = operation.breakdown()
+    parts = " · ".join(f"{name} {_format_seconds(seconds)}" for name, seconds in totals[:items])
+    summary = f"{operation.name}: {_format_seconds(wall)}"
+    return f"{summary} ({parts})" if parts else summary
+
+
+def _enable_profile():
+    """Start a cProfile profiler, or return None if another profiler is active"""
+    profile = cProfile.Profile()
+    try:
+        profile.enable()
+    except ValueError:
+        # e.g. the app itself is being run under a profiler
+        return None
+    return profile
+
+
+def _format_seconds(seconds):
+    """Seconds as '1.23 s' or '45 ms'"""
+    return f"{seconds:.2f} s" if seconds >= 1 else f"{seconds * 1000:.0f} ms"
+
+
+def _slug(text):
+    """File-name-safe version of an operation name"""
+    return re.sub(r"[^A-Za-z0-9]+", "-", text).strip("-").lower() or "operation"
+
+
+# Application-wide tracer
+TRACER = Tracer()
@@ -2,10 +2,11 @@
 Data Validation
 Validates dataframes and data content
 """
-import pandas as pd
 from src.core.config import ERROR_MESSAGES
+from src.utils.instrumentation import traced
 
 
+@traced("validate_dataframe")
 def validate_dataframe(df):
     """
     Check if dataframe is valid and not empty
@@ -62,8 +63,11 @@ def validate_numeric_data(df, y_column):
     if y_column not in df.columns:
         return False, f"Column '{y_column}' not found in data"
     
+    # Imported here so the validators load without pandas at startup
+    from pandas.api.types import is_numeric_dtype
+    
     # Check if column is numeric
-    if not pd.api.types.is_numeric_dtype(df[y_column]):
+    if not is_numeric_dtype(df[y_column]):
         return False, ERROR_MESSAGES["y_not_numeric"]
     
     return True, ""
\ No newline at end of file
@@ -4,11 +4,12 @@ Validates file paths and file existence
 """
 import os
 from src.core.config import ERROR_MESSAGES
+from src.core.formats import missing_dependency
 
 
 def validate_file_path(filepath):
     """
-    Check if file path is valid and file exists
+    Check if file path is valid, file exists and its format can be read
     
     Args:
         filepath: Path to the file
@@ -25,4 +26,9 @@ def validate_file_path(filepath):
     if not os.path.isfile(filepath):
         return False, ERROR_MESSAGES["not_a_file"]
     
+    # e.g. .csv.zst needs zstandard, Parquet and Arrow files need pyarrow
+    package = missing_dependency(filepath)
+    if package is not None:
+        return False, ERROR_MESSAGES["missing_reader"].format(package=package)
+    
     return True, ""
\ No newline at end of file
@@ -0,0 +1,102 @@
+"""
+CSV Plotter - Startup Import Check
+Measures what starting the application imports, using python -X importtime
+Fails if a library meant to load after the window (pandas, matplotlib, ...)
+is imported at startup, or if imports exceed an optional time budget
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Libraries that must not be imported before the main window is shown
+DEFERRED_MODULES = ("pandas", "numpy", "matplotlib", "pyarrow")
+
+
+def measure_imports(statement="import main"):
+    """
+    Run a statement in a fresh interpreter with -X importtime
+    
+    Args:
+        statement: Python code to time (run from the application directory)
+    
+    Returns:
+        list: (module name, self time in µs, cumulative time in µs) per
+            imported module, in import order
+    
+    Raises:
+        RuntimeError: If the statement fails
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=APP_DIR,
+        capture_output=True,
+        text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip())
+    
+    imports = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # Header line
+        imports.append((fields[2].strip(), int(fields[0]), int(fields[1])))
+    return imports
+
+
+def main(argv=None):
+    """
+    Report startup imports and check them
+    
+    Args:
+        argv: Command-line arguments (defaults to sys.argv[1:])
+    
+    Returns:
+        int: Exit status (1 if a check failed)
+    """
+    parser = argparse.ArgumentParser(description="Check what application startup imports.")
+    parser.add_argument(
+        "--statement", default="import main",
+        help="code to time (default: import main)"
+    )
+    parser.add_argument(
+        "--budget-ms", type=float, default=None,
+        help="fail if total import time exceeds this"
+    )
+    parser.add_argument("--top", type=int, default=10, help="slowest modules to list")
+    args = parser.parse_args(argv)
+    
+    imports = measure_imports(args.statement)
+    total_ms = sum(self_us for _, self_us, _ in imports) / 1000
+    
+    print(f"{len(imports)} modules imported in {total_ms:.1f} ms")
+    print("Slowest (own time):")
+    for name, self_us, cumulative_us in sorted(imports, key=lambda item: -item[1])[:args.top]:
+        print(f"  {self_us / 1000:8.1f} ms  {name}  (incl. imports: {cumulative_us / 1000:.1f} ms)")
+    
+    failed = False
+    deferred = sorted({
+        name.split(".")[0] for name, _, _ in imports
+        if name.split(".")[0] in DEFERRED_MODULES
+    })
+    if deferred:
+        failed = True
+        print(f"FAIL: imported at startup: {', '.join(deferred)}")
+    
+    if args.budget_ms is not None and total_ms > args.budget_ms:
+        failed = True
+        print(f"FAIL: {total_ms:.1f} ms exceeds the {args.budget_ms:.1f} ms budget")
+    
+    if not failed:
+        print("OK")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,31 @@
+"""
+Test Configuration
+Makes the src package importable and provides small CSV files
+"""
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture
+def write_file(tmp_path):
+    """
+    Write a file under the test's temporary directory
+
+    Returns:
+        callable(name, content) -> str: Writes text (or bytes) and returns the path
+    """
+    def write(name, content):
+        path = tmp_path / name
+        if isinstance(content, bytes):
+            path.write_bytes(content)
+        else:
+            # newline='' keeps '\r\n' in the content as written
+            with open(path, 'w', newline='') as handle:
+                handle.write(content)
+        return str(path)
+
+    return write
@@ -0,0 +1,97 @@
+"""
+Aggregation Tests
+Top-N bars with an "Other" bar, against pandas group-bys
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.core.charts.aggregation import aggregate_bars, OTHER_LABEL
+
+
+AGGREGATIONS = ['sum', 'mean', 'count', 'min', 'max']
+
+
+@pytest.fixture
+def sales(write_file):
+    rng = np.random.default_rng(0)
+    rows = 400
+    frame = pd.DataFrame({
+        'store': rng.choice([f"s{i}" for i in range(8)], size=rows, p=np.linspace(1, 8, 8) / 36),
+        'amount': np.round(rng.gamma(2.0, 10.0, size=rows), 2),
+    })
+    frame.loc[::13, 'amount'] = np.nan
+    frame.loc[::29, 'store'] = np.nan
+    return pd.read_csv(write_file('sales.csv', frame.to_csv(index=False)))
+
+
+@pytest.mark.parametrize("aggregation", AGGREGATIONS)
+def test_top_groups_and_other(sales, aggregation):
+    result = aggregate_bars(sales, 'store', 'amount', aggregation, max_bars=4)
+
+    per_store = sales.groupby('store', sort=False)['amount'].agg(aggregation)
+    kept = per_store.nlargest(3).index
+    rest = sales[sales['store'].notna() & ~sales['store'].isin(kept)]['amount']
+
+    # Kept groups in order of appearance, then "Other"
+    expected = per_store[per_store.index.isin(kept)]
+    expected = pd.concat([expected, pd.Series([rest.agg(aggregation)], index=[OTHER_LABEL])])
+
+    assert list(result.index) == list(expected.index)
+    np.testing.assert_allclose(result.to_numpy(dtype=float), expected.to_numpy(dtype=float))
+    assert result.name == 'amount'
+
+
+@pytest.mark.parametrize("aggregation", AGGREGATIONS)
+def test_few_groups_are_not_merged(sales, aggregation):
+    result = aggregate_bars(sales, 'store', 'amount', aggregation, max_bars=50)
+
+    expected = sales.groupby('store', sort=False)['amount'].agg(aggregation)
+    assert OTHER_LABEL not in result.index
+    assert list(result.index) == list(expected.index)
+    np.testing.assert_allclose(result.to_numpy(dtype=float), expected.to_numpy(dtype=float))
+
+
+def test_numeric_x_is_sorted_and_labelled():
+    df = pd.DataFrame({'year': [2021, 2020, 2021, 2019], 'v': [1.0, 2.0, 3.0, 4.0]})
+
+    result = aggregate_bars(df, 'year', 'v', 'sum', max_bars=10)
+
+    assert list(result.index) == ['2019', '2020', '2021']
+    assert result.tolist() == [4.0, 2.0, 4.0]
+
+
+@pytest.mark.parametrize("aggregation", AGGREGATIONS)
+def test_continuous_x_is_binned(aggregation):
+    rng = np.random.default_rng(1)
+    df = pd.DataFrame({'x': rng.uniform(0, 100, 1_000), 'y': rng.normal(size=1_000)})
+
+    result = aggregate_bars(df, 'x', 'y', aggregation, max_bars=20, bins=8)
+
+    expected = df.groupby(pd.cut(df['x'], bins=8), observed=True)['y'].agg(aggregation)
+    assert list(result.index) == [str(interval) for interval in expected.index]
+    np.testing.assert_allclose(result.to_numpy(), expected.to_numpy())
+
+
+def test_bins_never_exceed_max_bars():
+    df = pd.DataFrame({'x': np.arange(500.0), 'y': 1.0})
+
+    result = aggregate_bars(df, 'x', 'y', 'count', max_bars=5, bins=30)
+
+    assert len(result) == 5
+    assert result.sum() == 500
+
+
+def test_empty_frame():
+    df = pd.DataFrame({'x': pd.Series([], dtype=object), 'y': pd.Series([], dtype=float)})
+
+    result = aggregate_bars(df, 'x', 'y', 'sum')
+
+    assert result.empty
+
+
+def test_unknown_aggregation():
+    df = pd.DataFrame({'x': ['a'], 'y': [1.0]})
+    for aggregation in ['median', 'none']:
+        with pytest.raises(ValueError):
+            aggregate_bars(df, 'x', 'y', aggregation)
@@ -0,0 +1,151 @@
+"""
+Columnar Tests
+Parquet and Feather / Arrow IPC readers against the frames that were written
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+from pyarrow import feather, ipc
+
+from src.core import csv_handler
+from src.core.columnar import _row_groups_for
+from src.core.csv_handler import (
+    get_reader,
+    load_csv,
+    load_csv_chunked,
+    open_row_reader,
+    read_sample
+)
+
+
+def _frame(rows, seed=0):
+    rng = np.random.default_rng(seed)
+    frame = pd.DataFrame({
+        'id': np.arange(rows, dtype=np.int64),
+        'value': np.round(rng.normal(size=rows), 3),
+        'city': rng.choice(['Oslo', 'Lima', 'Pune'], size=rows),
+        'flag': rng.random(rows) < 0.5,
+    })
+    frame.loc[::7, 'value'] = np.nan
+    return frame
+
+
+def _write(path, df, kind, group_rows):
+    """Write df as Parquet, Feather or an Arrow IPC stream in parts of group_rows"""
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    if kind == 'parquet':
+        pq.write_table(table, path, row_group_size=group_rows)
+    elif kind == 'feather':
+        feather.write_feather(table, path, chunksize=group_rows)
+    else:
+        with ipc.new_stream(path, table.schema) as writer:
+            for batch in table.to_batches(max_chunksize=group_rows):
+                writer.write_batch(batch)
+    return path
+
+
+KINDS = [('parquet', '.parquet'), ('feather', '.feather'), ('stream', '.arrow')]
+
+
+@pytest.fixture(params=KINDS, ids=[kind for kind, _ in KINDS])
+def kind(request):
+    return request.param
+
+
+@pytest.mark.parametrize("rows, group_rows", [(0, 100), (50, 100), (1_000, 100), (1_001, 128)])
+def test_load_matches_written_frame(tmp_path, kind, rows, group_rows):
+    df = _frame(rows)
+    path = _write(str(tmp_path / f'data{kind[1]}'), df, kind[0], group_rows)
+
+    pd.testing.assert_frame_equal(load_csv(path, optimize=False), df)
+
+
+@pytest.mark.parametrize("rows, group_rows", [(0, 100), (50, 100), (1_001, 128)])
+def test_chunked_load_matches_full_load(tmp_path, monkeypatch, kind, rows, group_rows):
+    monkeypatch.setitem(csv_handler.LOADER_SETTINGS, 'chunk_size_rows', 97)
+    path = _write(str(tmp_path / f'data{kind[1]}'), _frame(rows), kind[0], group_rows)
+    progress = []
+
+    for optimize in (False, True):
+        df = load_csv_chunked(
+            path, optimize=optimize, progress_callback=lambda *args: progress.append(args)
+        )
+        pd.testing.assert_frame_equal(df, load_csv(path, optimize=optimize))
+
+    if rows:
+        assert progress[-1][0] == progress[-1][1]  # All bytes read
+        assert progress[-1][2] == rows
+
+
+def test_optimized_load_keeps_values(tmp_path, kind):
+    df = _frame(500)
+    path = _write(str(tmp_path / f'data{kind[1]}'), df, kind[0], 128)
+
+    optimized = load_csv(path, optimize=True)
+
+    assert optimized['id'].dtype.itemsize < 8
+    pd.testing.assert_frame_equal(
+        optimized.astype(object), df.astype(object), check_dtype=False
+    )
+
+
+def test_usecols(tmp_path, kind):
+    df = _frame(300)
+    path = _write(str(tmp_path / f'data{kind[1]}'), df, kind[0], 64)
+
+    loaded = load_csv(path, optimize=False, usecols=['city', 'id'])
+    chunked = load_csv_chunked(path, optimize=False, usecols=['city', 'id'])
+
+    # File order, as for CSV files
+    pd.testing.assert_frame_equal(loaded, df[['id', 'city']])
+    pd.testing.assert_frame_equal(chunked, df[['id', 'city']])
+    sample = get_reader(path).read_sample(path, 10, ['city', 'id'])
+    pd.testing.assert_frame_equal(sample, df[['id', 'city']].iloc[:10])
+
+
+@pytest.mark.parametrize("nrows", [1, 100, 101, 5_000])
+def test_read_sample(tmp_path, kind, nrows):
+    df = _frame(1_000)
+    path = _write(str(tmp_path / f'data{kind[1]}'), df, kind[0], 100)
+
+    pd.testing.assert_frame_equal(read_sample(path, nrows), df.iloc[:nrows])
+
+
+@pytest.mark.parametrize("group_rows", [64, 1_000])
+def test_row_reader_matches_frame(tmp_path, kind, group_rows):
+    df = _frame(1_000)
+    path = _write(str(tmp_path / f'data{kind[1]}'), df, kind[0], group_rows)
+    reader = open_row_reader(path)
+
+    assert len(reader) == len(df)
+    assert list(reader.columns) == list(df.columns)
+    for start, stop in [(0, 10), (60, 70), (63, 65), (0, 1_000), (990, 2_000), (-5, 3)]:
+        pd.testing.assert_frame_equal(reader.read_rows(start, stop), df.iloc[max(start, 0):stop])
+
+    empty = reader.read_rows(5, 5)
+    assert empty.empty and list(empty.columns) == list(df.columns)
+
+
+def test_parquet_row_reader_keeps_recent_groups(tmp_path):
+    path = _write(str(tmp_path / 'data.parquet'), _frame(1_000), 'parquet', 100)
+    reader = open_row_reader(path)
+    reader.max_cached_groups = 2
+
+    for start in (0, 150, 450, 950):
+        reader.read_rows(start, start + 10)
+
+    assert list(reader._groups) == [4, 9]
+
+
+def test_row_groups_for(tmp_path):
+    path = _write(str(tmp_path / 'data.parquet'), _frame(250), 'parquet', 100)
+    metadata = pq.ParquetFile(path).metadata
+
+    assert _row_groups_for(metadata, 0, 1) == [0]
+    assert _row_groups_for(metadata, 99, 101) == [0, 1]
+    assert _row_groups_for(metadata, 100, 200) == [1]
+    assert _row_groups_for(metadata, 150, 1_000) == [1, 2]
+    assert _row_groups_for(metadata, 0, 0) == [0]
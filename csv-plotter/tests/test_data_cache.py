@@ -0,0 +1,155 @@
+"""
+Data Cache Tests
+Cache keys, file signatures and LRU eviction
+"""
+import itertools
+import os
+import types
+
+import pandas as pd
+import pytest
+
+from src.core import data_cache
+from src.core.csv_handler import load_csv
+from src.core.data_cache import DataCache, file_signature
+from src.core.dtype_optimizer import pyarrow_available
+
+
+FORMATS = ['pickle'] + (['feather', 'parquet'] if pyarrow_available() else [])
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Make every time.time() call in the cache one second later than the last"""
+    ticks = itertools.count(1_000_000)
+    monkeypatch.setattr(data_cache, 'time', types.SimpleNamespace(time=lambda: next(ticks)))
+
+
+def _cache(tmp_path, file_format='pickle', max_size_mb=64):
+    return DataCache(str(tmp_path / 'cache'), max_size_mb=max_size_mb, file_format=file_format)
+
+
+def _csv(rows, offset=0):
+    lines = ['id,city,value'] + [
+        f'{i},{["Oslo", "Lima"][i % 2]},{i * 0.5}' for i in range(offset, offset + rows)
+    ]
+    return '\n'.join(lines) + '\n'
+
+
+@pytest.mark.parametrize("file_format", FORMATS)
+@pytest.mark.parametrize("rows", [0, 1, 500])
+def test_round_trip(write_file, tmp_path, file_format, rows):
+    path = write_file('data.csv', _csv(rows))
+    df = load_csv(path, optimize=True)
+    cache = _cache(tmp_path, file_format)
+
+    assert cache.get(path) is None
+    assert cache.put(path, df)
+    cached = cache.get(path)
+
+    pd.testing.assert_frame_equal(cached, df)
+    assert cached.attrs == df.attrs
+
+
+def test_changed_file_misses_and_replaces_old_entry(write_file, tmp_path):
+    path = write_file('data.csv', _csv(10))
+    cache = _cache(tmp_path)
+    cache.put(path, pd.read_csv(path))
+    old_files = set(os.listdir(cache.cache_dir))
+
+    with open(path, 'a') as handle:
+        handle.write('10,Oslo,5.0\n')
+    assert cache.get(path) is None
+
+    cache.put(path, pd.read_csv(path))
+    new_files = set(os.listdir(cache.cache_dir))
+    assert len(cache._read_index()) == 1
+    assert not (old_files - {data_cache.INDEX_FILENAME}) & new_files
+    assert len(cache.get(path)) == 11
+
+
+def test_same_size_new_mtime_misses(write_file, tmp_path):
+    path = write_file('data.csv', _csv(10))
+    cache = _cache(tmp_path)
+    cache.put(path, pd.read_csv(path))
+
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert cache.get(path) is None
+
+
+def test_options_are_part_of_the_key(write_file, tmp_path):
+    path = write_file('data.csv', _csv(10))
+    cache = _cache(tmp_path)
+    cache.put(path, pd.read_csv(path), options={'optimize': False})
+
+    assert cache.get(path, options={'optimize': True}) is None
+    assert cache.get(path, options={'optimize': False}) is not None
+
+
+def test_file_changed_during_parse_is_not_stored(write_file, tmp_path):
+    path = write_file('data.csv', _csv(10))
+    signature = file_signature(path)
+    df = pd.read_csv(path)
+    with open(path, 'a') as handle:
+        handle.write('10,Oslo,5.0\n')
+
+    cache = _cache(tmp_path)
+    assert not cache.put(path, df, signature=signature)
+    assert cache.get(path) is None
+
+
+def test_corrupt_entry_is_a_miss(write_file, tmp_path):
+    path = write_file('data.csv', _csv(10))
+    cache = _cache(tmp_path)
+    cache.put(path, pd.read_csv(path))
+    (entry,) = cache._read_index().values()
+    with open(os.path.join(cache.cache_dir, entry['filename']), 'wb') as handle:
+        handle.write(b'not a frame')
+
+    assert cache.get(path) is None
+    assert cache._read_index() == {}
+
+
+def test_least_recently_used_entries_are_evicted(write_file, tmp_path, clock):
+    paths = [write_file(f'data{i}.csv', _csv(2_000, offset=i)) for i in range(4)]
+    frames = [pd.read_csv(path) for path in paths]
+
+    probe = _cache(tmp_path / 'probe')
+    probe.put(paths[0], frames[0])
+    entry_size = next(iter(probe._read_index().values()))['size']
+
+    # Room for three entries, not four
+    cache = _cache(tmp_path, max_size_mb=3.5 * entry_size / (1024 * 1024))
+    for path, df in zip(paths[:3], frames[:3]):
+        assert cache.put(path, df)
+    assert cache.get(paths[0]) is not None  # Now more recent than paths[1]
+
+    assert cache.put(paths[3], frames[3])
+
+    assert cache.get(paths[1]) is None
+    for i in (0, 2, 3):
+        pd.testing.assert_frame_equal(cache.get(paths[i]), frames[i])
+    assert len(os.listdir(cache.cache_dir)) == 3 + 1  # Entries and the index
+
+
+def test_entry_larger_than_the_cap_is_kept_alone(write_file, tmp_path, clock):
+    paths = [write_file(f'data{i}.csv', _csv(2_000, offset=i)) for i in range(2)]
+    cache = _cache(tmp_path, max_size_mb=1 / (1024 * 1024))
+
+    cache.put(paths[0], pd.read_csv(paths[0]))
+    cache.put(paths[1], pd.read_csv(paths[1]))
+
+    assert cache.get(paths[0]) is None
+    assert cache.get(paths[1]) is not None
+
+
+def test_clear(write_file, tmp_path):
+    path = write_file('data.csv', _csv(10))
+    cache = _cache(tmp_path)
+    cache.put(path, pd.read_csv(path))
+
+    cache.clear()
+
+    assert cache.get(path) is None
+    assert os.listdir(cache.cache_dir) == [data_cache.INDEX_FILENAME]
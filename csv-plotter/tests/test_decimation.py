@@ -0,0 +1,157 @@
+"""
+Decimation Tests
+LTTB and min/max point selection and zoom re-decimation
+"""
+import matplotlib
+matplotlib.use("Agg")
+
+import numpy as np
+import pandas as pd
+import pytest
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from src.core.charts.decimation import (
+    lttb_indices,
+    minmax_indices,
+    decimate,
+    sorted_numeric_values,
+    ZoomDecimator
+)
+from src.core.charts.line_chart import extend_zoom_decimation
+
+
+def _reference_lttb(x, y, n_out):
+    """Plain-Python LTTB over the same buckets as lttb_indices"""
+    n = len(y)
+    edges = [int(e) for e in np.linspace(1, n - 1, n_out - 1)]
+    kept = [0]
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        if i == n_out - 3:
+            avg_x, avg_y = x[n - 1], y[n - 1]
+        else:
+            avg_x = sum(x[end:edges[i + 2]]) / (edges[i + 2] - end)
+            avg_y = sum(y[end:edges[i + 2]]) / (edges[i + 2] - end)
+        a = kept[-1]
+        areas = [
+            abs((x[a] - avg_x) * (y[j] - y[a]) - (x[a] - x[j]) * (avg_y - y[a]))
+            for j in range(start, end)
+        ]
+        kept.append(start + areas.index(max(areas)))
+    kept.append(n - 1)
+    return kept
+
+
+@pytest.fixture
+def series():
+    rng = np.random.default_rng(0)
+    x = np.arange(5_000, dtype=np.float64)
+    y = np.cumsum(rng.normal(size=len(x)))
+    y[1234] = 500.0  # A spike every method must keep
+    return x, y
+
+
+def test_lttb_matches_reference(series):
+    x, y = series
+    indices = lttb_indices(x, y, 300)
+
+    assert indices.tolist() == _reference_lttb(x.tolist(), y.tolist(), 300)
+    assert 1234 in indices
+
+
+@pytest.mark.parametrize("n_out", [0, 2, 10, 11])
+def test_lttb_keeps_short_series(n_out):
+    y = np.arange(10, dtype=np.float64)
+    assert lttb_indices(y, y, n_out).tolist() == list(range(10))
+
+
+def test_minmax_keeps_each_bucket_extremes(series):
+    x, y = series
+    buckets = 64
+    indices = minmax_indices(y, buckets)
+
+    size = -(-len(y) // buckets)
+    groups = pd.Series(y).groupby(np.arange(len(y)) // size)
+    expected = set(groups.idxmin()) | set(groups.idxmax()) | {0, len(y) - 1}
+    assert set(indices.tolist()) == expected
+    assert np.all(np.diff(indices) > 0)
+
+
+def test_minmax_keeps_short_series():
+    y = np.array([3.0, 1.0, 2.0])
+    assert minmax_indices(y, 2).tolist() == [0, 1, 2]
+    assert minmax_indices(y, 0).tolist() == [0, 1, 2]
+
+
+@pytest.mark.parametrize("method", ["lttb", "minmax"])
+def test_decimate_drops_missing_and_keeps_rows(method):
+    n = 3_000
+    df = pd.DataFrame({'t': np.arange(n) * 2.0, 'v': np.sin(np.arange(n) / 50.0)})
+    df.loc[::10, 'v'] = np.nan
+
+    x, y = decimate(df['t'], df['v'], 100, method)
+
+    assert not y.isna().any()
+    assert len(y) <= 2 * 100 + 2
+    # Kept points are real rows, in order
+    pd.testing.assert_series_equal(y, df.loc[y.index, 'v'])
+    pd.testing.assert_series_equal(x, df.loc[x.index, 't'])
+    assert x.index.is_monotonic_increasing
+    assert x.iloc[0] == df['t'].iloc[1] and x.iloc[-1] == df['t'].iloc[-1]
+
+
+def test_decimate_unknown_method():
+    s = pd.Series(np.arange(10.0))
+    with pytest.raises(ValueError):
+        decimate(s, s, 5, "nth")
+
+
+def test_sorted_numeric_values():
+    assert sorted_numeric_values(pd.Series([1, 2, 2, 5])).tolist() == [1.0, 2.0, 2.0, 5.0]
+    assert sorted_numeric_values(pd.Series([2, 1])) is None
+    assert sorted_numeric_values(pd.Series([1.0, np.nan])) is None
+    assert sorted_numeric_values(pd.Series(['a', 'b'])) is None
+
+
+def _attached(x, y, n_out=50):
+    """A ZoomDecimator attached to a line on an Agg canvas"""
+    figure = Figure()
+    FigureCanvasAgg(figure)
+    ax = figure.add_subplot()
+    line, = ax.plot(x, y)
+    decimator = ZoomDecimator(x, y, n_out, "lttb", debounce_ms=10)
+    decimator.attach(ax, line, redraw=lambda: None)
+    return ax, line, decimator
+
+
+def test_zoom_shows_full_resolution_of_visible_range(series):
+    x, y = series
+    ax, line, decimator = _attached(x, y)
+
+    ax.set_xlim(1200, 1240)
+    decimator.redecimate(redraw=False)
+
+    # 41 visible points plus one on each side fit in n_out: all are drawn
+    np.testing.assert_array_equal(line.get_xdata(), x[1199:1242])
+    np.testing.assert_array_equal(line.get_ydata(), y[1199:1242])
+
+    ax.set_xlim(x[0], x[-1])
+    decimator.redecimate(redraw=False)
+    np.testing.assert_array_equal(line.get_xdata(), x[lttb_indices(x, y, 50)])
+    decimator.detach()
+
+
+def test_zoom_extends_with_appended_rows(series):
+    x, y = series
+    ax, line, decimator = _attached(x[:4_000], y[:4_000])
+
+    appended = pd.DataFrame({'t': x[4_000:], 'v': y[4_000:]})
+    assert extend_zoom_decimation(decimator, appended['t'], appended['v'])
+    np.testing.assert_array_equal(decimator.x, x)
+    np.testing.assert_array_equal(decimator.y, y)
+
+    # Rows that go back in X can no longer be zoomed by binary search
+    assert not extend_zoom_decimation(decimator, pd.Series([0.0]), pd.Series([1.0]))
+    decimator.cancel()
+    decimator.detach()
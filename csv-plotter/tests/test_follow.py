@@ -0,0 +1,224 @@
+"""
+Follow Tests
+Appended rows, partial lines, truncation and growable frames
+"""
+import os
+
+import matplotlib
+matplotlib.use("Agg")
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from src.core.charts import line_chart
+from src.core.follow import FileFollower, FileReplacedError, GrowableFrame
+from src.core.row_index import row_offset
+from src.gui.data_grid import DataGrid
+
+
+def _append(path, text):
+    with open(path, 'a', newline='') as handle:
+        handle.write(text)
+
+
+def _follow(path, rows=None):
+    """Follower resumed after the first rows (all rows by default)"""
+    df = pd.read_csv(path)
+    rows = len(df) if rows is None else rows
+    return FileFollower.resume(path, rows, df.columns, ['name']), df
+
+
+def test_reads_only_complete_appended_rows(write_file):
+    path = write_file('log.csv', 'id,name\n1,a\n2,b\n')
+    follower, _ = _follow(path)
+
+    assert follower.read_appended().empty
+
+    _append(path, '3,c\n4,d')  # The last row is still being written
+    appended = follower.read_appended()
+    pd.testing.assert_frame_equal(appended, pd.DataFrame({'id': [3], 'name': ['c']}),
+                                  check_dtype=False)
+
+    _append(path, 'x\n')
+    appended = follower.read_appended()
+    assert appended.to_dict('list') == {'id': [4], 'name': ['dx']}
+    assert follower.offset == os.path.getsize(path)
+
+
+def test_appended_rows_equal_a_full_parse(write_file):
+    path = write_file('log.csv', 'id,name\n1,a\n')
+    follower, df = _follow(path)
+    parts = [df]
+    for i in range(2, 50):
+        _append(path, f'{i},n{i}\n')
+        if i % 7 == 0:
+            parts.append(follower.read_appended())
+    parts.append(follower.read_appended())
+
+    combined = pd.concat(parts, ignore_index=True)
+    expected = pd.read_csv(path, dtype={'name': object})
+    pd.testing.assert_frame_equal(combined, expected, check_dtype=False)
+
+
+def test_max_bytes_reads_in_steps(write_file):
+    path = write_file('log.csv', 'id,name\n')
+    follower, _ = _follow(path)
+    _append(path, ''.join(f'{i},n{i}\n' for i in range(100)))
+
+    ids = []
+    while True:
+        appended = follower.read_appended(max_bytes=64)
+        if appended.empty:
+            break
+        ids += appended['id'].tolist()
+    assert ids == list(range(100))
+
+
+def test_quoted_newline_waits_for_the_rest_of_its_row(write_file):
+    path = write_file('log.csv', 'id,name\n1,a\n')
+    follower, _ = _follow(path)
+
+    _append(path, '2,"first\n')
+    assert follower.read_appended().empty
+
+    _append(path, 'second"\n3,c\n')
+    appended = follower.read_appended()
+    assert appended.to_dict('list') == {'id': [2, 3], 'name': ['first\nsecond', 'c']}
+
+
+@pytest.mark.parametrize("text", [
+    'id,name\n1,a\n2,b\n3,c\n',
+    'id,name\n1,"a\nb"\n2,"c ""q""\nd"\n3,e\n',
+    'id,name\n\n1,a\n\n\n2,b\n3,c\n',
+    'id,name\r\n\r\n1,a\r\n2,"b\r\nc"\r\n3,c\r\n',
+    '\nid,name\n1,a\n2,b\n3,c\n',
+])
+def test_resume_after_any_row_matches_pandas(write_file, text):
+    path = write_file('log.csv', text)
+    expected = pd.read_csv(path)
+
+    for rows in range(len(expected)):
+        follower, _ = _follow(path, rows)
+        appended = follower.read_appended()
+        pd.testing.assert_frame_equal(
+            appended, expected.iloc[rows:].reset_index(drop=True), check_dtype=False
+        )
+
+
+def test_row_offset(write_file):
+    path = write_file('log.csv', 'id,name\n1,"a\nb"\n\n2,c')
+
+    assert row_offset(path, 0) == 0
+    assert row_offset(path, 1) == len('id,name\n')
+    assert row_offset(path, 2) == len('id,name\n1,"a\nb"\n')
+    assert row_offset(path, 3) is None  # The last row has no newline yet
+    assert row_offset(write_file('empty.csv', ''), 1) is None
+
+
+def test_resume_past_the_end_raises(write_file):
+    path = write_file('log.csv', 'id,name\n1,a\n')
+    with pytest.raises(FileReplacedError):
+        FileFollower.resume(path, 5, ['id', 'name'])
+
+
+def test_truncated_file_raises(write_file):
+    path = write_file('log.csv', 'id,name\n1,a\n2,b\n')
+    follower, _ = _follow(path)
+
+    with open(path, 'w') as handle:
+        handle.write('id,name\n')
+    with pytest.raises(FileReplacedError):
+        follower.read_appended()
+
+
+def test_replaced_file_raises(write_file):
+    path = write_file('log.csv', 'id,name\n1,a\n')
+    follower, _ = _follow(path)
+
+    os.rename(path, path + '.1')
+    assert follower.read_appended().empty  # Rotated away, nothing new yet
+
+    write_file('log.csv', 'id,name\n1,a\n2,b\n')
+    with pytest.raises(FileReplacedError):
+        follower.read_appended()
+
+
+def test_growable_frame_matches_concat():
+    df = pd.DataFrame({
+        'n': np.array([1, 2], dtype=np.int8),
+        'x': [0.5, 1.5],
+        'c': pd.Categorical(['a', 'b']),
+        's': ['p', 'q'],
+    })
+    frame = GrowableFrame(df, min_capacity=2)
+    parts = [
+        pd.DataFrame({'n': [3], 'x': [2.5], 'c': ['a'], 's': ['r']}),
+        pd.DataFrame({'n': [1000, 4], 'x': [np.nan, 3.0], 'c': ['z', None], 's': ['t', None]}),
+    ]
+    for part in parts:
+        frame.append(part)
+
+    result = frame.frame()
+    expected = pd.concat([df.astype({'c': object})] + parts, ignore_index=True)
+    assert len(frame) == 5
+    assert result['n'].tolist() == expected['n'].tolist()
+    assert result['n'].dtype.kind == 'i'  # Widened, still integer
+    np.testing.assert_array_equal(result['x'].to_numpy(), expected['x'].to_numpy())
+    for col, values in [('c', ['a', 'b', 'a', 'z']), ('s', ['p', 'q', 'r', 't'])]:
+        assert result[col].iloc[:4].tolist() == values
+        assert pd.isna(result[col].iloc[4])
+
+
+@pytest.mark.parametrize("ascending", [True, False])
+@pytest.mark.parametrize("kind", ["float", "text", "category"])
+def test_grid_merges_appended_rows_into_sort_order(ascending, kind):
+    rng = np.random.default_rng(0)
+    values = {
+        "float": np.where(rng.random(60) < 0.2, np.nan, rng.integers(0, 5, 60).astype(float)),
+        "text": rng.choice(np.array(['a', 'b', 'c', None], dtype=object), 60),
+        "category": rng.choice(np.array(['x', 'y', None], dtype=object), 60),
+    }[kind]
+    full = pd.DataFrame({'v': values})
+    if kind == "category":
+        full['v'] = pd.Categorical(values, categories=['y', 'x'])
+
+    grid = object.__new__(DataGrid)  # Only the sorting state, no widgets
+    grid.df, grid._sort_cache = full.iloc[:40], {}
+    order = grid.sort_order('v', ascending)
+
+    grid.df, grid._sort_cache = full, {}
+    merged = grid._merge_appended(order, 40, 'v', ascending)
+
+    np.testing.assert_array_equal(merged, grid.sort_order('v', ascending))
+
+
+def test_line_decimates_only_appended_rows(monkeypatch):
+    n = 120_000
+    df = pd.DataFrame({'t': np.arange(n, dtype=float), 'v': np.sin(np.arange(n) / 300.0)})
+    figure = Figure()
+    FigureCanvasAgg(figure)
+    ax = figure.add_subplot()
+    line, decimated = line_chart.plot_line_chart(ax, df.iloc[:100_000], 't', 'v')
+    assert decimated
+
+    sizes = []
+    decimate = line_chart.decimate
+    monkeypatch.setattr(
+        line_chart, 'decimate',
+        lambda x, y, *args: sizes.append(len(x)) or decimate(x, y, *args)
+    )
+    for start in range(100_000, n, 4_000):
+        line_chart.extend_line_chart(ax, line, df.iloc[:start + 4_000], 't', 'v', start)
+
+    # Each tick decimates its own rows; the drawn points are only compacted
+    width = line_chart.plot_width_px(ax)
+    assert all(size == 4_000 or size <= 2 * width + 3 for size in sizes)
+    drawn = np.asarray(line.get_xdata(), dtype=float)
+    assert len(drawn) <= 2 * width
+    assert drawn[-1] == n - 1
+    assert np.all(np.diff(drawn) > 0)
+    assert f"{n:,} →" in ax.get_title()
@@ -0,0 +1,151 @@
+"""
+Parallel Load Tests
+Byte-range splitting, the quoted-newline fallback and the pyarrow engine
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.core import csv_handler
+from src.core.csv_handler import (
+    load_csv,
+    load_csv_parallel,
+    SplitRowError,
+    _byte_ranges,
+    _parse_byte_range
+)
+from src.core.dtype_optimizer import pyarrow_available
+
+
+ENGINES = ['processes'] + (['pyarrow'] if pyarrow_available() else [])
+
+
+@pytest.fixture(autouse=True)
+def two_workers(monkeypatch):
+    """Use a process pool even on a single-core machine"""
+    monkeypatch.setitem(csv_handler.LOADER_SETTINGS, 'parallel_workers', 2)
+
+
+def _mixed_csv(rows, seed=0):
+    """CSV text with integer, float, text and missing values"""
+    rng = np.random.default_rng(seed)
+    frame = pd.DataFrame({
+        'id': np.arange(rows),
+        'value': np.round(rng.normal(size=rows), 3),
+        'city': rng.choice(['Oslo', 'Lima', 'Pune'], size=rows),
+        'note': [f"n{i}" for i in range(rows)],
+    })
+    frame.loc[::11, 'value'] = np.nan
+    return frame.to_csv(index=False)
+
+
+def test_byte_ranges_cover_data_on_line_starts(write_file):
+    text = _mixed_csv(500)
+    path = write_file('ranges.csv', text)
+    data = text.encode()
+
+    ranges = _byte_ranges(path, 7)
+
+    assert ranges[0][0] == data.index(b'\n') + 1
+    assert ranges[-1][1] == len(data)
+    for (_, end), (start, _) in zip(ranges, ranges[1:]):
+        assert end == start
+        assert data[start - 1:start] == b'\n'
+
+
+@pytest.mark.parametrize("text", ['a,b\n', 'a,b'])
+def test_byte_ranges_of_header_only_file(write_file, text):
+    assert _byte_ranges(write_file('header.csv', text), 4) == []
+
+
+def test_byte_ranges_more_parts_than_lines(write_file):
+    path = write_file('short.csv', 'a,b\n1,2\n3,4')
+    ranges = _byte_ranges(path, 16)
+
+    names = ['a', 'b']
+    parts = [_parse_byte_range(path, start, end, names) for start, end in ranges]
+    pd.testing.assert_frame_equal(pd.concat(parts, ignore_index=True), pd.read_csv(path))
+
+
+def test_range_inside_quoted_field_is_refused(write_file):
+    text = 'a,b\n1,"x\ny"\n2,z\n'
+    path = write_file('quoted.csv', text)
+    split = text.index('\ny"') + 1  # Just after the quoted newline
+
+    with pytest.raises(SplitRowError):
+        _parse_byte_range(path, 4, split, ['a', 'b'])
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+@pytest.mark.parametrize("trailing_newline", [True, False])
+def test_parallel_load_matches_read_csv(write_file, engine, trailing_newline):
+    text = _mixed_csv(3_000)
+    if not trailing_newline:
+        text = text.rstrip('\n')
+    path = write_file('mixed.csv', text)
+
+    df = load_csv_parallel(path, optimize=False, engine=engine)
+
+    pd.testing.assert_frame_equal(df, pd.read_csv(path))
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_parallel_load_matches_optimized_load(write_file, engine):
+    path = write_file('mixed.csv', _mixed_csv(3_000, seed=1))
+
+    df = load_csv_parallel(path, optimize=True, engine=engine)
+
+    pd.testing.assert_frame_equal(df, load_csv(path, optimize=True))
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_quoted_newlines_fall_back_to_single_parser(write_file, monkeypatch, engine):
+    # Larger than one 1 MB pyarrow block; with most newlines inside quoted
+    # fields, the block split falls inside a field
+    field = '\n'.join(f'part {j}' for j in range(20))
+    rows = ['id,text']
+    rows += [f'{i},"{field}, with ""quotes"""' for i in range(10_000)]
+    path = write_file('multiline.csv', '\n'.join(rows) + '\n')
+    monkeypatch.setitem(csv_handler.LOADER_SETTINGS, 'arrow_block_mb', 1)
+
+    fallbacks = []
+    chunked = csv_handler.load_csv_chunked
+    monkeypatch.setattr(
+        csv_handler, 'load_csv_chunked',
+        lambda *args, **kwargs: fallbacks.append(args) or chunked(*args, **kwargs)
+    )
+    df = load_csv_parallel(path, optimize=False, engine=engine)
+
+    expected = pd.read_csv(path)
+    assert len(expected) == 10_000
+    assert fallbacks
+    pd.testing.assert_frame_equal(df, expected)
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_late_values_of_another_type(write_file, engine):
+    # Numbers until the last rows: text in one column, a float in another
+    rows = ['code,count'] + [f'{i},{i}' for i in range(4_000)] + ['X1,2.5']
+    path = write_file('late.csv', '\n'.join(rows) + '\n')
+
+    df = load_csv_parallel(path, optimize=False, engine=engine)
+
+    pd.testing.assert_frame_equal(df, pd.read_csv(path))
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_header_only_file(write_file, engine):
+    path = write_file('empty.csv', 'a,b,c\n')
+
+    df = load_csv_parallel(path, optimize=False, engine=engine)
+
+    pd.testing.assert_frame_equal(df, pd.read_csv(path))
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_usecols(write_file, engine):
+    path = write_file('mixed.csv', _mixed_csv(1_000))
+
+    df = load_csv_parallel(path, optimize=False, usecols=['note', 'value'], engine=engine)
+
+    pd.testing.assert_frame_equal(df, pd.read_csv(path, usecols=['note', 'value']))
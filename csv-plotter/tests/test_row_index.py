@@ -0,0 +1,106 @@
+"""
+Row Index Tests
+Row offsets, row range reads and saved indexes
+"""
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.core import row_index
+from src.core.row_index import RowIndex, RowRangeReader
+
+
+def _csv(rows, trailing_newline=True):
+    text = '\n'.join(['id,name'] + [f'{i},row{i}' for i in range(rows)])
+    return text + '\n' if trailing_newline else text
+
+
+def _row_starts(text):
+    """Byte offset of every data row, counted in Python"""
+    data = text.encode()
+    starts = [i + 1 for i, byte in enumerate(data) if byte == ord('\n')]
+    return [start for start in starts if start < len(data)]
+
+
+@pytest.mark.parametrize("rows", [0, 1, 9, 10, 11, 1_000])
+@pytest.mark.parametrize("trailing_newline", [True, False])
+@pytest.mark.parametrize("scan_block", [7, 4096])
+def test_offsets_match_row_starts(write_file, monkeypatch, rows, trailing_newline, scan_block):
+    # A tiny scan block makes rows straddle block boundaries
+    monkeypatch.setattr(row_index, 'SCAN_BLOCK_BYTES', scan_block)
+    text = _csv(rows, trailing_newline)
+    path = write_file('rows.csv', text)
+
+    index = RowIndex.build(path, stride=10)
+
+    assert index.row_count == len(pd.read_csv(path)) == rows
+    assert index.offsets.dtype == np.int64
+    assert index.offsets.tolist() == _row_starts(text)[::10]
+
+
+def test_empty_file(write_file):
+    index = RowIndex.build(write_file('empty.csv', ''), stride=10)
+    assert index.row_count == 0
+    assert len(index.offsets) == 0
+
+
+def test_cancelled_build(write_file):
+    class Cancelled:
+        def is_set(self):
+            return True
+
+    path = write_file('rows.csv', _csv(10))
+    assert RowIndex.build(path, stride=4, cancel_event=Cancelled()) is None
+
+
+@pytest.mark.parametrize("trailing_newline", [True, False])
+def test_read_rows_match_pandas(write_file, trailing_newline):
+    path = write_file('rows.csv', _csv(1_003, trailing_newline))
+    expected = pd.read_csv(path)
+    reader = RowRangeReader(RowIndex.build(path, stride=64), max_cached_blocks=2)
+
+    assert len(reader) == len(expected)
+    assert list(reader.columns) == list(expected.columns)
+    for start, stop in [(0, 5), (60, 70), (0, 1_003), (1_000, 1_003), (-3, 2), (990, 2_000)]:
+        rows = reader.read_rows(start, stop)
+        pd.testing.assert_frame_equal(rows, expected.iloc[max(start, 0):stop])
+
+    empty = reader.read_rows(5, 5)
+    assert empty.empty and list(empty.columns) == list(expected.columns)
+
+    assert len(reader._blocks) == 2
+
+
+def test_open_reuses_saved_index(write_file, tmp_path):
+    path = write_file('rows.csv', _csv(100))
+    index_dir = str(tmp_path / 'indexes')
+
+    first = RowIndex.open(path, stride=10, index_dir=index_dir)
+    saved = os.listdir(index_dir)
+    second = RowIndex.open(path, stride=10, index_dir=index_dir)
+
+    assert len(saved) == 1
+    assert second.offsets.tolist() == first.offsets.tolist()
+    assert second.row_count == first.row_count == 100
+
+
+def test_new_version_deletes_only_indexes_of_the_same_file(write_file, tmp_path):
+    path = write_file('rows.csv', _csv(100))
+    other = write_file('other.csv', _csv(50))
+    index_dir = str(tmp_path / 'indexes')
+
+    RowIndex.open(path, stride=10, index_dir=index_dir)
+    RowIndex.open(other, stride=10, index_dir=index_dir)
+    other_index = row_index._index_path(other, 10, index_dir)
+
+    with open(path, 'a') as handle:
+        handle.write('100,row100\n')
+    index = RowIndex.open(path, stride=10, index_dir=index_dir)
+
+    assert index.row_count == 101
+    assert sorted(os.listdir(index_dir)) == sorted([
+        os.path.basename(row_index._index_path(path, 10, index_dir)),
+        os.path.basename(other_index),
+    ])
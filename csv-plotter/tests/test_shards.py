@@ -0,0 +1,151 @@
+"""
+Shard Tests
+Source expansion, dtype reconciliation and combined shards
+"""
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.core.csv_handler import load_csv
+from src.core.shards import (
+    combine_shards,
+    expand_sources,
+    load_shards,
+    reconcile_dtypes,
+    shard_labels
+)
+
+
+HEADER = 'n,x,city,code\n'
+SHARDS = [
+    '1,1,Oslo,1\n2,2,Lima,2\n',
+    '300,2.5,Pune,A7\n',
+    '',
+    '4,,Oslo,3\n',
+]
+
+
+@pytest.fixture
+def shard_files(write_file):
+    return [write_file(f'day{i}.csv', HEADER + rows) for i, rows in enumerate(SHARDS)]
+
+
+def _merged(write_file):
+    """All shards' rows parsed as one file"""
+    return pd.read_csv(write_file('merged.csv', HEADER + ''.join(SHARDS)))
+
+
+def test_combined_shards_match_one_parse(write_file, shard_files):
+    frames = load_shards(shard_files, pd.read_csv, workers=2)
+
+    df = combine_shards(frames, shard_files)
+
+    expected = _merged(write_file)
+    pd.testing.assert_frame_equal(df[expected.columns], expected)
+    assert df.attrs['source_files'] == shard_files
+
+
+def test_optimized_shards_are_reconciled(write_file, shard_files):
+    frames = load_shards(shard_files, lambda path: load_csv(path, optimize=True))
+
+    df = combine_shards(frames, shard_files)
+
+    # The header-only shard does not turn the numeric columns into objects
+    assert df['n'].dtype == np.uint16
+    assert df['x'].dtype.kind == 'f'
+    assert not isinstance(df['code'].dtype, np.dtype)  # Text, as one parse makes it
+    expected = _merged(write_file)
+    pd.testing.assert_frame_equal(df[expected.columns], expected, check_dtype=False)
+
+
+def test_source_column(shard_files):
+    frames = [pd.read_csv(path) for path in shard_files]
+
+    df = combine_shards(frames, shard_files)
+
+    assert isinstance(df['source_file'].dtype, pd.CategoricalDtype)
+    assert df['source_file'].tolist() == ['day0.csv', 'day0.csv', 'day1.csv', 'day3.csv']
+    assert list(df['source_file'].cat.categories) == [f'day{i}.csv' for i in range(4)]
+
+
+def test_source_column_name_does_not_replace_data(write_file):
+    paths = [write_file(f'{i}.csv', f'source_file\nrow{i}\n') for i in range(2)]
+    df = combine_shards([pd.read_csv(path) for path in paths], paths)
+
+    assert df['source_file'].tolist() == ['row0', 'row1']
+    assert df['source_file_'].tolist() == ['0.csv', '1.csv']
+
+
+@pytest.mark.parametrize("dtypes, missing, expected", [
+    (['int8', 'int16'], False, np.int16),
+    (['uint8', 'float32'], False, np.float32),
+    (['int64', 'int64'], True, np.float64),
+    (['int8', 'str'], False, 'str'),
+])
+def test_reconciled_dtype(dtypes, missing, expected):
+    frames = [pd.DataFrame({'v': pd.Series([1], dtype=dtype)}) for dtype in dtypes]
+    if missing:
+        frames.append(pd.DataFrame({'other': [0]}))
+
+    frames = reconcile_dtypes(frames)
+
+    for frame in frames:
+        assert frame['v'].dtype == expected
+    combined = pd.concat(frames, ignore_index=True)
+    assert combined['v'].dtype == expected
+    assert combined['v'].isna().sum() == int(missing)
+
+
+def test_categories_are_unioned():
+    frames = [
+        pd.DataFrame({'c': pd.Categorical(['a', 'b'])}),
+        pd.DataFrame({'c': pd.Categorical(['c', 'a'])}),
+    ]
+
+    combined = pd.concat(reconcile_dtypes(frames), ignore_index=True)
+
+    assert isinstance(combined['c'].dtype, pd.CategoricalDtype)
+    assert sorted(combined['c'].cat.categories) == ['a', 'b', 'c']
+    assert combined['c'].tolist() == ['a', 'b', 'c', 'a']
+
+
+def test_missing_column_is_filled_and_ordered():
+    frames = [pd.DataFrame({'a': [1], 'b': ['x']}), pd.DataFrame({'b': ['y']})]
+
+    combined = pd.concat(reconcile_dtypes(frames), ignore_index=True)
+
+    assert list(combined.columns) == ['a', 'b']
+    assert combined['b'].tolist() == ['x', 'y']
+    assert combined['a'].iloc[0] == 1 and pd.isna(combined['a'].iloc[1])
+
+
+def test_expand_sources(tmp_path):
+    for name in ['b.csv', 'a.csv', 'notes.txt', os.path.join('sub', 'c.csv')]:
+        (tmp_path / name).parent.mkdir(exist_ok=True)
+        (tmp_path / name).write_text('v\n1\n')
+    root = str(tmp_path)
+
+    assert expand_sources([root]) == [os.path.join(root, 'a.csv'), os.path.join(root, 'b.csv')]
+    assert expand_sources([os.path.join(root, '**', '*.csv')]) == [
+        os.path.join(root, name) for name in ['a.csv', 'b.csv', os.path.join('sub', 'c.csv')]
+    ]
+    single = os.path.join(root, 'b.csv')
+    assert expand_sources([single, root]) == [single, os.path.join(root, 'a.csv')]
+
+
+def test_shard_labels(tmp_path):
+    paths = [str(tmp_path / 'a.csv'), str(tmp_path / 'sub' / 'b.csv')]
+    assert shard_labels(paths) == ['a.csv', os.path.join('sub', 'b.csv')]
+    assert shard_labels(paths[1:]) == ['b.csv']
+
+
+def test_failed_shard_names_its_file(shard_files):
+    def load(path):
+        if path == shard_files[1]:
+            raise OSError("unreadable")
+        return pd.read_csv(path)
+
+    with pytest.raises(ValueError, match="day1.csv: unreadable"):
+        load_shards(shard_files, load)
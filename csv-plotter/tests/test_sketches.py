@@ -0,0 +1,192 @@
+"""
+Sketch Tests
+Moments, KLL and HyperLogLog sketches against exact pandas results
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.core.csv_handler import load_csv_chunked
+from src.core.sketches import MomentsSketch, KLLSketch, HyperLogLog, DistinctSketch
+from src.core.stats import StatisticsAccumulator, compute_statistics
+
+
+def _rank_distance(values, estimate, q):
+    """How far (as a fraction of the values) an estimate is from quantile q"""
+    ordered = np.sort(values)
+    low = np.searchsorted(ordered, estimate, side='left')
+    high = np.searchsorted(ordered, estimate, side='right')
+    target = q * len(ordered)
+    if low <= target <= high:
+        return 0.0
+    return min(abs(low - target), abs(high - target)) / len(ordered)
+
+
+def test_moments_match_pandas_across_uneven_chunks():
+    rng = np.random.default_rng(1)
+    data = rng.normal(50, 10, size=(1003, 3))
+    data[rng.random(data.shape) < 0.1] = np.nan
+    data[:, 2] = np.nan  # A column with no values at all
+    df = pd.DataFrame(data, columns=['a', 'b', 'c'])
+
+    sketch = MomentsSketch(3)
+    for start, stop in [(0, 1), (1, 500), (500, 500), (500, 1003)]:
+        sketch.update(data[start:stop])
+
+    np.testing.assert_array_equal(sketch.count, df.count().to_numpy())
+    np.testing.assert_allclose(sketch.means(), df.mean().to_numpy(), equal_nan=True)
+    np.testing.assert_allclose(sketch.stds(), df.std().to_numpy(), equal_nan=True)
+    np.testing.assert_array_equal(sketch.min, df.min().to_numpy())
+    np.testing.assert_array_equal(sketch.max, df.max().to_numpy())
+
+
+def test_moments_merge_equals_single_pass():
+    rng = np.random.default_rng(2)
+    data = rng.exponential(3, size=(400, 2))
+    left, right, whole = MomentsSketch(2), MomentsSketch(2), MomentsSketch(2)
+    left.update(data[:123])
+    right.update(data[123:])
+    whole.update(data)
+    left.merge(right)
+
+    np.testing.assert_allclose(left.means(), whole.means())
+    np.testing.assert_allclose(left.stds(), whole.stds())
+    np.testing.assert_array_equal(left.min, whole.min)
+    np.testing.assert_array_equal(left.max, whole.max)
+
+
+def test_kll_is_exact_below_capacity():
+    values = np.array([5.0, 1.0, 4.0, np.nan, 2.0, 3.0])
+    sketch = KLLSketch(k=200, seed=0)
+    sketch.update(values)
+
+    assert sketch.count == 5
+    assert sketch.quantile(0.5) == pd.Series(values).median()
+    assert sketch.quantile(0.0) == 1.0
+    assert sketch.quantile(1.0) == 5.0
+
+
+def test_kll_empty_and_single_value():
+    sketch = KLLSketch(k=200, seed=0)
+    assert np.isnan(sketch.quantile(0.5))
+
+    sketch.update(np.array([7.5]))
+    assert sketch.quantile(0.5) == 7.5
+
+
+@pytest.mark.parametrize("q", [0.1, 0.5, 0.9])
+def test_kll_quantiles_within_rank_error(q):
+    rng = np.random.default_rng(3)
+    values = rng.lognormal(size=200_000)
+    sketch = KLLSketch(k=200, seed=0)
+    for chunk in np.array_split(values, 37):
+        sketch.update(chunk)
+
+    assert sketch.count == len(values)
+    assert _rank_distance(values, sketch.quantile(q), q) <= sketch.rank_error()
+
+
+def test_kll_merge_within_rank_error():
+    rng = np.random.default_rng(4)
+    values = rng.normal(size=100_000)
+    parts = [KLLSketch(k=200, seed=i) for i in range(4)]
+    for part, chunk in zip(parts, np.array_split(values, 4)):
+        part.update(chunk)
+    merged = parts[0]
+    for part in parts[1:]:
+        merged.merge(part)
+
+    assert merged.count == len(values)
+    assert _rank_distance(values, merged.quantile(0.5), 0.5) <= merged.rank_error()
+
+
+@pytest.mark.parametrize("distinct", [1, 100, 5_000, 200_000])
+def test_hyperloglog_within_error(distinct):
+    values = pd.Series(np.arange(distinct)).sample(frac=1.0, random_state=0)
+    values = pd.concat([values, values.iloc[:distinct // 2]])  # Repeats do not count
+    sketch = HyperLogLog(precision=12)
+    sketch.update(values)
+
+    exact = values.nunique()
+    assert abs(sketch.estimate() - exact) <= 4 * sketch.relative_error() * exact
+
+
+def test_hyperloglog_merge_equals_union():
+    left_values = pd.Series([f"user-{i}" for i in range(0, 30_000)])
+    right_values = pd.Series([f"user-{i}" for i in range(20_000, 50_000)])
+    left, right, union = HyperLogLog(), HyperLogLog(), HyperLogLog()
+    left.update(left_values)
+    right.update(right_values)
+    union.update(pd.concat([left_values, right_values]))
+    left.merge(right)
+
+    np.testing.assert_array_equal(left.registers, union.registers)
+    assert left.estimate() == union.estimate()
+
+
+def test_hyperloglog_ignores_missing_values():
+    sketch = HyperLogLog()
+    sketch.update(pd.Series([None, np.nan], dtype=object))
+    assert sketch.estimate() == 0
+
+
+def test_distinct_sketch_exact_until_limit():
+    sketch = DistinctSketch(limit=3)
+    sketch.update(pd.Series(['b', 'a', None, 'b']))
+    assert sketch.is_exact()
+    assert sketch.count() == 2
+    assert list(sketch.values) == ['b', 'a']
+
+    other = DistinctSketch(limit=3)
+    other.update(pd.Series(['c', 'd']))
+    sketch.merge(other)
+    assert not sketch.is_exact()
+    assert sketch.count() == 4
+
+
+def test_accumulator_from_streamed_file_matches_pandas(write_file):
+    rng = np.random.default_rng(5)
+    n = 2_500
+    frame = pd.DataFrame({
+        'value': rng.normal(size=n),
+        'count': rng.integers(0, 1_000, size=n),
+        'label': rng.choice(['x', 'y', 'z'], size=n),
+        'id': [f"id-{i}" for i in range(n)],
+    })
+    frame.loc[::7, 'value'] = np.nan
+    path = write_file('stream.csv', frame.to_csv(index=False))
+
+    accumulator = StatisticsAccumulator(k=200)
+    df = load_csv_chunked(path, chunk_size=300, optimize=False, chunk_callback=accumulator.update)
+    expected = pd.read_csv(path)
+    pd.testing.assert_frame_equal(df, expected)
+    assert accumulator.rows == n
+
+    stats = compute_statistics(df, approximate=True, accumulator=accumulator)
+    numeric = stats['numeric']
+    for col in ['value', 'count']:
+        assert numeric.loc[col, 'count'] == expected[col].count()
+        assert numeric.loc[col, 'missing'] == expected[col].isna().sum()
+        assert numeric.loc[col, 'min'] == expected[col].min()
+        assert numeric.loc[col, 'max'] == expected[col].max()
+        assert numeric.loc[col, 'mean'] == pytest.approx(expected[col].mean())
+        assert numeric.loc[col, 'std'] == pytest.approx(expected[col].std())
+        values = expected[col].dropna().to_numpy(dtype=float)
+        assert _rank_distance(values, numeric.loc[col, 'median'], 0.5) <= stats['median_error']
+
+    text = stats['text']
+    assert text.loc['label', 'unique'] == 3
+    assert sorted(stats['values']['label']) == ['x', 'y', 'z']
+    assert 'id' in stats['estimated_unique']
+    assert abs(text.loc['id', 'unique'] - n) <= 4 * stats['unique_error'] * n
+
+
+def test_accumulator_on_header_only_file(write_file):
+    path = write_file('empty.csv', 'a,b\n')
+    df = pd.read_csv(path)
+    approximate = compute_statistics(df, approximate=True)
+    exact = compute_statistics(df)
+
+    assert approximate['rows'] == 0
+    pd.testing.assert_frame_equal(approximate['text'], exact['text'])
+    assert approximate['values'] == {'a': [], 'b': []}